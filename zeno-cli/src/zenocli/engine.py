@@ -25,6 +25,51 @@ def status() -> None:
     # TODO: Fetch and display real-time engine metrics
 
 
+@app.command()
+def warmup(
+    dims: list[int] = typer.Option([1, 2, 3], "--dim", "-d", help="Dimensions to precompile (repeatable)"),
+    clear: bool = typer.Option(False, "--clear", help="Drop cached kernels before compiling"),
+) -> None:
+    """
+    Precompile engine kernels into Numba's on-disk cache.
+    """
+    try:
+        from zenoengine.engine import warmup as engine_warmup
+    except ImportError:
+        typer.echo("❌ zeno-engine-python is not installed in this environment")
+        raise typer.Exit(code=1)
+
+    if clear:
+        typer.echo(f"🧹 Removed {engine_warmup.clear_cache()} cached kernel files")
+    typer.echo(f"🔥 Warming kernels for {', '.join(f'{d}D' for d in dims)}")
+    report = engine_warmup.warmup(dims, verbose=True)
+    typer.echo(f"✅ Kernels ready in {report}")
+
+
+@app.command()
+def tune(
+    grids: list[int] = typer.Option([64, 128, 256], "--grid", "-g", help="Grid sizes to tune (repeatable)"),
+    dim: int = typer.Option(2, "--dim", "-d", help="Spatial dimension"),
+    operator: str = typer.Option("pgns", "--operator", "-o", help="pgns, rehte or classical"),
+    db: str = typer.Option(None, "--db", help="Tuning database path (default ~/.cache/zeno)"),
+) -> None:
+    """
+    Benchmark kernel variants on this host and store the winners for engine.kernel = "auto".
+    """
+    try:
+        from zenoengine.engine import autotune
+    except ImportError:
+        typer.echo("❌ zeno-engine-python is not installed in this environment")
+        raise typer.Exit(code=1)
+
+    store = autotune.TuningDB(db)
+    for n in grids:
+        result = autotune.autotune(operator, (n,) * dim, verbose=True)
+        store.put(result)
+        typer.echo(f"🎯 {result.key}: {result.kernel}, tile={result.tile}, {result.threads} threads")
+    typer.echo(f"✅ Saved to {store.path}")
+
+
 @app.command()
 def kill() -> None:
     """
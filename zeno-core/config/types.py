@@ -1,6 +1,6 @@
 from __future__ import annotations
 from pydantic import BaseModel, Field
-from typing import Literal, Tuple, Any
+from typing import Literal, Optional, Tuple, Any
 
 # -----------------------------
 # 🔢 Enum-like type literals
@@ -24,10 +24,13 @@ class DefaultsConfig(BaseModel):
     grid_size: Tuple[int, int] = Field(default=(64, 64))
     field: str = Field(default="rti")
     operator: str = Field(default="pgns")
+    lambda_: float = Field(default=0.4)  # Torsion strength λ
+    kappa: float = Field(default=0.9)  # Nonlinearity strength κ
+    beta: float = Field(default=0.3)  # Entropy feedback strength β
     simulation_steps: int = Field(default=1000)
     output_format: str = Field(default="npy")
     mode: SimMode = Field(default="symbolic")
-    time_step: float = Field(default=1.0)
+    time_step: float = Field(default=1e-5)  # Δt per step; adaptive runs end at simulation_steps·time_step
     scene: str = Field(default="default")
 
 class GUIConfig(BaseModel):
@@ -39,6 +42,32 @@ class EngineConfig(BaseModel):
     num_threads: Any = Field(default="auto")  # Can be int or "auto"
     use_numba: bool = Field(default=True)
     backend: SimMode = Field(default="symbolic")
+    halo: int = Field(default=0)  # Ghost-cell layers per side
+    boundary: str = Field(default="periodic")  # periodic, reflect or fixed
+    tile_shape: Optional[Tuple[int, int, int]] = Field(default=None)  # 3D cache block (i, j, k)
+    time_block: int = Field(default=1)  # 3D steps per grid sweep
+    workers: int = Field(default=1)  # Shared-memory slab worker processes
+    numa: bool = Field(default=False)  # NUMA-pinned workers with first-touch slabs
+    ranks: list[str] = Field(default_factory=list)  # "host:port" per rank for TCP multi-node runs
+    rank: int = Field(default=0)  # This process's rank ($ZENO_RANK overrides)
+    ensemble: int = Field(default=0)  # Members stepped together in one kernel launch
+    seed: Optional[int] = Field(default=None)  # Scene noise seed; member b uses seed + b
+    precision: str = Field(default="fp64")  # fp64 or fp32 field storage; reductions stay float64
+    field_type: str = Field(default="complex")  # complex or real field storage
+    layout: str = Field(default="aos")  # aos (interleaved complex), soa (real/imag planes) or bricks (block-sparse)
+    brick_size: int = Field(default=0)  # Brick edge for layout "bricks"; 0 = per-dimension default
+    brick_threshold: float = Field(default=1e-6)  # Bricks with max |ψ| at or below this are not stored
+    kernel: str = Field(default="fused")  # fused, gather, reference or "auto" (autotuned per host)
+    tuning_db: Optional[str] = Field(default=None)  # Autotuning cache path
+    incremental: bool = Field(default=False)  # Recompute ℛ/𝒯 only where quantized indices changed
+    amr_levels: int = Field(default=1)  # 2D PGNS refinement levels (ratio 2); 1 = uniform grid
+    amr_patch: int = Field(default=16)  # Patch edge on every level
+    amr_threshold: int = Field(default=2)  # Quantized-index jump that tags a cell for refinement
+    amr_interval: int = Field(default=10)  # Steps between regrids
+    symmetry: bool = Field(default=False)  # Simulate only the fundamental domain of symmetric scenes
+    integrator: str = Field(default="euler")  # euler, rk2, rk4 or rk23 (adaptive)
+    rtol: float = Field(default=1e-6)  # rk23 relative tolerance
+    atol: float = Field(default=1e-9)  # rk23 absolute tolerance
 
 class OutputConfig(BaseModel):
     save_dir: str = Field(default="./output")
@@ -1,16 +1,65 @@
+from __future__ import annotations
+import logging
+import threading
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from typing import cast
-from zenoengine.config.config import PGNSConfig, Dimension, SimMode
-from zenoengine.sim.controller import run_simulation
+from typing import TYPE_CHECKING, Optional
+from zenoengine.config.config_loader import load_config_with_overrides
 from pathlib import Path
-import threading
 
+if TYPE_CHECKING:
+    from zenoengine.engine.scheduler import CoreScheduler
+
+# Served by uvicorn; its error logger is the server's log stream
+logger = logging.getLogger("uvicorn.error")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # A cold kernel cache takes minutes to compile; warm it in the background so
+    # startup and health checks are not held up (early requests just compile on demand)
+    threading.Thread(target=warm_kernels, name="zeno-kernel-warmup", daemon=True).start()
+    yield
+
+
+app = FastAPI(title="Zeno Engine API", lifespan=lifespan)
+_scheduler: Optional[CoreScheduler] = None
+_kernels = "pending"  # kernel warmup state: pending, warming, ready or failed
+
+
+def get_scheduler() -> CoreScheduler:
+    """
+    Shared core-budget scheduler: concurrent /simulate requests queue for
+    cores instead of each spreading kernels over the whole machine.
+    """
+    global _scheduler
+    if _scheduler is None:
+        from zenoengine.engine.scheduler import CoreScheduler
+
+        _scheduler = CoreScheduler()
+    return _scheduler
 
-app = FastAPI(title="Zeno Engine API")
+def warm_kernels() -> None:
+    """
+    Load (or compile once) every kernel, so /simulate requests do not pay
+    JIT latency. Runs on a background thread started by `lifespan`.
+    """
+    global _kernels
+    from zenoengine.engine.warmup import warmup
+
+    _kernels = "warming"
+    try:
+        report = warmup()
+    except Exception:
+        _kernels = "failed"
+        logger.exception("[API] Kernel warmup failed")
+        return
+    _kernels = "ready"
+    logger.info("[API] Kernel warmup: %s", report)
 
 @app.get("/")
 def root():
-    return {"message": "Zeno Engine is alive!"}
+    return {"message": "Zeno Engine is alive!", "kernels": _kernels}
 
 @app.post("/simulate")
 def simulate(
@@ -18,35 +67,42 @@ def simulate(
     grid: int = 128,
     steps: int = 500,
     scene: str = "RTI_2D",
-    mode: str = "symbolic"
+    mode: str = "symbolic",
+    threads: Optional[int] = None
 ):
     if dim not in (1, 2, 3):
         raise ValueError("dimension must be 1, 2, or 3")
     if mode not in ("symbolic", "classical"):
         raise ValueError("mode must be 'symbolic' or 'classical'")
 
-    config = PGNSConfig(
-        dimension=cast(Dimension, dim),
-        grid_size=grid,
-        total_steps=steps,
-        scene=scene,
-        mode=cast(SimMode, mode),
-        save_video=True,
-        save_images=True,
-        show_progress=False,
-        multithread=True,
-    )
-
-    thread = threading.Thread(target=run_simulation, args=(config,))
-    thread.start()
+    config = load_config_with_overrides(cli_overrides={
+        "defaults.dimensions": dim,
+        "defaults.grid_size": (grid,) * dim,
+        "defaults.simulation_steps": steps,
+        "defaults.field": scene,
+        "engine.backend": mode,
+        "engine.num_threads": threads if threads is not None else "auto",
+        "debug.verbose": False,
+    })
+    job = get_scheduler().submit_simulation(config)
 
     return {
-        "status": "started",
+        "status": job.state,
+        "job": job.id,
+        "threads": job.threads,
         "scene": scene,
         "dim": dim,
         "mode": mode
     }
 
+@app.get("/jobs")
+def jobs() -> list[dict]:
+    """
+    Scheduler view of every submitted simulation: state, thread budget and
+    time spent queued/running.
+    """
+    return get_scheduler().status()
+
 @app.get("/status")
 def status(scene: str = "RTI_2D") -> dict:
     """
@@ -10,6 +10,7 @@ SimMode = Literal["symbolic", "classical"]
 Dimension = Literal[1, 2, 3]
 LatticeType = Literal["grid", "hex", "rhombic_dodecahedron", "torus", "partition"]
 Geometry = Literal["cartesian", "rhombic"]
+Boundary = Literal["periodic", "reflect", "fixed"]
 
 CONFIG_PATH = os.getenv("ZENO_CONFIG_PATH", "config.toml")
 
@@ -26,7 +27,11 @@ class DefaultsConfig:
     grid_size: Tuple[int, int] = (64, 64)
     field: str = "rti"
     operator: str = "pgns"
+    lambda_: float = 0.4  # torsion strength λ
+    kappa: float = 0.9  # nonlinearity strength κ
+    beta: float = 0.3  # entropy feedback strength β
     simulation_steps: int = 1000
+    time_step: float = 1e-5  # Δt per step; adaptive integrators start here and run to simulation_steps·time_step
     output_format: str = "npy"
 
 @dataclass
@@ -40,6 +45,32 @@ class EngineConfig:
     num_threads: Any = "auto"  # int or "auto"
     use_numba: bool = True
     backend: SimMode = "symbolic"
+    halo: int = 0  # ghost-cell layers per side; 0 = bare periodic storage
+    boundary: Boundary = "periodic"  # non-periodic boundaries need halo >= 1
+    tile_shape: Optional[Tuple[int, int, int]] = None  # 3D cache block (i, j, k); None = row sweep
+    time_block: int = 1  # 3D steps per grid sweep (temporal blocking); observation every time_block steps
+    workers: int = 1  # processes stepping shared-memory slabs of the grid; 1 = in-process
+    numa: bool = False  # pin workers to NUMA nodes and first-touch each slab locally
+    ranks: list[str] = field(default_factory=list)  # "host:port" per rank for TCP multi-node runs; empty = single node
+    rank: int = 0  # this process's rank (overridden by $ZENO_RANK)
+    ensemble: int = 0  # independent members stepped together in one kernel launch; 0 = single field
+    seed: Optional[int] = None  # scene noise seed; ensemble member b uses seed + b
+    precision: str = "fp64"  # field storage and kernel I/O: fp64 or fp32 (metric reductions stay float64)
+    field_type: str = "complex"  # complex (PGNS/REHTE evolve complex 𝒜) or real (classical diffusion)
+    layout: str = "aos"  # aos (interleaved complex), soa (separate real/imag planes) or bricks (block-sparse)
+    brick_size: int = 0  # cells per brick edge for layout "bricks"; 0 = 256 (1D), 16 (2D), 8 (3D)
+    brick_threshold: float = 1e-6  # bricks whose max |ψ| stays at or below this are not stored
+    kernel: str = "fused"  # PGNS operator: fused, gather, reference, or "auto" (autotuned per host)
+    tuning_db: Optional[str] = None  # autotuning cache (JSON); None = $ZENO_TUNING_DB or ~/.cache/zeno
+    incremental: bool = False  # recompute ℛ/𝒯 only around cells whose quantized index changed
+    amr_levels: int = 1  # refinement levels for 2D PGNS (ratio 2 each); 1 = uniform grid
+    amr_patch: int = 16  # cells per patch edge on every level
+    amr_threshold: int = 2  # quantized-index jump between neighbours that tags a cell for refinement
+    amr_interval: int = 10  # steps between regrids
+    symmetry: bool = False  # simulate only the fundamental domain of scenes that declare a symmetry
+    integrator: str = "euler"  # time stepping: euler, rk2 (Heun), rk4, or rk23 (adaptive Bogacki–Shampine)
+    rtol: float = 1e-6  # rk23 relative error tolerance per step
+    atol: float = 1e-9  # rk23 absolute error tolerance per step
 
 @dataclass
 class OutputConfig:
@@ -66,7 +97,10 @@ class ZenoConfig:
 
     @classmethod
     def load(cls, path: str = CONFIG_PATH) -> ZenoConfig:
-        raw = toml.load(path)
+        return cls.from_dict(toml.load(path))
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> ZenoConfig:
         return cls(
             math=MathConfig(**raw.get("math", {})),
             defaults=DefaultsConfig(**raw.get("defaults", {})),
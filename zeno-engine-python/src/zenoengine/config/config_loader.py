@@ -0,0 +1,28 @@
+from __future__ import annotations
+import os
+from typing import Any
+
+import toml
+
+from zenoengine.config.config import CONFIG_PATH, ZenoConfig
+
+
+def load_config_with_overrides(
+    toml_path: str | None = None,
+    cli_overrides: dict[str, Any] | None = None
+) -> ZenoConfig:
+    """
+    Load a TOML config (defaults only if the file is missing) and apply
+    dot-path overrides such as {"defaults.dimensions": 3}.
+    """
+    path = toml_path or CONFIG_PATH
+    raw: dict[str, Any] = toml.load(path) if os.path.exists(path) else {}
+    if toml_path and not raw:
+        raise FileNotFoundError(f"Config file not found: {toml_path}")
+
+    for dotted, value in (cli_overrides or {}).items():
+        section, _, key = dotted.partition(".")
+        if not key:
+            raise ValueError(f"Override '{dotted}' must be of the form section.key")
+        raw.setdefault(section, {})[key] = value
+    return ZenoConfig.from_dict(raw)
@@ -0,0 +1,261 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+from numba import njit, prange
+
+from zenoengine.core.precision import delta_dtype
+
+# rhs(out, observe) evaluates Δ𝒜 at the field's current state into `out` (returning it, or an array
+# holding the result); `observe` asks for that evaluation's metric partials
+RhsFunc = Callable[[np.ndarray, bool], np.ndarray]
+
+
+@dataclass(frozen=True)
+class Tableau:
+    """
+    Explicit Runge–Kutta method: stage matrix `a`, weights `b`, and for
+    embedded pairs the error weights `e` (b minus the lower-order weights).
+    `fsal`: the last stage is evaluated at the new state and doubles as
+    the next step's first stage.
+    """
+
+    a: tuple[tuple[float, ...], ...]
+    b: tuple[float, ...]
+    order: int
+    e: tuple[float, ...] | None = None
+    fsal: bool = False
+
+    @property
+    def stages(self) -> int:
+        return len(self.b)
+
+
+TABLEAUS: dict[str, Tableau] = {
+    "euler": Tableau(a=((),), b=(1.0,), order=1),
+    # Heun's method
+    "rk2": Tableau(a=((), (1.0,)), b=(0.5, 0.5), order=2),
+    "rk4": Tableau(
+        a=((), (0.5,), (0.0, 0.5), (0.0, 0.0, 1.0)),
+        b=(1 / 6, 1 / 3, 1 / 3, 1 / 6),
+        order=4
+    ),
+    # Bogacki–Shampine 3(2): third-order step, second-order error estimate, 3 evaluations per step
+    "rk23": Tableau(
+        a=((), (0.5,), (0.0, 0.75), (2 / 9, 1 / 3, 4 / 9)),
+        b=(2 / 9, 1 / 3, 4 / 9, 0.0),
+        order=3,
+        e=(-5 / 72, 1 / 12, 1 / 9, -1 / 8),
+        fsal=True
+    ),
+}
+
+INTEGRATORS: tuple[str, ...] = tuple(TABLEAUS)
+
+
+@dataclass
+class IntegratorStats:
+    accepted: int = 0
+    rejected: int = 0
+    evaluations: int = 0
+    dt_min: float = np.inf
+    dt_max: float = 0.0
+
+
+class Integrator:
+    """
+    Runge–Kutta time stepping of ψ' = Δ𝒜(ψ) with stage buffers allocated once.
+
+    Stages are evaluated in place: the field is set to each stage state and
+    `rhs` evaluates Δ𝒜 there (so halos, ensembles and kernel choice stay
+    with the caller), into row i of one (stages, *shape) buffer. Each stage
+    state is a single pass over ψ_n and the stored rows.
+
+    Metric partials come from one evaluation per step: the first stage
+    (the state the step starts from, as with forward Euler), or for FSAL
+    pairs the last (the state it ends at, reused as the next first stage).
+
+    The embedded pair (`rk23`) adapts Δt: a step is accepted when
+    max |err| / (atol + rtol·max(|ψ_n|, |ψ_n+1|)) ≤ 1, rejected steps are
+    retried from ψ_n, and `dt` holds the proposal for the next step.
+    """
+
+    max_rejections = 50
+
+    def __init__(
+        self,
+        method: str,
+        shape: tuple[int, ...],
+        dtype: np.dtype | type,
+        *,
+        dt: float,
+        rtol: float = 1e-6,
+        atol: float = 1e-9
+    ):
+        if method not in TABLEAUS:
+            raise ValueError(f"Unknown integrator '{method}'; expected one of {INTEGRATORS}")
+        self.method = method
+        self.tableau = TABLEAUS[method]
+        self.dt = dt
+        self.rtol = rtol
+        self.atol = atol
+        self.stats = IntegratorStats()
+
+        dtype = np.dtype(dtype)
+        if not np.issubdtype(dtype, np.complexfloating):
+            raise TypeError(
+                "A real field cannot take a complex Δ without losing its imaginary part; "
+                "store the field as complex (engine.field_type = 'complex')"
+            )
+        s = self.tableau.stages
+        self.dtype = dtype
+        self._rows = np.arange(s)  # stage -> buffer row (FSAL swaps the first and last)
+        self._coeffs = np.zeros(s, dtype=np.float64)
+        self._allocate(tuple(shape))
+
+    @property
+    def adaptive(self) -> bool:
+        return self.tableau.e is not None
+
+    def reset(self) -> None:
+        """
+        Forget the reused FSAL stage (call after the field was changed outside `step`).
+        """
+        self._fresh = False
+
+    def resize(self, shape: tuple[int, ...]) -> None:
+        """
+        Fit the stage buffers to a state of `shape` (e.g. a brick pool that
+        grew) and forget the reused FSAL stage.
+        """
+        if tuple(shape) != self.y0.shape:
+            self._allocate(tuple(shape))
+        self.reset()
+
+    def _allocate(self, shape: tuple[int, ...]) -> None:
+        self.y0 = np.empty(shape, dtype=self.dtype)
+        self.y = np.empty(shape, dtype=self.dtype)  # stage state for strided (padded) fields
+        self.k = np.empty((self.tableau.stages,) + shape, dtype=delta_dtype(self.dtype))
+        self._chunks = np.zeros(min(max(self.y0.size, 1), 256), dtype=np.float64)
+        self._fresh = False  # row of stage 0 already holds Δ𝒜(ψ_n)
+
+    def step(self, values: np.ndarray, rhs: RhsFunc, dt: float | None = None) -> float:
+        """
+        Advance `values` in place by one accepted step.
+
+        Args:
+            values: field state ψ_n (becomes ψ_n+1)
+            rhs: Δ𝒜 evaluator at the current field state
+            dt: step to attempt (defaults to `self.dt`); adaptive methods may shrink it
+
+        Returns:
+            the step actually taken
+        """
+        dt = self.dt if dt is None else dt
+        tableau = self.tableau
+        self.y0[...] = values
+
+        for _ in range(self.max_rejections):
+            for i in range(tableau.stages):
+                if i == 0 and self._fresh:
+                    continue
+                if i > 0:
+                    self._combine(values, tableau.a[i], dt)
+                observe = i == tableau.stages - 1 if tableau.fsal else i == 0
+                self._evaluate(self._rows[i], rhs, observe)
+
+            if not tableau.fsal:
+                self._combine(values, tableau.b, dt)
+            if not self.adaptive:
+                self._accept(dt)
+                return dt
+
+            error = self._error(values, dt)
+            factor = 5.0 if error == 0.0 else 0.9 * error ** (-1 / tableau.order)
+            if error <= 1.0:
+                self._accept(dt)
+                self.dt = dt * min(max(factor, 0.2), 5.0)
+                return dt
+
+            # Rejected (or non-finite): retry from ψ_n with a smaller step; Δ𝒜(ψ_n) is still valid
+            self.stats.rejected += 1
+            values[...] = self.y0
+            self._fresh = True
+            dt *= max(min(factor, 0.9), 0.2) if np.isfinite(factor) else 0.2
+
+        raise RuntimeError(f"[Integrator] {self.method}: {self.max_rejections} rejected steps in a row at dt={dt:.3e}")
+
+    def _evaluate(self, row: int, rhs: RhsFunc, observe: bool) -> None:
+        out = self.k[row]
+        delta = rhs(out, observe)
+        if delta is not out:
+            out[...] = delta
+        self.stats.evaluations += 1
+
+    def _combine(self, values: np.ndarray, weights: tuple[float, ...], dt: float) -> None:
+        # values <- ψ_n + dt·Σ w_j k_j, one pass
+        self._coeffs[:] = 0.0
+        for j, w in enumerate(weights):
+            self._coeffs[self._rows[j]] = w
+        k = self.k.reshape(self.k.shape[0], -1)
+        if values.flags.c_contiguous:
+            _stage(values.reshape(-1), self.y0.reshape(-1), k, self._coeffs, dt)
+        else:
+            _stage(self.y.reshape(-1), self.y0.reshape(-1), k, self._coeffs, dt)
+            values[...] = self.y
+
+    def _error(self, values: np.ndarray, dt: float) -> float:
+        self._coeffs[:] = 0.0
+        for j, w in enumerate(self.tableau.e):
+            self._coeffs[self._rows[j]] = w
+        y1 = values if values.flags.c_contiguous else self.y
+        k = self.k.reshape(self.k.shape[0], -1)
+        _error_chunks(self.y0.reshape(-1), y1.reshape(-1), k, self._coeffs, dt, self.atol, self.rtol, self._chunks)
+        error = float(self._chunks.max())
+        return error if np.isfinite(error) else np.inf
+
+    def _accept(self, dt: float) -> None:
+        stats = self.stats
+        stats.accepted += 1
+        stats.dt_min = min(stats.dt_min, dt)
+        stats.dt_max = max(stats.dt_max, dt)
+        if self.tableau.fsal:
+            last = self.tableau.stages - 1
+            self._rows[0], self._rows[last] = self._rows[last], self._rows[0]
+            self._fresh = True
+
+
+# --- Stage kernels (flat views of contiguous buffers) -----------------------
+
+@njit(parallel=True, cache=True)
+def _stage(out, y0, k, coeffs, dt):
+    s = k.shape[0]
+    for i in prange(out.size):
+        acc = 0.0 * k[0, i]
+        for j in range(s):
+            c = coeffs[j]
+            if c != 0.0:
+                acc += c * k[j, i]
+        out[i] = y0[i] + dt * acc
+
+
+@njit(parallel=True, cache=True)
+def _error_chunks(y0, y1, k, coeffs, dt, atol, rtol, chunks):
+    # Max scaled error per chunk; one chunk per prange iteration keeps the reduction race-free
+    n = y0.size
+    s = k.shape[0]
+    m = chunks.shape[0]
+    for c in prange(m):
+        worst = 0.0
+        for i in range(c * n // m, (c + 1) * n // m):
+            err = 0.0 * k[0, i]
+            for j in range(s):
+                w = coeffs[j]
+                if w != 0.0:
+                    err += w * k[j, i]
+            scale = atol + rtol * max(abs(y0[i]), abs(y1[i]))
+            x = abs(dt * err) / scale
+            if x > worst or x != x:  # a NaN sticks
+                worst = x
+        chunks[c] = worst
@@ -1,69 +1,122 @@
 from __future__ import annotations
 import numpy as np
-from numba import njit
-from zenoengine.core.partition_geometry import partition_table
+from numba import njit, prange
+from zenoengine.core.partition_geometry import (
+    PARTITION_TABLE_SIZE,
+    QUANTIZATION_SCALE,
+    get_partition_table,
+)
 
+# Built once per process; numba freezes it into the kernel as a read-only constant
+_P_TABLE = get_partition_table()
+_SCALE = QUANTIZATION_SCALE
+_TOP = PARTITION_TABLE_SIZE - 1
 
-@njit
-def curvature_operator(values: np.ndarray, dim: int) -> np.ndarray:
+
+def curvature_operator(values: np.ndarray, dim: int, out: np.ndarray | None = None) -> np.ndarray:
     """
     Computes symbolic curvature ℛ[𝒜] from the field values using partition geometry.
 
     Args:
         values: ndarray of real values representing the field ψ or 𝒜.
         dim: Spatial dimension (1, 2, or 3).
+        out: Optional preallocated result buffer with the same shape as `values`.
 
     Returns:
         ndarray of the same shape as `values` containing the curvature.
     """
-    shape = values.shape
-    p_table = partition_table(500)
-    result = np.zeros_like(values)
+    if dim not in (1, 2, 3) or values.ndim != dim:
+        raise ValueError("Unsupported dimension for curvature_operator")
+    if out is None:
+        out = np.zeros_like(values)
 
     if dim == 1:
-        nx = shape[0]
-        for i in range(nx):
-            c = min(int(abs(values[i]) * 50), 499)
-            l = min(int(abs(values[(i - 1) % nx]) * 50), 499)
-            r = min(int(abs(values[(i + 1) % nx]) * 50), 499)
-            result[i] = 2 * p_table[c] - p_table[l] - p_table[r]
-
+        _curvature_1d(values, out)
     elif dim == 2:
-        nx, ny = shape
-        for i in range(nx):
-            for j in range(ny):
-                c = min(int(abs(values[i, j]) * 50), 499)
-                neighbors = [
-                    values[(i - 1) % nx, j],
-                    values[(i + 1) % nx, j],
-                    values[i, (j - 1) % ny],
-                    values[i, (j + 1) % ny],
-                ]
-                result[i, j] = sum(
-                    p_table[c] - p_table[min(int(abs(n) * 50), 499)]
-                    for n in neighbors
-                )
+        _curvature_2d(values, out)
+    else:
+        _curvature_3d(values, out)
 
-    elif dim == 3:
-        nx, ny, nz = shape
-        for i in range(nx):
-            for j in range(ny):
-                for k in range(nz):
-                    c = min(int(abs(values[i, j, k]) * 50), 499)
-                    neighbors = [
-                        values[(i - 1) % nx, j, k],
-                        values[(i + 1) % nx, j, k],
-                        values[i, (j - 1) % ny, k],
-                        values[i, (j + 1) % ny, k],
-                        values[i, j, (k - 1) % nz],
-                        values[i, j, (k + 1) % nz],
-                    ]
-                    result[i, j, k] = sum(
-                        p_table[c] - p_table[min(int(abs(n) * 50), 499)]
-                        for n in neighbors
-                    )
+    return out
 
-    else:
-        raise ValueError("Unsupported dimension for curvature_operator")
 
-    return result
+@njit(inline="always")
+def _p(p_table, x):
+    return p_table[min(int(abs(x) * _SCALE), _TOP)]
+
+
+# Neighbours are loaded as scalars rather than collected in a per-cell list,
+# so the kernels allocate nothing. Interior columns are modulo-free, which
+# lets LLVM vectorize the innermost loop; the wrap-around columns are peeled.
+
+@njit(cache=True)
+def _curvature_1d(values, result):
+    p_table = _P_TABLE
+    nx = values.shape[0]
+    for i in range(1, nx - 1):
+        result[i] = 2 * _p(p_table, values[i]) - _p(p_table, values[i - 1]) - _p(p_table, values[i + 1])
+
+    for i in (0, nx - 1):
+        pc = _p(p_table, values[i])
+        result[i] = 2 * pc - _p(p_table, values[(i - 1) % nx]) - _p(p_table, values[(i + 1) % nx])
+
+
+@njit(cache=True)
+def _curvature_2d(values, result):
+    p_table = _P_TABLE
+    nx, ny = values.shape
+    for i in range(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        # Loads are spelled out in the loop body: routing indices through an
+        # inline helper defeats LLVM's vectorizer here.
+        for j in range(1, ny - 1):
+            pc = _p(p_table, values[i, j])
+            result[i, j] = (
+                (pc - _p(p_table, values[im, j]))
+                + (pc - _p(p_table, values[ip, j]))
+                + (pc - _p(p_table, values[i, j - 1]))
+                + (pc - _p(p_table, values[i, j + 1]))
+            )
+
+        for j in (0, ny - 1):
+            pc = _p(p_table, values[i, j])
+            result[i, j] = (
+                (pc - _p(p_table, values[im, j]))
+                + (pc - _p(p_table, values[ip, j]))
+                + (pc - _p(p_table, values[i, (j - 1) % ny]))
+                + (pc - _p(p_table, values[i, (j + 1) % ny]))
+            )
+
+
+@njit(parallel=True, cache=True)
+def _curvature_3d(values, result):
+    p_table = _P_TABLE
+    nx, ny, nz = values.shape
+    for i in prange(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        for j in range(ny):
+            jm = (j - 1) % ny
+            jp = (j + 1) % ny
+            for k in range(1, nz - 1):
+                pc = _p(p_table, values[i, j, k])
+                result[i, j, k] = (
+                    (pc - _p(p_table, values[im, j, k]))
+                    + (pc - _p(p_table, values[ip, j, k]))
+                    + (pc - _p(p_table, values[i, jm, k]))
+                    + (pc - _p(p_table, values[i, jp, k]))
+                    + (pc - _p(p_table, values[i, j, k - 1]))
+                    + (pc - _p(p_table, values[i, j, k + 1]))
+                )
+
+            for k in (0, nz - 1):
+                pc = _p(p_table, values[i, j, k])
+                result[i, j, k] = (
+                    (pc - _p(p_table, values[im, j, k]))
+                    + (pc - _p(p_table, values[ip, j, k]))
+                    + (pc - _p(p_table, values[i, jm, k]))
+                    + (pc - _p(p_table, values[i, jp, k]))
+                    + (pc - _p(p_table, values[i, j, (k - 1) % nz]))
+                    + (pc - _p(p_table, values[i, j, (k + 1) % nz]))
+                )
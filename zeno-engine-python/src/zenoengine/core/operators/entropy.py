@@ -1,9 +1,9 @@
 from __future__ import annotations
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
-@njit
-def entropy_operator(values: np.ndarray, dim: int) -> np.ndarray:
+
+def entropy_operator(values: np.ndarray, dim: int, out: np.ndarray | None = None) -> np.ndarray:
     """
     Symbolic entropy curvature operator 𝒮*[𝒜].
 
@@ -13,17 +13,57 @@ def entropy_operator(values: np.ndarray, dim: int) -> np.ndarray:
     Arguments:
         values: ndarray of shape (...), real or complex
         dim: int (1, 2, or 3)
+        out: optional preallocated result buffer with the same shape as `values`
 
     Returns:
         entropy_force: ndarray of same shape as `values`
     """
-    grad_squared = np.zeros_like(values)
+    if dim not in (1, 2, 3) or values.ndim != dim:
+        raise ValueError("Unsupported dimension for entropy_operator")
+    if out is None:
+        out = np.empty_like(values)
+
+    if dim == 1:
+        _entropy_1d(values, out)
+    elif dim == 2:
+        _entropy_2d(values, out)
+    else:
+        _entropy_3d(values, out)
+
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _entropy_1d(values, out):
+    nx = values.shape[0]
+    for i in prange(nx):
+        gx = 0.5 * (values[(i + 1) % nx] - values[(i - 1) % nx])
+        out[i] = -np.sqrt(gx * gx) * values[i]
+
+
+@njit(parallel=True, cache=True)
+def _entropy_2d(values, out):
+    nx, ny = values.shape
+    for i in prange(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        for j in range(ny):
+            gx = 0.5 * (values[ip, j] - values[im, j])
+            gy = 0.5 * (values[i, (j + 1) % ny] - values[i, (j - 1) % ny])
+            out[i, j] = -np.sqrt(gx * gx + gy * gy) * values[i, j]
 
-    for axis in range(dim):
-        forward = np.roll(values, -1, axis=axis)
-        backward = np.roll(values, 1, axis=axis)
-        grad = 0.5 * (forward - backward)
-        grad_squared += grad**2
 
-    grad_mag = np.sqrt(grad_squared)
-    return -grad_mag * values
+@njit(parallel=True, cache=True)
+def _entropy_3d(values, out):
+    nx, ny, nz = values.shape
+    for i in prange(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        for j in range(ny):
+            jm = (j - 1) % ny
+            jp = (j + 1) % ny
+            for k in range(nz):
+                gx = 0.5 * (values[ip, j, k] - values[im, j, k])
+                gy = 0.5 * (values[i, jp, k] - values[i, jm, k])
+                gz = 0.5 * (values[i, j, (k + 1) % nz] - values[i, j, (k - 1) % nz])
+                out[i, j, k] = -np.sqrt(gx * gx + gy * gy + gz * gz) * values[i, j, k]
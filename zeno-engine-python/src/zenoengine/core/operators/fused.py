@@ -0,0 +1,589 @@
+from __future__ import annotations
+import numpy as np
+from numba import njit, prange
+
+from zenoengine.core.partition_geometry import (
+    PARTITION_TABLE_SIZE,
+    QUANTIZATION_SCALE,
+    get_partition_table,
+)
+from zenoengine.core.precision import real_dtype
+
+_SCALE = QUANTIZATION_SCALE
+_TOP = PARTITION_TABLE_SIZE - 1
+_U1 = np.uint64(1)
+
+
+def fused_pgns_operator(
+    psi: np.ndarray,
+    dim: int,
+    *,
+    lambda_: float = 0.4,
+    kappa: float = 0.9,
+    beta: float = 0.3,
+    p_table: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+    curv: np.ndarray | None = None,
+    tors: np.ndarray | None = None,
+    partials: np.ndarray | None = None,
+    halo: int = 0,
+    tile: tuple[int, int, int] | None = None,
+    rows: tuple[int, int] | None = None
+) -> np.ndarray:
+    """
+    Single-pass PGNS operator:
+    Δ𝒜 = -i (ℛ[𝒜] + λ·𝒯[𝒜] + κ·|𝒜|²𝒜 + β·𝒮*[𝒜])
+
+    Each cell reads its stencil neighbourhood once and writes Δ once; no
+    intermediate ℛ, 𝒯, |𝒜|²𝒜 or 𝒮* grids are allocated.
+
+    Args:
+        psi: field (real or complex)
+        dim: spatial dimension (1–3)
+        lambda_: torsion strength
+        kappa: nonlinearity strength
+        beta: entropy feedback strength
+        p_table: partition lookup table (defaults to the shared cached table)
+        out: optional complex buffer with the same shape as `psi`
+        curv: optional buffer that receives ℛ[𝒜] from the same pass
+        tors: optional buffer that receives 𝒯[𝒜] from the same pass
+        partials: optional float64 buffer that receives per-row (or per-tile)
+                  Σ|𝒜|, Σ|ℛ|, Σ|𝒯|, Σ|𝒮*|; allocate it with `metric_partials`
+                  and collapse it with `reduce_partials`
+        halo: ghost-cell width of `psi`. With halo > 0, `psi` is padded
+              storage whose halo has already been refreshed; the kernel runs
+              modulo-free over the interior and all outputs are interior-shaped.
+        tile: (ti, tj, tk) cache-block shape for 3D fields. The sweep is then
+              parallel over tiles with k contiguous inside each tile.
+        rows: (i0, i1) slab of the leading axis to evaluate on a periodic field;
+              outputs then cover only those rows. Used by slab decomposition.
+
+    Returns:
+        Δ𝒜: symbolic evolution term (complex)
+    """
+    if psi.ndim != dim:
+        raise ValueError(f"Field has {psi.ndim} dimensions, expected {dim}")
+    if dim not in (1, 2, 3):
+        raise ValueError("Unsupported dimension for fused_pgns_operator")
+    if p_table is None:
+        p_table = get_partition_table(dtype=real_dtype(psi.dtype))
+
+    shape = tuple(n - 2 * halo for n in psi.shape)
+    if rows is not None:
+        if halo or tile is not None:
+            raise ValueError("rows= is only supported for bare periodic fields without tiling")
+        if not 0 <= rows[0] <= rows[1] <= shape[0]:
+            raise ValueError(f"rows {rows} out of range for leading extent {shape[0]}")
+        shape = (rows[1] - rows[0],) + shape[1:]
+    if out is None:
+        out = np.empty(shape, dtype=np.result_type(psi.dtype, np.complex64))
+    if tile is not None and dim != 3:
+        tile = None
+    n_partials = partial_rows(shape, tile)
+    if partials is not None and partials.shape != (n_partials, 4):
+        raise ValueError(f"partials must have shape ({n_partials}, 4)")
+
+    if halo > 1:
+        # The stencil radius is 1, so only the innermost ghost layer is read
+        psi = psi[(slice(halo - 1, 1 - halo),) * dim]
+
+    if tile is not None:
+        ti, tj, tk = _clamp_tile(tile, shape)
+        kernel = _fused_pgns_tiled_padded_3d if halo > 0 else _fused_pgns_tiled_3d
+        kernel(psi, p_table, lambda_, kappa, beta, out, curv, tors, partials, ti, tj, tk)
+    elif halo > 0:
+        kernel = (_fused_pgns_padded_1d, _fused_pgns_padded_2d, _fused_pgns_padded_3d)[dim - 1]
+        kernel(psi, p_table, lambda_, kappa, beta, out, curv, tors, partials)
+    else:
+        i0, i1 = rows if rows is not None else (0, psi.shape[0])
+        kernel = (_fused_pgns_1d, _fused_pgns_2d, _fused_pgns_3d)[dim - 1]
+        kernel(psi, p_table, lambda_, kappa, beta, out, curv, tors, partials, i0, i1)
+
+    return out
+
+
+def partial_rows(shape: tuple[int, ...], tile: tuple[int, int, int] | None = None) -> int:
+    """
+    Number of partial-sum rows the fused kernel writes for an interior `shape`:
+    one per leading-axis row, or one per tile when a 3D tile shape is given.
+    """
+    if tile is None or len(shape) != 3:
+        return shape[0]
+    blocks = 1
+    for t, n in zip(_clamp_tile(tile, shape), shape):
+        blocks *= (n + t - 1) // t
+    return blocks
+
+
+def _clamp_tile(tile: tuple[int, int, int], shape: tuple[int, ...]) -> tuple[int, int, int]:
+    if len(tile) != 3:
+        raise ValueError(f"tile must have 3 entries, got {len(tile)}")
+    ti, tj, tk = (min(max(int(t), 1), n) for t, n in zip(tile, shape))
+    return ti, tj, tk
+
+
+def metric_partials(psi: np.ndarray, tile: tuple[int, int, int] | None = None) -> np.ndarray:
+    """
+    Allocate a partial-sum buffer for `fused_pgns_operator(partials=...)`.
+    """
+    return np.zeros((partial_rows(psi.shape, tile), 4), dtype=np.float64)
+
+
+def term_partials(
+    psi: np.ndarray,
+    R: np.ndarray,
+    T: np.ndarray,
+    S: np.ndarray,
+    partials: np.ndarray
+) -> np.ndarray:
+    """
+    Per-row Σ|𝒜|, Σ|ℛ|, Σ|𝒯|, Σ|𝒮*| of already evaluated terms, in the
+    row layout the fused kernel writes (unfused backends report metrics
+    through the same buffer).
+
+    Args:
+        psi: field interior the terms were evaluated on
+        R, T, S: curvature, torsion and entropy terms (shape of `psi`)
+        partials: float64 buffer of shape (psi.shape[0], 4)
+
+    Returns:
+        partials
+    """
+    if partials.shape != (psi.shape[0], 4):
+        raise ValueError(f"partials must have shape ({psi.shape[0]}, 4)")
+    if psi.ndim == 1:
+        # One cell per row; (n, 1) views keep the row loop dimension-agnostic
+        psi, R, T, S = (x.reshape(-1, 1) for x in (psi, R, T, S))
+    _term_partials(psi, R, T, S, partials)
+    return partials
+
+
+def reduce_partials(partials: np.ndarray) -> tuple[float, float, float, float]:
+    """
+    Collapse per-row partial sums into (field, curvature, torsion, entropy) energy.
+
+    Rows (or tiles) are owned by a single prange iteration and summed here in
+    a fixed order, so the result does not depend on the thread count.
+    """
+    totals = partials.sum(axis=0)
+    return float(totals[0]), float(totals[1]), float(totals[2]), float(totals[3])
+
+
+@njit(inline="always")
+def _p(p_table, x):
+    return p_table[min(int(abs(x) * _SCALE), _TOP)]
+
+
+@njit(fastmath={"reassoc"}, cache=True)
+def _acc(total, x):
+    # Only the metric accumulation may be reassociated, which lets LLVM keep
+    # the stencil loop vectorized; Δ itself is still computed in strict order.
+    return total + x
+
+
+@njit(inline="always")
+def _combine(c, R, T, g2, lam, kap, beta):
+    # κ|𝒜|²𝒜 and β𝒮* with 𝒮* = -‖∇𝒜‖·𝒜, matching nonlinear/entropy operators
+    N = abs(c) ** 2 * c
+    S = -np.sqrt(g2) * c
+    return -1j * (R + lam * T + kap * N + beta * S), S
+
+
+@njit(parallel=True, cache=True)
+def _term_partials(psi, R, T, S, partials):
+    for r in prange(psi.shape[0]):
+        e_psi = 0.0
+        e_R = 0.0
+        e_T = 0.0
+        e_S = 0.0
+        for c in psi[r].flat:
+            e_psi = _acc(e_psi, abs(c))
+        for x in R[r].flat:
+            e_R = _acc(e_R, abs(x))
+        for x in T[r].flat:
+            e_T = _acc(e_T, abs(x))
+        for x in S[r].flat:
+            e_S = _acc(e_S, abs(x))
+        partials[r, 0] = e_psi
+        partials[r, 1] = e_R
+        partials[r, 2] = e_T
+        partials[r, 3] = e_S
+
+
+# --- Per-cell PGNS terms, shared by the periodic and padded kernels ---------
+
+@njit(inline="always")
+def _cell_1d(c, l, r, p_table, lam, kap, beta):
+    pc = _p(p_table, c)
+    pl = _p(p_table, l)
+    pr = _p(p_table, r)
+
+    R = 2 * pc - pl - pr
+    T = pr - pl
+
+    gx = 0.5 * (r - l)
+    delta, S = _combine(c, R, T, gx * gx, lam, kap, beta)
+    return delta, R, T, S
+
+
+@njit(inline="always")
+def _cell_2d(c, l, r, d, u, p_table, lam, kap, beta):
+    pc = _p(p_table, c)
+    pl = _p(p_table, l)
+    pr = _p(p_table, r)
+    pd = _p(p_table, d)
+    pu = _p(p_table, u)
+
+    R = (pc - pl) + (pc - pr) + (pc - pd) + (pc - pu)
+    T = (pr - pl) + (pu - pd)
+
+    gx = 0.5 * (r - l)
+    gy = 0.5 * (u - d)
+    delta, S = _combine(c, R, T, gx * gx + gy * gy, lam, kap, beta)
+    return delta, R, T, S
+
+
+@njit(inline="always")
+def _cell_3d(c, l, r, d, u, b, f, p_table, lam, kap, beta):
+    pc = _p(p_table, c)
+    pl = _p(p_table, l)
+    pr = _p(p_table, r)
+    pd = _p(p_table, d)
+    pu = _p(p_table, u)
+    pb = _p(p_table, b)
+    pf = _p(p_table, f)
+
+    R = (pc - pl) + (pc - pr) + (pc - pd) + (pc - pu) + (pc - pb) + (pc - pf)
+    T = pr - pl + pu - pd + pf - pb
+
+    gx = 0.5 * (r - l)
+    gy = 0.5 * (u - d)
+    gz = 0.5 * (f - b)
+    delta, S = _combine(c, R, T, gx * gx + gy * gy + gz * gz, lam, kap, beta)
+    return delta, R, T, S
+
+
+# --- Periodic kernels (wrap-around indexing on the bare field) --------------
+# Rows [i0, i1) of the leading axis are evaluated and written to out[0:i1-i0],
+# so a slab owner can run the kernel on its rows of a shared global field.
+
+@njit(parallel=True, cache=True)
+def _fused_pgns_1d(psi, p_table, lam, kap, beta, out, curv, tors, partials, i0, i1):
+    nx = psi.shape[0]
+    for r in prange(i1 - i0):
+        i = i0 + r
+        delta, R, T, S = _cell_1d(
+            psi[i], psi[(i - 1) % nx], psi[(i + 1) % nx], p_table, lam, kap, beta
+        )
+        out[r] = delta
+        if curv is not None:
+            curv[r] = R
+        if tors is not None:
+            tors[r] = T
+        if partials is not None:
+            partials[r, 0] = abs(psi[i])
+            partials[r, 1] = abs(R)
+            partials[r, 2] = abs(T)
+            partials[r, 3] = abs(S)
+
+
+@njit(parallel=True, cache=True)
+def _fused_pgns_2d(psi, p_table, lam, kap, beta, out, curv, tors, partials, i0, i1):
+    nx, ny = psi.shape
+    for r in prange(i1 - i0):
+        i = i0 + r
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        e_psi = 0.0
+        e_R = 0.0
+        e_T = 0.0
+        e_S = 0.0
+        for j in range(ny):
+            jm = j - 1 if j > 0 else ny - 1
+            jp = j + 1 if j < ny - 1 else 0
+
+            c = psi[i, j]
+            delta, R, T, S = _cell_2d(
+                c, psi[im, j], psi[ip, j], psi[i, jm], psi[i, jp], p_table, lam, kap, beta
+            )
+            out[r, j] = delta
+            if curv is not None:
+                curv[r, j] = R
+            if tors is not None:
+                tors[r, j] = T
+            if partials is not None:
+                e_psi = _acc(e_psi, abs(c))
+                e_R = _acc(e_R, abs(R))
+                e_T = _acc(e_T, abs(T))
+                e_S = _acc(e_S, abs(S))
+
+        if partials is not None:
+            partials[r, 0] = e_psi
+            partials[r, 1] = e_R
+            partials[r, 2] = e_T
+            partials[r, 3] = e_S
+
+
+@njit(parallel=True, cache=True)
+def _fused_pgns_3d(psi, p_table, lam, kap, beta, out, curv, tors, partials, i0, i1):
+    nx, ny, nz = psi.shape
+    for r in prange(i1 - i0):
+        i = i0 + r
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        e_psi = 0.0
+        e_R = 0.0
+        e_T = 0.0
+        e_S = 0.0
+        for j in range(ny):
+            jm = (j - 1) % ny
+            jp = (j + 1) % ny
+            for k in range(nz):
+                km = k - 1 if k > 0 else nz - 1
+                kp = k + 1 if k < nz - 1 else 0
+
+                c = psi[i, j, k]
+                delta, R, T, S = _cell_3d(
+                    c, psi[im, j, k], psi[ip, j, k], psi[i, jm, k], psi[i, jp, k],
+                    psi[i, j, km], psi[i, j, kp], p_table, lam, kap, beta
+                )
+                out[r, j, k] = delta
+                if curv is not None:
+                    curv[r, j, k] = R
+                if tors is not None:
+                    tors[r, j, k] = T
+                if partials is not None:
+                    e_psi = _acc(e_psi, abs(c))
+                    e_R = _acc(e_R, abs(R))
+                    e_T = _acc(e_T, abs(T))
+                    e_S = _acc(e_S, abs(S))
+
+        if partials is not None:
+            partials[r, 0] = e_psi
+            partials[r, 1] = e_R
+            partials[r, 2] = e_T
+            partials[r, 3] = e_S
+
+
+# --- Padded kernels (halo already refreshed, no modulo in any loop) ---------
+# `data` carries exactly one ghost layer around `out`; the fixed +1 offset lets
+# LLVM prove every index is non-negative and drop numba's wraparound checks.
+
+@njit(parallel=True, cache=True)
+def _fused_pgns_padded_1d(data, p_table, lam, kap, beta, out, curv, tors, partials):
+    nx = out.shape[0]
+    for i in prange(nx):
+        x = i + 1
+        delta, R, T, S = _cell_1d(data[x], data[x - 1], data[x + 1], p_table, lam, kap, beta)
+        out[i] = delta
+        if curv is not None:
+            curv[i] = R
+        if tors is not None:
+            tors[i] = T
+        if partials is not None:
+            partials[i, 0] = abs(data[x])
+            partials[i, 1] = abs(R)
+            partials[i, 2] = abs(T)
+            partials[i, 3] = abs(S)
+
+
+@njit(parallel=True, cache=True)
+def _fused_pgns_padded_2d(data, p_table, lam, kap, beta, out, curv, tors, partials):
+    nx, ny = out.shape
+    for i in prange(nx):
+        x = i + 1
+        e_psi = 0.0
+        e_R = 0.0
+        e_T = 0.0
+        e_S = 0.0
+        for j in range(ny):
+            y = j + 1
+            c = data[x, y]
+            delta, R, T, S = _cell_2d(
+                c, data[x - 1, y], data[x + 1, y], data[x, y - 1], data[x, y + 1],
+                p_table, lam, kap, beta
+            )
+            out[i, j] = delta
+            if curv is not None:
+                curv[i, j] = R
+            if tors is not None:
+                tors[i, j] = T
+            if partials is not None:
+                e_psi = _acc(e_psi, abs(c))
+                e_R = _acc(e_R, abs(R))
+                e_T = _acc(e_T, abs(T))
+                e_S = _acc(e_S, abs(S))
+
+        if partials is not None:
+            partials[i, 0] = e_psi
+            partials[i, 1] = e_R
+            partials[i, 2] = e_T
+            partials[i, 3] = e_S
+
+
+@njit(parallel=True, cache=True)
+def _fused_pgns_padded_3d(data, p_table, lam, kap, beta, out, curv, tors, partials):
+    nx, ny, nz = out.shape
+    for i in prange(nx):
+        x = i + 1
+        e_psi = 0.0
+        e_R = 0.0
+        e_T = 0.0
+        e_S = 0.0
+        for j in range(ny):
+            y = j + 1
+            for k in range(nz):
+                z = k + 1
+                c = data[x, y, z]
+                delta, R, T, S = _cell_3d(
+                    c, data[x - 1, y, z], data[x + 1, y, z], data[x, y - 1, z], data[x, y + 1, z],
+                    data[x, y, z - 1], data[x, y, z + 1], p_table, lam, kap, beta
+                )
+                out[i, j, k] = delta
+                if curv is not None:
+                    curv[i, j, k] = R
+                if tors is not None:
+                    tors[i, j, k] = T
+                if partials is not None:
+                    e_psi = _acc(e_psi, abs(c))
+                    e_R = _acc(e_R, abs(R))
+                    e_T = _acc(e_T, abs(T))
+                    e_S = _acc(e_S, abs(S))
+
+        if partials is not None:
+            partials[i, 0] = e_psi
+            partials[i, 1] = e_R
+            partials[i, 2] = e_T
+            partials[i, 3] = e_S
+
+
+# --- Tiled 3D kernels --------------------------------------------------------
+# One prange iteration per (ti, tj, tk) block; the k loop stays innermost and
+# contiguous. A block's working set (its ψ slab plus one-cell skin and its
+# outputs) stays cache resident, where a full-plane sweep streams ψ from
+# memory three times per (i, j) line at large nz. Partials are per tile.
+
+@njit(parallel=True, cache=True)
+def _fused_pgns_tiled_3d(psi, p_table, lam, kap, beta, out, curv, tors, partials, ti, tj, tk):
+    nx, ny, nz = psi.shape
+    bx = (nx + ti - 1) // ti
+    by = (ny + tj - 1) // tj
+    bz = (nz + tk - 1) // tk
+    for t in prange(bx * by * bz):
+        # Bounds are computed inline: a helper returning them as a tuple keeps
+        # LLVM from vectorizing the k loop.
+        i0 = (t // (by * bz)) * ti
+        j0 = ((t // bz) % by) * tj
+        k0 = (t % bz) * tk
+        i1 = min(i0 + ti, nx)
+        j1 = min(j0 + tj, ny)
+        k1 = min(k0 + tk, nz)
+        e_psi = 0.0
+        e_R = 0.0
+        e_T = 0.0
+        e_S = 0.0
+        for i in range(i0, i1):
+            im = i - 1 if i > 0 else nx - 1
+            ip = i + 1 if i < nx - 1 else 0
+            for j in range(j0, j1):
+                jm = j - 1 if j > 0 else ny - 1
+                jp = j + 1 if j < ny - 1 else 0
+
+                # Wrap-free k range; the periodic k = 0 and k = nz - 1 cells
+                # are peeled below. k is unsigned so numba drops its
+                # negative-index check, which otherwise blocks vectorization
+                # when the loop starts at a runtime tile offset.
+                ks = max(k0, 1)
+                for kk in range(min(k1, nz - 1) - ks):
+                    k = np.uint64(ks) + np.uint64(kk)
+                    c = psi[i, j, k]
+                    delta, R, T, S = _cell_3d(
+                        c, psi[im, j, k], psi[ip, j, k], psi[i, jm, k], psi[i, jp, k],
+                        psi[i, j, k - _U1], psi[i, j, k + _U1], p_table, lam, kap, beta
+                    )
+                    out[i, j, k] = delta
+                    if curv is not None:
+                        curv[i, j, k] = R
+                    if tors is not None:
+                        tors[i, j, k] = T
+                    if partials is not None:
+                        e_psi = _acc(e_psi, abs(c))
+                        e_R = _acc(e_R, abs(R))
+                        e_T = _acc(e_T, abs(T))
+                        e_S = _acc(e_S, abs(S))
+
+                for edge in range(2 if nz > 1 else 1):
+                    k = 0 if edge == 0 else nz - 1
+                    if k < k0 or k >= k1:
+                        continue
+                    c = psi[i, j, k]
+                    delta, R, T, S = _cell_3d(
+                        c, psi[im, j, k], psi[ip, j, k], psi[i, jm, k], psi[i, jp, k],
+                        psi[i, j, (k - 1) % nz], psi[i, j, (k + 1) % nz], p_table, lam, kap, beta
+                    )
+                    out[i, j, k] = delta
+                    if curv is not None:
+                        curv[i, j, k] = R
+                    if tors is not None:
+                        tors[i, j, k] = T
+                    if partials is not None:
+                        e_psi = _acc(e_psi, abs(c))
+                        e_R = _acc(e_R, abs(R))
+                        e_T = _acc(e_T, abs(T))
+                        e_S = _acc(e_S, abs(S))
+
+        if partials is not None:
+            partials[t, 0] = e_psi
+            partials[t, 1] = e_R
+            partials[t, 2] = e_T
+            partials[t, 3] = e_S
+
+
+@njit(parallel=True, cache=True)
+def _fused_pgns_tiled_padded_3d(data, p_table, lam, kap, beta, out, curv, tors, partials, ti, tj, tk):
+    nx, ny, nz = out.shape
+    bx = (nx + ti - 1) // ti
+    by = (ny + tj - 1) // tj
+    bz = (nz + tk - 1) // tk
+    for t in prange(bx * by * bz):
+        # Bounds are computed inline: a helper returning them as a tuple keeps
+        # LLVM from vectorizing the k loop.
+        i0 = (t // (by * bz)) * ti
+        j0 = ((t // bz) % by) * tj
+        k0 = (t % bz) * tk
+        i1 = min(i0 + ti, nx)
+        j1 = min(j0 + tj, ny)
+        k1 = min(k0 + tk, nz)
+        e_psi = 0.0
+        e_R = 0.0
+        e_T = 0.0
+        e_S = 0.0
+        for i in range(i0, i1):
+            x = i + 1
+            for j in range(j0, j1):
+                y = j + 1
+                for kk in range(k1 - k0):
+                    # Unsigned z: see _fused_pgns_tiled_3d
+                    k = np.uint64(k0) + np.uint64(kk)
+                    z = k + _U1
+                    c = data[x, y, z]
+                    delta, R, T, S = _cell_3d(
+                        c, data[x - 1, y, z], data[x + 1, y, z], data[x, y - 1, z], data[x, y + 1, z],
+                        data[x, y, k], data[x, y, z + _U1], p_table, lam, kap, beta
+                    )
+                    out[i, j, k] = delta
+                    if curv is not None:
+                        curv[i, j, k] = R
+                    if tors is not None:
+                        tors[i, j, k] = T
+                    if partials is not None:
+                        e_psi = _acc(e_psi, abs(c))
+                        e_R = _acc(e_R, abs(R))
+                        e_T = _acc(e_T, abs(T))
+                        e_S = _acc(e_S, abs(S))
+
+        if partials is not None:
+            partials[t, 0] = e_psi
+            partials[t, 1] = e_R
+            partials[t, 2] = e_T
+            partials[t, 3] = e_S
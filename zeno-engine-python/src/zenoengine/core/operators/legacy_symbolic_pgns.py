@@ -3,27 +3,28 @@ import numpy as np
 from numba import njit, prange
 
 from zenoengine.fields.field import SymbolicField
-from zenoengine.core.partition_geometry import partition_table
+from zenoengine.core.partition_geometry import get_partition_table
 
 # Optional: exposed for metrics/debug export
 cached_last_curvature = np.zeros((1,), dtype=np.float64)
 cached_last_torsion = np.zeros((1,), dtype=np.float64)
 
 
-def symbolic_pgns_operator(field: SymbolicField) -> np.ndarray:
+def symbolic_pgns_operator(field: SymbolicField, out: np.ndarray | None = None) -> np.ndarray:
     """
     Composite PGNS operator:
     ℛ[𝒜] + 𝒯[𝒜] from partition geometry.
 
     Uses cached curvature/torsion values for export.
+    `out` may be a preallocated result buffer.
     """
     psi = field.values
     shape = psi.shape
     dim = field.config.dimension
 
-    p_table = partition_table(500)
+    p_table = get_partition_table()
 
-    result = np.zeros_like(psi)
+    result = out if out is not None else np.zeros_like(psi)
     curvature = np.zeros_like(psi)
     torsion = np.zeros_like(psi)
 
@@ -43,7 +44,7 @@ def symbolic_pgns_operator(field: SymbolicField) -> np.ndarray:
     return result
 
 
-@njit(parallel=True)
+@njit(parallel=True, cache=True)
 def _kernel_1d(psi, result, R, T, p_table, nx):
     for i in prange(nx):
         center = psi[i]
@@ -59,29 +60,22 @@ def _kernel_1d(psi, result, R, T, p_table, nx):
         result[i] = R[i] + T[i]
 
 
-@njit(parallel=True)
+@njit(parallel=True, cache=True)
 def _kernel_2d(psi, result, R, T, p_table, nx, ny):
     for i in prange(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
         for j in range(ny):
-            center = psi[i, j]
-            c = min(int(abs(center) * 50), 499)
-
-            neighbors = [
-                psi[(i - 1) % nx, j],
-                psi[(i + 1) % nx, j],
-                psi[i, (j - 1) % ny],
-                psi[i, (j + 1) % ny],
-            ]
-
-            R_val = 0.0
-            for n in neighbors:
-                R_val += p_table[c] - p_table[min(int(abs(n) * 50), 499)]
-            R[i, j] = R_val
-
-            l = min(int(abs(psi[(i - 1) % nx, j]) * 50), 499)
-            r = min(int(abs(psi[(i + 1) % nx, j]) * 50), 499)
-            u = min(int(abs(psi[i, (j + 1) % ny]) * 50), 499)
+            # Scalar neighbour loads: no per-cell list, each index quantized once
+            c = min(int(abs(psi[i, j]) * 50), 499)
+            l = min(int(abs(psi[im, j]) * 50), 499)
+            r = min(int(abs(psi[ip, j]) * 50), 499)
             d = min(int(abs(psi[i, (j - 1) % ny]) * 50), 499)
+            u = min(int(abs(psi[i, (j + 1) % ny]) * 50), 499)
+
+            pc = p_table[c]
+            R_val = (pc - p_table[l]) + (pc - p_table[r]) + (pc - p_table[d]) + (pc - p_table[u])
+            R[i, j] = R_val
 
             T_val = (p_table[r] - p_table[l]) + (p_table[u] - p_table[d])
             T[i, j] = T_val
@@ -89,35 +83,34 @@ def _kernel_2d(psi, result, R, T, p_table, nx, ny):
             result[i, j] = R_val + T_val
 
 
-@njit(parallel=True)
+@njit(parallel=True, cache=True)
 def _kernel_3d(psi, result, R, T, p_table, nx, ny, nz):
     for i in prange(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
         for j in range(ny):
+            jm = (j - 1) % ny
+            jp = (j + 1) % ny
             for k in range(nz):
-                center = psi[i, j, k]
-                c = min(int(abs(center) * 50), 499)
-
-                neighbors = [
-                    psi[(i - 1) % nx, j, k],
-                    psi[(i + 1) % nx, j, k],
-                    psi[i, (j - 1) % ny, k],
-                    psi[i, (j + 1) % ny, k],
-                    psi[i, j, (k - 1) % nz],
-                    psi[i, j, (k + 1) % nz],
-                ]
-
-                R_val = 0.0
-                for n in neighbors:
-                    R_val += p_table[c] - p_table[min(int(abs(n) * 50), 499)]
+                c = min(int(abs(psi[i, j, k]) * 50), 499)
+                l = min(int(abs(psi[im, j, k]) * 50), 499)
+                r = min(int(abs(psi[ip, j, k]) * 50), 499)
+                d = min(int(abs(psi[i, jm, k]) * 50), 499)
+                u = min(int(abs(psi[i, jp, k]) * 50), 499)
+                b = min(int(abs(psi[i, j, (k - 1) % nz]) * 50), 499)
+                f = min(int(abs(psi[i, j, (k + 1) % nz]) * 50), 499)
+
+                pc = p_table[c]
+                R_val = (
+                    (pc - p_table[l]) + (pc - p_table[r]) + (pc - p_table[d])
+                    + (pc - p_table[u]) + (pc - p_table[b]) + (pc - p_table[f])
+                )
                 R[i, j, k] = R_val
 
                 T_val = (
-                    p_table[min(int(abs(psi[(i + 1) % nx, j, k]) * 50), 499)]
-                    - p_table[min(int(abs(psi[(i - 1) % nx, j, k]) * 50), 499)]
-                    + p_table[min(int(abs(psi[i, (j + 1) % ny, k]) * 50), 499)]
-                    - p_table[min(int(abs(psi[i, (j - 1) % ny, k]) * 50), 499)]
-                    + p_table[min(int(abs(psi[i, j, (k + 1) % nz]) * 50), 499)]
-                    - p_table[min(int(abs(psi[i, j, (k - 1) % nz]) * 50), 499)]
+                    p_table[r] - p_table[l]
+                    + p_table[u] - p_table[d]
+                    + p_table[f] - p_table[b]
                 )
                 T[i, j, k] = T_val
                 result[i, j, k] = R_val + T_val
@@ -5,6 +5,8 @@ from zenoengine.core.operators.curvature import curvature_operator
 from zenoengine.core.operators.torsion import torsion_operator
 from zenoengine.core.operators.nonlinear import nonlinear_operator
 from zenoengine.core.operators.entropy import entropy_operator
+from zenoengine.core.operators.stencil import curvature_torsion
+from zenoengine.core.operators.fused import fused_pgns_operator, term_partials
 
 def symbolic_pgns_operator(
     psi: np.ndarray,
@@ -12,7 +14,17 @@ def symbolic_pgns_operator(
     *,
     lambda_: float = 0.4,
     kappa: float = 0.9,
-    beta: float = 0.3
+    beta: float = 0.3,
+    backend: str = "fused",
+    curv: np.ndarray | None = None,
+    tors: np.ndarray | None = None,
+    entropy: np.ndarray | None = None,
+    nonlinear: np.ndarray | None = None,
+    gathered: np.ndarray | None = None,
+    partials: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+    halo: int = 0,
+    tile: tuple[int, int, int] | None = None
 ) -> np.ndarray:
     """
     PGNS composite operator:
@@ -24,13 +36,63 @@ def symbolic_pgns_operator(
         lambda_: torsion strength
         kappa: nonlinearity strength
         beta: entropy feedback strength
+        backend: "fused" (single-pass kernel), "gather" (quantize once,
+                 then stencil) or "reference" (per-neighbour kernels)
+        curv: optional buffer that receives ℛ[𝒜] (no extra grid sweep)
+        tors: optional buffer that receives 𝒯[𝒜] (no extra grid sweep)
+        entropy: optional buffer that receives 𝒮*[𝒜], gather and reference backends
+                 (the fused backend reports Σ|𝒮*| through `partials`)
+        nonlinear: optional scratch buffer (shape and dtype of the field interior) for
+                   |𝒜|²𝒜 and the scaled terms, gather and reference backends
+        gathered: optional real buffer (shape of `psi`) for the gather backend's P = p[q(𝒜)]
+        partials: optional per-row metric sums of the input state (`metric_partials`
+                  layout; the unfused backends reduce them from ℛ, 𝒯 and 𝒮*)
+        out: optional complex buffer for Δ𝒜 (the fused backend then allocates nothing)
+        halo: ghost-cell width when `psi` is padded storage (fused and gather backends)
+        tile: 3D cache-block shape for the fused backend (ignored by the others)
 
     Returns:
         Δ𝒜: symbolic evolution term
     """
-    R = curvature_operator(psi, dim)
-    T = torsion_operator(psi, dim)
-    N = nonlinear_operator(psi)
-    S = entropy_operator(psi, dim)
+    if backend == "fused":
+        if entropy is not None or nonlinear is not None or gathered is not None:
+            raise ValueError("The fused backend takes no entropy, nonlinear or gathered buffers")
+        return fused_pgns_operator(
+            psi, dim, lambda_=lambda_, kappa=kappa, beta=beta,
+            curv=curv, tors=tors, partials=partials, out=out, halo=halo, tile=tile
+        )
+    if backend == "gather":
+        R, T = curvature_torsion(psi, dim, P=gathered, curv=curv, tors=tors, halo=halo)
+        if halo:
+            psi = psi[(slice(halo, -halo),) * dim]
+    elif halo:
+        raise ValueError(f"Backend '{backend}' does not support padded fields")
+    elif backend == "reference":
+        R = curvature_operator(psi, dim, out=curv)
+        T = torsion_operator(psi, dim, out=tors)
+    else:
+        raise ValueError(f"Unknown PGNS backend: {backend}")
 
-    return -1j * (R + lambda_ * T + kappa * N + beta * S)
+    N = nonlinear_operator(psi, out=nonlinear)
+    S = entropy_operator(psi, dim, out=entropy)
+    if partials is not None:
+        term_partials(psi, R, T, S, partials)
+
+    # -i (ℛ + λ𝒯 + κN + β𝒮*) in the fused kernel's order, without temporaries:
+    # a real ℛ + λ𝒯 goes straight into out.real (no casting buffers), the
+    # other terms are scaled in N (no longer needed once added)
+    if out is None:
+        out = np.empty(psi.shape, dtype=np.result_type(psi.dtype, np.complex64))
+    if np.iscomplexobj(R) or np.iscomplexobj(T):
+        # The reference kernels allocate ℛ and 𝒯 like 𝒜 when no buffers are given
+        np.multiply(T, lambda_, out=out)
+        np.add(R, out, out=out)
+    else:
+        np.multiply(T, lambda_, out=out.real)
+        np.add(R, out.real, out=out.real)
+        out.imag.fill(0)
+    np.multiply(N, kappa, out=N)
+    np.add(out, N, out=out)
+    np.multiply(S, beta, out=N)
+    np.add(out, N, out=out)
+    return np.multiply(out, -1j, out=out)
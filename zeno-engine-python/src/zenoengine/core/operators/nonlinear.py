@@ -1,9 +1,9 @@
 from __future__ import annotations
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
-@njit
-def nonlinear_operator(values: np.ndarray) -> np.ndarray:
+
+def nonlinear_operator(values: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
     """
     Symbolic self-focusing / nonlinear term: |𝒜|² · 𝒜
 
@@ -12,8 +12,26 @@ def nonlinear_operator(values: np.ndarray) -> np.ndarray:
 
     Args:
         values: input psi field
+        out: optional preallocated result buffer with the same shape as `values`
 
     Returns:
         |𝒜|² · 𝒜 term
     """
-    return np.abs(values)**2 * values
+    if out is None:
+        out = np.empty_like(values)
+    elif out.shape != values.shape:
+        raise ValueError(f"out has shape {out.shape}, expected {values.shape}")
+
+    # reshape(-1) of a strided array is a copy, so a strided `out` is filled aside and copied back
+    flat = out.reshape(-1) if out.flags.c_contiguous else np.empty(out.size, dtype=out.dtype)
+    _nonlinear_flat(np.ravel(values), flat)
+    if not out.flags.c_contiguous:
+        out[...] = flat.reshape(out.shape)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _nonlinear_flat(values, out):
+    for i in prange(values.size):
+        v = values[i]
+        out[i] = abs(v) ** 2 * v
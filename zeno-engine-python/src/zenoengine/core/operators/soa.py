@@ -0,0 +1,221 @@
+from __future__ import annotations
+import math
+
+import numpy as np
+from numba import njit, prange
+
+from zenoengine.core.partition_geometry import (
+    PARTITION_TABLE_SIZE,
+    QUANTIZATION_SCALE,
+    get_partition_table,
+)
+from zenoengine.core.operators.fused import _acc
+
+_SCALE = QUANTIZATION_SCALE
+_TOP = PARTITION_TABLE_SIZE - 1
+
+
+def soa_pgns_operator(
+    re: np.ndarray,
+    im: np.ndarray,
+    dim: int,
+    *,
+    lambda_: float = 0.4,
+    kappa: float = 0.9,
+    beta: float = 0.3,
+    p_table: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+    partials: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Fused PGNS operator on a structure-of-arrays complex field.
+
+    Same result as `fused_pgns_operator` on `re + 1j*im`, but the field and
+    Δ𝒜 live in separate real and imaginary planes and every term is written
+    out in real arithmetic, so the kernels stream unit-stride real arrays
+    instead of interleaved complex pairs.
+
+    Args:
+        re, im: real and imaginary planes of a bare periodic field
+        dim: spatial dimension (1–3)
+        lambda_, kappa, beta: PGNS coefficients
+        p_table: partition lookup table (defaults to the shared table in the planes' dtype)
+        out: optional (2, *shape) buffer receiving Re Δ𝒜 and Im Δ𝒜
+        partials: optional per-row metric sums (see `metric_partials`)
+
+    Returns:
+        (2, *shape) array of Re Δ𝒜, Im Δ𝒜
+    """
+    if re.shape != im.shape or re.dtype != im.dtype:
+        raise ValueError("Real and imaginary planes must share shape and dtype")
+    if re.ndim != dim or dim not in (1, 2, 3):
+        raise ValueError(f"Field has {re.ndim} dimensions, expected {dim} (1–3)")
+    if p_table is None:
+        p_table = get_partition_table(dtype=re.dtype)
+    if out is None:
+        out = np.empty((2,) + re.shape, dtype=re.dtype)
+    if partials is not None and partials.shape != (re.shape[0], 4):
+        raise ValueError(f"partials must have shape ({re.shape[0]}, 4)")
+
+    kernel = (_soa_pgns_1d, _soa_pgns_2d, _soa_pgns_3d)[dim - 1]
+    kernel(re, im, p_table, lambda_, kappa, beta, out[0], out[1], partials)
+    return out
+
+
+# --- Real-arithmetic per-cell terms ----------------------------------------
+
+@njit(inline="always")
+def _p(p_table, a, b):
+    return p_table[min(int(math.hypot(a, b) * _SCALE), _TOP)]
+
+
+@njit(inline="always")
+def _csqrt(x, y):
+    # Principal √(x + iy); the division form avoids cancellation on either half-plane
+    r = math.hypot(x, y)
+    if r == 0.0:
+        return 0.0, y
+    if x >= 0.0:
+        sr = math.sqrt(0.5 * (r + x))
+        return sr, 0.5 * y / sr
+    si = math.copysign(math.sqrt(0.5 * (r - x)), y)
+    return 0.5 * y / si, si
+
+
+@njit(inline="always")
+def _terms(a, b, R, T, g2r, g2i, lam, kap, beta):
+    # Δ = -i (R + λT + κ|𝒜|²𝒜 + β𝒮*) with 𝒮* = -√(Σ g²)·𝒜, split into real parts
+    n2 = a * a + b * b
+    sr, si = _csqrt(g2r, g2i)
+    Sr = -(sr * a - si * b)
+    Si = -(sr * b + si * a)
+    Xr = R + lam * T + kap * (n2 * a) + beta * Sr
+    Xi = kap * (n2 * b) + beta * Si
+    return Xi, -Xr, Sr, Si
+
+
+# --- Periodic kernels -------------------------------------------------------
+
+@njit(parallel=True, cache=True)
+def _soa_pgns_1d(xr, xi, p_table, lam, kap, beta, dr, di, partials):
+    nx = xr.shape[0]
+    for i in prange(nx):
+        l = (i - 1) % nx
+        r = (i + 1) % nx
+        a = xr[i]
+        b = xi[i]
+        pc = _p(p_table, a, b)
+        pl = _p(p_table, xr[l], xi[l])
+        pr = _p(p_table, xr[r], xi[r])
+        R = 2 * pc - pl - pr
+        T = pr - pl
+
+        gr = 0.5 * (xr[r] - xr[l])
+        gi = 0.5 * (xi[r] - xi[l])
+        dre, dim_, Sr, Si = _terms(a, b, R, T, gr * gr - gi * gi, 2.0 * gr * gi, lam, kap, beta)
+        dr[i] = dre
+        di[i] = dim_
+        if partials is not None:
+            partials[i, 0] = math.hypot(a, b)
+            partials[i, 1] = abs(R)
+            partials[i, 2] = abs(T)
+            partials[i, 3] = math.hypot(Sr, Si)
+
+
+@njit(parallel=True, cache=True)
+def _soa_pgns_2d(xr, xi, p_table, lam, kap, beta, dr, di, partials):
+    nx, ny = xr.shape
+    for i in prange(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        e_psi = 0.0
+        e_R = 0.0
+        e_T = 0.0
+        e_S = 0.0
+        for j in range(ny):
+            jm = j - 1 if j > 0 else ny - 1
+            jp = j + 1 if j < ny - 1 else 0
+
+            a = xr[i, j]
+            b = xi[i, j]
+            pc = _p(p_table, a, b)
+            pl = _p(p_table, xr[im, j], xi[im, j])
+            pr = _p(p_table, xr[ip, j], xi[ip, j])
+            pd = _p(p_table, xr[i, jm], xi[i, jm])
+            pu = _p(p_table, xr[i, jp], xi[i, jp])
+            R = (pc - pl) + (pc - pr) + (pc - pd) + (pc - pu)
+            T = (pr - pl) + (pu - pd)
+
+            gxr = 0.5 * (xr[ip, j] - xr[im, j])
+            gxi = 0.5 * (xi[ip, j] - xi[im, j])
+            gyr = 0.5 * (xr[i, jp] - xr[i, jm])
+            gyi = 0.5 * (xi[i, jp] - xi[i, jm])
+            g2r = (gxr * gxr - gxi * gxi) + (gyr * gyr - gyi * gyi)
+            g2i = 2.0 * gxr * gxi + 2.0 * gyr * gyi
+            dre, dim_, Sr, Si = _terms(a, b, R, T, g2r, g2i, lam, kap, beta)
+            dr[i, j] = dre
+            di[i, j] = dim_
+            if partials is not None:
+                e_psi = _acc(e_psi, math.hypot(a, b))
+                e_R = _acc(e_R, abs(R))
+                e_T = _acc(e_T, abs(T))
+                e_S = _acc(e_S, math.hypot(Sr, Si))
+
+        if partials is not None:
+            partials[i, 0] = e_psi
+            partials[i, 1] = e_R
+            partials[i, 2] = e_T
+            partials[i, 3] = e_S
+
+
+@njit(parallel=True, cache=True)
+def _soa_pgns_3d(xr, xi, p_table, lam, kap, beta, dr, di, partials):
+    nx, ny, nz = xr.shape
+    for i in prange(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        e_psi = 0.0
+        e_R = 0.0
+        e_T = 0.0
+        e_S = 0.0
+        for j in range(ny):
+            jm = (j - 1) % ny
+            jp = (j + 1) % ny
+            for k in range(nz):
+                km = k - 1 if k > 0 else nz - 1
+                kp = k + 1 if k < nz - 1 else 0
+
+                a = xr[i, j, k]
+                b = xi[i, j, k]
+                pc = _p(p_table, a, b)
+                pl = _p(p_table, xr[im, j, k], xi[im, j, k])
+                pr = _p(p_table, xr[ip, j, k], xi[ip, j, k])
+                pd = _p(p_table, xr[i, jm, k], xi[i, jm, k])
+                pu = _p(p_table, xr[i, jp, k], xi[i, jp, k])
+                pb = _p(p_table, xr[i, j, km], xi[i, j, km])
+                pf = _p(p_table, xr[i, j, kp], xi[i, j, kp])
+                R = (pc - pl) + (pc - pr) + (pc - pd) + (pc - pu) + (pc - pb) + (pc - pf)
+                T = pr - pl + pu - pd + pf - pb
+
+                gxr = 0.5 * (xr[ip, j, k] - xr[im, j, k])
+                gxi = 0.5 * (xi[ip, j, k] - xi[im, j, k])
+                gyr = 0.5 * (xr[i, jp, k] - xr[i, jm, k])
+                gyi = 0.5 * (xi[i, jp, k] - xi[i, jm, k])
+                gzr = 0.5 * (xr[i, j, kp] - xr[i, j, km])
+                gzi = 0.5 * (xi[i, j, kp] - xi[i, j, km])
+                g2r = (gxr * gxr - gxi * gxi) + (gyr * gyr - gyi * gyi) + (gzr * gzr - gzi * gzi)
+                g2i = 2.0 * gxr * gxi + 2.0 * gyr * gyi + 2.0 * gzr * gzi
+                dre, dim_, Sr, Si = _terms(a, b, R, T, g2r, g2i, lam, kap, beta)
+                dr[i, j, k] = dre
+                di[i, j, k] = dim_
+                if partials is not None:
+                    e_psi = _acc(e_psi, math.hypot(a, b))
+                    e_R = _acc(e_R, abs(R))
+                    e_T = _acc(e_T, abs(T))
+                    e_S = _acc(e_S, math.hypot(Sr, Si))
+
+        if partials is not None:
+            partials[i, 0] = e_psi
+            partials[i, 1] = e_R
+            partials[i, 2] = e_T
+            partials[i, 3] = e_S
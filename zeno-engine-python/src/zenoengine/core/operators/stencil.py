@@ -0,0 +1,253 @@
+from __future__ import annotations
+import numpy as np
+from numba import njit, prange
+
+from zenoengine.core.partition_geometry import (
+    PARTITION_TABLE_SIZE,
+    QUANTIZATION_SCALE,
+    get_partition_table,
+)
+from zenoengine.core.precision import real_dtype
+
+_SCALE = QUANTIZATION_SCALE
+_TOP = PARTITION_TABLE_SIZE - 1
+
+
+def partition_field(
+    psi: np.ndarray,
+    p_table: np.ndarray | None = None,
+    out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Gather stage: P = p_table[q(ψ)] with q(ψ) = min(int(|ψ|·50), 499).
+
+    Every cell is quantized and looked up exactly once per step, so the
+    stencil stage that follows only does linear arithmetic on P.
+
+    Args:
+        psi: field values (real or complex, any dimension)
+        p_table: partition lookup table (defaults to the shared cached table)
+        out: optional real buffer with the same shape as `psi` (a strided
+             view, e.g. a halo interior, is filled through a contiguous copy)
+
+    Returns:
+        P: partition-weighted field, same shape as `psi`
+    """
+    if p_table is None:
+        p_table = get_partition_table(dtype=real_dtype(psi.dtype))
+    if out is None:
+        out = np.empty(psi.shape, dtype=p_table.dtype)
+    elif out.shape != psi.shape:
+        raise ValueError(f"out has shape {out.shape}, expected {psi.shape}")
+
+    # reshape(-1) of a strided array is a copy, so a strided `out` is gathered aside and copied back
+    flat = out.reshape(-1) if out.flags.c_contiguous else np.empty(out.size, dtype=out.dtype)
+    _gather_flat(np.ravel(psi), p_table, flat)
+    if not out.flags.c_contiguous:
+        out[...] = flat.reshape(out.shape)
+    return out
+
+
+def pgns_stencil(
+    P: np.ndarray,
+    curv: np.ndarray | None = None,
+    tors: np.ndarray | None = None,
+    halo: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stencil stage on a gathered field P (periodic boundaries):
+        ℛ = Σₙ (P[c] − P[n])          (partition Laplacian)
+        𝒯 = Σ_axes (P[+1] − P[−1])    (central difference)
+
+    Args:
+        P: output of `partition_field`
+        curv: optional buffer for ℛ
+        tors: optional buffer for 𝒯
+        halo: ghost-cell width if P was gathered from padded storage;
+              ℛ and 𝒯 then cover the interior only
+
+    Returns:
+        (ℛ, 𝒯)
+    """
+    if P.ndim not in (1, 2, 3):
+        raise ValueError("Unsupported dimension for pgns_stencil")
+
+    if halo > 1:
+        P = P[(slice(halo - 1, 1 - halo),) * P.ndim]
+    shape = tuple(n - 2 for n in P.shape) if halo else P.shape
+    if curv is None:
+        curv = np.empty(shape, dtype=P.dtype)
+    if tors is None:
+        tors = np.empty(shape, dtype=P.dtype)
+
+    kernels = _PADDED_KERNELS if halo else _PERIODIC_KERNELS
+    kernels[P.ndim - 1](P, curv, tors)
+
+    return curv, tors
+
+
+def curvature_torsion(
+    psi: np.ndarray,
+    dim: int,
+    *,
+    p_table: np.ndarray | None = None,
+    P: np.ndarray | None = None,
+    curv: np.ndarray | None = None,
+    tors: np.ndarray | None = None,
+    halo: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gather-then-stencil evaluation of ℛ[𝒜] and 𝒯[𝒜].
+
+    Produces the same values as the per-neighbour reference kernels in
+    `legacy_symbolic_pgns` with one quantize + lookup per cell instead of
+    one per neighbour access. With `halo` > 0, `psi` is padded storage
+    whose ghost layers are already filled.
+    """
+    if psi.ndim != dim:
+        raise ValueError(f"Field has {psi.ndim} dimensions, expected {dim}")
+
+    if not psi.flags.c_contiguous:
+        psi = np.ascontiguousarray(psi)
+    P = partition_field(psi, p_table, out=P)
+    return pgns_stencil(P, curv, tors, halo=halo)
+
+
+@njit(parallel=True, cache=True)
+def _gather_flat(psi, p_table, P):
+    for i in prange(psi.size):
+        P[i] = p_table[min(int(abs(psi[i]) * _SCALE), _TOP)]
+
+
+@njit(parallel=True, cache=True)
+def _stencil_1d(P, curv, tors):
+    nx = P.shape[0]
+    for i in prange(nx):
+        pc = P[i]
+        pl = P[(i - 1) % nx]
+        pr = P[(i + 1) % nx]
+        curv[i] = 2 * pc - pl - pr
+        tors[i] = pr - pl
+
+
+@njit(inline="always")
+def _stencil_row_2d(P, curv, tors, i, im, ip, ny):
+    # Interior columns are modulo-free so the j loop can vectorize;
+    # the two wrap-around columns are peeled off below.
+    for j in range(1, ny - 1):
+        pc = P[i, j]
+        pl = P[im, j]
+        pr = P[ip, j]
+        pd = P[i, j - 1]
+        pu = P[i, j + 1]
+        curv[i, j] = (pc - pl) + (pc - pr) + (pc - pd) + (pc - pu)
+        tors[i, j] = (pr - pl) + (pu - pd)
+
+    for j in (0, ny - 1):
+        pc = P[i, j]
+        pl = P[im, j]
+        pr = P[ip, j]
+        pd = P[i, (j - 1) % ny]
+        pu = P[i, (j + 1) % ny]
+        curv[i, j] = (pc - pl) + (pc - pr) + (pc - pd) + (pc - pu)
+        tors[i, j] = (pr - pl) + (pu - pd)
+
+
+@njit(parallel=True, cache=True)
+def _stencil_2d(P, curv, tors):
+    nx, ny = P.shape
+    for i in prange(nx):
+        _stencil_row_2d(P, curv, tors, i, (i - 1) % nx, (i + 1) % nx, ny)
+
+
+@njit(inline="always")
+def _stencil_line_3d(P, curv, tors, i, j, im, ip, jm, jp, nz):
+    for k in range(1, nz - 1):
+        pc = P[i, j, k]
+        pl = P[im, j, k]
+        pr = P[ip, j, k]
+        pd = P[i, jm, k]
+        pu = P[i, jp, k]
+        pb = P[i, j, k - 1]
+        pf = P[i, j, k + 1]
+        curv[i, j, k] = (
+            (pc - pl) + (pc - pr) + (pc - pd) + (pc - pu) + (pc - pb) + (pc - pf)
+        )
+        tors[i, j, k] = pr - pl + pu - pd + pf - pb
+
+    for k in (0, nz - 1):
+        pc = P[i, j, k]
+        pl = P[im, j, k]
+        pr = P[ip, j, k]
+        pd = P[i, jm, k]
+        pu = P[i, jp, k]
+        pb = P[i, j, (k - 1) % nz]
+        pf = P[i, j, (k + 1) % nz]
+        curv[i, j, k] = (
+            (pc - pl) + (pc - pr) + (pc - pd) + (pc - pu) + (pc - pb) + (pc - pf)
+        )
+        tors[i, j, k] = pr - pl + pu - pd + pf - pb
+
+
+@njit(parallel=True, cache=True)
+def _stencil_3d(P, curv, tors):
+    nx, ny, nz = P.shape
+    for i in prange(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        for j in range(ny):
+            _stencil_line_3d(P, curv, tors, i, j, im, ip, (j - 1) % ny, (j + 1) % ny, nz)
+
+
+# Padded variants: P carries one ghost layer per side, outputs are interior-sized
+@njit(parallel=True, cache=True)
+def _stencil_padded_1d(P, curv, tors):
+    for i in prange(curv.shape[0]):
+        x = i + 1
+        pc = P[x]
+        pl = P[x - 1]
+        pr = P[x + 1]
+        curv[i] = 2 * pc - pl - pr
+        tors[i] = pr - pl
+
+
+@njit(parallel=True, cache=True)
+def _stencil_padded_2d(P, curv, tors):
+    nx, ny = curv.shape
+    for i in prange(nx):
+        x = i + 1
+        for j in range(ny):
+            y = j + 1
+            pc = P[x, y]
+            pl = P[x - 1, y]
+            pr = P[x + 1, y]
+            pd = P[x, y - 1]
+            pu = P[x, y + 1]
+            curv[i, j] = (pc - pl) + (pc - pr) + (pc - pd) + (pc - pu)
+            tors[i, j] = (pr - pl) + (pu - pd)
+
+
+@njit(parallel=True, cache=True)
+def _stencil_padded_3d(P, curv, tors):
+    nx, ny, nz = curv.shape
+    for i in prange(nx):
+        x = i + 1
+        for j in range(ny):
+            y = j + 1
+            for k in range(nz):
+                z = k + 1
+                pc = P[x, y, z]
+                pl = P[x - 1, y, z]
+                pr = P[x + 1, y, z]
+                pd = P[x, y - 1, z]
+                pu = P[x, y + 1, z]
+                pb = P[x, y, z - 1]
+                pf = P[x, y, z + 1]
+                curv[i, j, k] = (
+                    (pc - pl) + (pc - pr) + (pc - pd) + (pc - pu) + (pc - pb) + (pc - pf)
+                )
+                tors[i, j, k] = pr - pl + pu - pd + pf - pb
+
+
+_PERIODIC_KERNELS = (_stencil_1d, _stencil_2d, _stencil_3d)
+_PADDED_KERNELS = (_stencil_padded_1d, _stencil_padded_2d, _stencil_padded_3d)
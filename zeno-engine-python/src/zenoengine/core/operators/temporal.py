@@ -0,0 +1,139 @@
+from __future__ import annotations
+import numpy as np
+from numba import njit, prange
+
+from zenoengine.core.partition_geometry import get_partition_table
+from zenoengine.core.precision import real_dtype
+from zenoengine.core.operators.fused import _acc, _cell_3d, _clamp_tile, partial_rows
+
+# Redundant halo work per tile is ((t + 2k) / t)³; 32³ keeps it under 1.6× for k ≤ 4
+DEFAULT_TEMPORAL_TILE = (32, 32, 32)
+
+
+def advance_pgns_blocked(
+    psi: np.ndarray,
+    steps: int,
+    dt: float,
+    *,
+    lambda_: float = 0.4,
+    kappa: float = 0.9,
+    beta: float = 0.3,
+    p_table: np.ndarray | None = None,
+    tile: tuple[int, int, int] | None = None,
+    out: np.ndarray | None = None,
+    partials: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Advance a periodic 3D field by `steps` forward-Euler PGNS steps in one sweep.
+
+    Each tile is gathered once with a `steps`-wide periodic halo, stepped
+    locally (the valid region shrinks by one cell per step) and written back
+    once, so the grid crosses DRAM twice per `steps` steps instead of several
+    times per step. Every cell sees the same operands in the same order as
+    `fused_pgns_operator` followed by `ψ += Δ·dt`, so the result is bitwise
+    identical to stepping one at a time.
+
+    Args:
+        psi: complex 3D field at the start of the block (not modified)
+        steps: number of steps to advance
+        dt: timestep
+        lambda_, kappa, beta: PGNS coefficients
+        p_table: partition lookup table (defaults to the shared cached table)
+        tile: interior tile shape (defaults to DEFAULT_TEMPORAL_TILE)
+        out: optional buffer for the advanced field (must not alias `psi`)
+        partials: optional (partial_rows(psi.shape, tile), 4) buffer receiving
+                  per-tile metric sums of the last step, as in the fused kernel
+
+    Returns:
+        ψ after `steps` steps
+    """
+    if psi.ndim != 3:
+        raise ValueError("Temporal blocking is implemented for 3D fields only")
+    if not np.iscomplexobj(psi):
+        raise ValueError("Temporal blocking needs complex field storage (Δ is complex)")
+    if steps < 1:
+        raise ValueError("steps must be at least 1")
+    if p_table is None:
+        p_table = get_partition_table(dtype=real_dtype(psi.dtype))
+    if tile is None:
+        tile = DEFAULT_TEMPORAL_TILE
+    if out is None:
+        out = np.empty_like(psi)
+    elif np.shares_memory(out, psi):
+        raise ValueError("out must not alias psi: tiles read their neighbours' old values")
+
+    rows = partial_rows(psi.shape, tile)
+    if partials is not None and partials.shape != (rows, 4):
+        raise ValueError(f"partials must have shape ({rows}, 4)")
+
+    ti, tj, tk = _clamp_tile(tile, psi.shape)
+    _advance_tiled_3d(psi, out, p_table, lambda_, kappa, beta, dt, steps, partials, ti, tj, tk)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _advance_tiled_3d(src, dst, p_table, lam, kap, beta, dt, steps, partials, ti, tj, tk):
+    nx, ny, nz = src.shape
+    h = steps
+    bx = (nx + ti - 1) // ti
+    by = (ny + tj - 1) // tj
+    bz = (nz + tk - 1) // tk
+    for t in prange(bx * by * bz):
+        i0 = (t // (by * bz)) * ti
+        j0 = ((t // bz) % by) * tj
+        k0 = (t % bz) * tk
+        ni = min(i0 + ti, nx) - i0
+        nj = min(j0 + tj, ny) - j0
+        nk = min(k0 + tk, nz) - k0
+        li = ni + 2 * h
+        lj = nj + 2 * h
+        lk = nk + 2 * h
+
+        # One tile-sized scratch pair per tile, not per cell
+        a = np.empty((li, lj, lk), dtype=src.dtype)
+        d = np.empty((li, lj, lk), dtype=src.dtype)
+
+        for x in range(li):
+            gi = (i0 - h + x) % nx
+            for y in range(lj):
+                gj = (j0 - h + y) % ny
+                for z in range(lk):
+                    a[x, y, z] = src[gi, gj, (k0 - h + z) % nz]
+
+        e_psi = 0.0
+        e_R = 0.0
+        e_T = 0.0
+        e_S = 0.0
+        for s in range(steps):
+            # Cells [s + 1, L - s - 1) still have valid neighbours after s steps
+            last = s == steps - 1
+            for x in range(s + 1, li - s - 1):
+                for y in range(s + 1, lj - s - 1):
+                    for z in range(s + 1, lk - s - 1):
+                        c = a[x, y, z]
+                        delta, R, T, S = _cell_3d(
+                            c, a[x - 1, y, z], a[x + 1, y, z], a[x, y - 1, z], a[x, y + 1, z],
+                            a[x, y, z - 1], a[x, y, z + 1], p_table, lam, kap, beta
+                        )
+                        d[x, y, z] = delta
+                        if last and partials is not None:
+                            e_psi = _acc(e_psi, abs(c))
+                            e_R = _acc(e_R, abs(R))
+                            e_T = _acc(e_T, abs(T))
+                            e_S = _acc(e_S, abs(S))
+
+            for x in range(s + 1, li - s - 1):
+                for y in range(s + 1, lj - s - 1):
+                    for z in range(s + 1, lk - s - 1):
+                        a[x, y, z] += d[x, y, z] * dt
+
+        for x in range(ni):
+            for y in range(nj):
+                for z in range(nk):
+                    dst[i0 + x, j0 + y, k0 + z] = a[h + x, h + y, h + z]
+
+        if partials is not None:
+            partials[t, 0] = e_psi
+            partials[t, 1] = e_R
+            partials[t, 2] = e_T
+            partials[t, 3] = e_S
@@ -2,7 +2,7 @@ from __future__ import annotations
 import numpy as np
 from zenoengine.fields.field import SymbolicField
 
-def torsion_operator(field: SymbolicField) -> np.ndarray:
+def torsion_operator(field: SymbolicField, out: np.ndarray | None = None) -> np.ndarray:
     """
     Symbolic torsion operator 𝒯[𝒜].
 
@@ -11,11 +11,15 @@ def torsion_operator(field: SymbolicField) -> np.ndarray:
     In 3D:  placeholder for Clifford-style torsion (∇ ∧ 𝒜)
 
     Eventually replaced with full multivector field logic.
+
+    `out` may be a preallocated buffer; the differences are accumulated
+    into it slice by slice, so no rolled copies of 𝒜 are made.
     """
     A = field.values
     dim = field.config.dimension
 
-    torsion = np.zeros_like(A)
+    torsion = out if out is not None else np.empty_like(A)
+    torsion[...] = 0
 
     if dim == 1:
         # No rotational structure in 1D
@@ -23,15 +27,33 @@ def torsion_operator(field: SymbolicField) -> np.ndarray:
 
     elif dim == 2:
         # Symbolic antisymmetric curl: ∂x - ∂y
-        dx = np.roll(A, -1, axis=0) - np.roll(A, 1, axis=0)
-        dy = np.roll(A, -1, axis=1) - np.roll(A, 1, axis=1)
-        torsion = dx - dy
+        _add_central_difference(A, torsion, axis=0, sign=1)
+        _add_central_difference(A, torsion, axis=1, sign=-1)
 
     elif dim == 3:
         # Approximate symbolic twist: Clifford commutator-inspired
-        dx = np.roll(A, -1, axis=0) - np.roll(A, 1, axis=0)
-        dy = np.roll(A, -1, axis=1) - np.roll(A, 1, axis=1)
-        dz = np.roll(A, -1, axis=2) - np.roll(A, 1, axis=2)
-        torsion = dx + dy - dz  # placeholder — upgrade later to multivector
+        _add_central_difference(A, torsion, axis=0, sign=1)
+        _add_central_difference(A, torsion, axis=1, sign=1)
+        _add_central_difference(A, torsion, axis=2, sign=-1)  # placeholder — upgrade later to multivector
 
     return torsion
+
+
+def _add_central_difference(A: np.ndarray, out: np.ndarray, axis: int, sign: int) -> None:
+    """
+    out += sign · (roll(A, -1, axis) - roll(A, 1, axis)), computed on slices in place.
+    """
+    n = A.shape[axis]
+    forward_op, backward_op = (np.add, np.subtract) if sign > 0 else (np.subtract, np.add)
+
+    def sl(start: int | None, stop: int | None) -> tuple[slice, ...]:
+        index = [slice(None)] * A.ndim
+        index[axis] = slice(start, stop)
+        return tuple(index)
+
+    # forward neighbour: A[i + 1], wrapping the last cell to the first
+    forward_op(out[sl(None, n - 1)], A[sl(1, None)], out=out[sl(None, n - 1)])
+    forward_op(out[sl(n - 1, None)], A[sl(None, 1)], out=out[sl(n - 1, None)])
+    # backward neighbour: A[i - 1], wrapping the first cell to the last
+    backward_op(out[sl(1, None)], A[sl(None, n - 1)], out=out[sl(1, None)])
+    backward_op(out[sl(None, 1)], A[sl(n - 1, None)], out=out[sl(None, 1)])
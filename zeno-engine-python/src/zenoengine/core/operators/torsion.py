@@ -1,11 +1,19 @@
 from __future__ import annotations
 import numpy as np
-from numba import njit
-from zenoengine.core.partition_geometry import partition_table
+from numba import njit, prange
+from zenoengine.core.partition_geometry import (
+    PARTITION_TABLE_SIZE,
+    QUANTIZATION_SCALE,
+    get_partition_table,
+)
 
+# Built once per process; numba freezes it into the kernel as a read-only constant
+_P_TABLE = get_partition_table()
+_SCALE = QUANTIZATION_SCALE
+_TOP = PARTITION_TABLE_SIZE - 1
 
-@njit
-def torsion_operator(values: np.ndarray, dim: int) -> np.ndarray:
+
+def torsion_operator(values: np.ndarray, dim: int, out: np.ndarray | None = None) -> np.ndarray:
     """
     Computes symbolic torsion 𝒯[𝒜] from the field values using partition geometry.
 
@@ -14,51 +22,85 @@ def torsion_operator(values: np.ndarray, dim: int) -> np.ndarray:
     Args:
         values: ndarray of real values representing the field ψ or 𝒜.
         dim: Spatial dimension (1, 2, or 3).
+        out: Optional preallocated result buffer with the same shape as `values`.
 
     Returns:
         ndarray of the same shape as `values` containing the torsion values.
     """
-    shape = values.shape
-    p_table = partition_table(500)
-    result = np.zeros_like(values)
+    if dim not in (1, 2, 3) or values.ndim != dim:
+        raise ValueError("Unsupported dimension for torsion_operator")
+    if out is None:
+        out = np.zeros_like(values)
 
     if dim == 1:
-        nx = shape[0]
-        for i in range(nx):
-            l = min(int(abs(values[(i - 1) % nx]) * 50), 499)
-            r = min(int(abs(values[(i + 1) % nx]) * 50), 499)
-            result[i] = p_table[r] - p_table[l]
-
+        _torsion_1d(values, out)
     elif dim == 2:
-        nx, ny = shape
-        for i in range(nx):
-            for j in range(ny):
-                l = min(int(abs(values[(i - 1) % nx, j]) * 50), 499)
-                r = min(int(abs(values[(i + 1) % nx, j]) * 50), 499)
-                d = min(int(abs(values[i, (j - 1) % ny]) * 50), 499)
-                u = min(int(abs(values[i, (j + 1) % ny]) * 50), 499)
-
-                result[i, j] = (p_table[r] - p_table[l]) + (p_table[u] - p_table[d])
-
-    elif dim == 3:
-        nx, ny, nz = shape
-        for i in range(nx):
-            for j in range(ny):
-                for k in range(nz):
-                    l = min(int(abs(values[(i - 1) % nx, j, k]) * 50), 499)
-                    r = min(int(abs(values[(i + 1) % nx, j, k]) * 50), 499)
-                    d = min(int(abs(values[i, (j - 1) % ny, k]) * 50), 499)
-                    u = min(int(abs(values[i, (j + 1) % ny, k]) * 50), 499)
-                    b = min(int(abs(values[i, j, (k - 1) % nz]) * 50), 499)
-                    f = min(int(abs(values[i, j, (k + 1) % nz]) * 50), 499)
-
-                    result[i, j, k] = (
-                        (p_table[r] - p_table[l])
-                        + (p_table[u] - p_table[d])
-                        + (p_table[f] - p_table[b])
-                    )
-
+        _torsion_2d(values, out)
     else:
-        raise ValueError("Unsupported dimension for torsion_operator")
+        _torsion_3d(values, out)
+
+    return out
+
+
+@njit(inline="always")
+def _p(p_table, x):
+    return p_table[min(int(abs(x) * _SCALE), _TOP)]
+
+
+# Interior columns are modulo-free so the innermost loop can vectorize;
+# the wrap-around columns are peeled (see curvature.py).
+
+@njit(cache=True)
+def _torsion_1d(values, result):
+    p_table = _P_TABLE
+    nx = values.shape[0]
+    for i in range(1, nx - 1):
+        result[i] = _p(p_table, values[i + 1]) - _p(p_table, values[i - 1])
+
+    for i in (0, nx - 1):
+        result[i] = _p(p_table, values[(i + 1) % nx]) - _p(p_table, values[(i - 1) % nx])
+
+
+@njit(cache=True)
+def _torsion_2d(values, result):
+    p_table = _P_TABLE
+    nx, ny = values.shape
+    for i in range(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        for j in range(1, ny - 1):
+            result[i, j] = (
+                (_p(p_table, values[ip, j]) - _p(p_table, values[im, j]))
+                + (_p(p_table, values[i, j + 1]) - _p(p_table, values[i, j - 1]))
+            )
+
+        for j in (0, ny - 1):
+            result[i, j] = (
+                (_p(p_table, values[ip, j]) - _p(p_table, values[im, j]))
+                + (_p(p_table, values[i, (j + 1) % ny]) - _p(p_table, values[i, (j - 1) % ny]))
+            )
+
+
+@njit(parallel=True, cache=True)
+def _torsion_3d(values, result):
+    p_table = _P_TABLE
+    nx, ny, nz = values.shape
+    for i in prange(nx):
+        im = (i - 1) % nx
+        ip = (i + 1) % nx
+        for j in range(ny):
+            jm = (j - 1) % ny
+            jp = (j + 1) % ny
+            for k in range(1, nz - 1):
+                result[i, j, k] = (
+                    (_p(p_table, values[ip, j, k]) - _p(p_table, values[im, j, k]))
+                    + (_p(p_table, values[i, jp, k]) - _p(p_table, values[i, jm, k]))
+                    + (_p(p_table, values[i, j, k + 1]) - _p(p_table, values[i, j, k - 1]))
+                )
 
-    return result
+            for k in (0, nz - 1):
+                result[i, j, k] = (
+                    (_p(p_table, values[ip, j, k]) - _p(p_table, values[im, j, k]))
+                    + (_p(p_table, values[i, jp, k]) - _p(p_table, values[i, jm, k]))
+                    + (_p(p_table, values[i, j, (k + 1) % nz]) - _p(p_table, values[i, j, (k - 1) % nz]))
+                )
@@ -1,7 +1,15 @@
 from __future__ import annotations
+import os
 import numpy as np
 from functools import lru_cache
 
+# Quantization used by every partition-geometry stencil: q(ψ) = min(int(|ψ|·50), 499)
+PARTITION_TABLE_SIZE = 500
+QUANTIZATION_SCALE = 50.0
+
+# In-process table cache: one table per dtype, sliced to the size a caller asks for
+_PARTITION_TABLES: dict[str, np.ndarray] = {}
+
 
 @lru_cache(maxsize=2048)
 def partition(n: int) -> int:
@@ -55,6 +63,69 @@ def partition_table(max_n: int = 500) -> np.ndarray:
 
     return p
 
+
+def get_partition_table(
+    max_n: int = PARTITION_TABLE_SIZE,
+    dtype: np.dtype | type = np.float64,
+    cache_dir: str | None = None,
+) -> np.ndarray:
+    """
+    Shared, read-only partition lookup table p(0)..p(max_n).
+
+    One table per dtype is kept for the life of the process, covering at
+    least p(0)..p(PARTITION_TABLE_SIZE); smaller requests get a view of
+    its head, larger ones regrow it (doubling) in place of the old one.
+    When `cache_dir` (or $ZENO_CACHE_DIR) is set, built tables are also
+    persisted as .npy so later processes skip the Euler recurrence.
+
+    Args:
+        max_n: largest partition index needed.
+        dtype: element type of the returned table.
+        cache_dir: optional directory for the on-disk cache.
+
+    Returns:
+        Non-writeable ndarray of shape (max_n + 1,), safe to pass to njit kernels.
+    """
+    dtype = np.dtype(dtype)
+    max_n = int(max_n)
+    table = _PARTITION_TABLES.get(dtype.str)
+    if table is None or table.shape[0] <= max_n:
+        size = PARTITION_TABLE_SIZE
+        while size < max_n:
+            size *= 2
+        table = _load_partition_table(size, dtype, cache_dir or os.getenv("ZENO_CACHE_DIR"))
+        _PARTITION_TABLES[dtype.str] = table
+    return table if table.shape[0] == max_n + 1 else table[:max_n + 1]
+
+
+def clear_partition_cache() -> None:
+    """
+    Drop all in-memory partition tables (on-disk copies are left untouched).
+    """
+    _PARTITION_TABLES.clear()
+
+
+def _load_partition_table(size: int, dtype: np.dtype, cache_dir: str | None) -> np.ndarray:
+    path = os.path.join(cache_dir, f"partition_{size}_{dtype.name}.npy") if cache_dir else None
+    if path and os.path.exists(path):
+        table = np.load(path)
+    else:
+        table = partition_table(size).astype(dtype)
+        if path:
+            _save_partition_table(path, table)
+    table.setflags(write=False)
+    return table
+
+
+def _save_partition_table(path: str, table: np.ndarray) -> None:
+    # Write-then-rename so concurrent workers never read a half-written file
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, table)
+    os.replace(tmp_path, path)
+
+
 def compute_partition_gradient(psi: np.ndarray, p_table: np.ndarray | None = None) -> np.ndarray:
     """
     Symbolic entropy gradient based on local differences in partition(p(|psi|²)).
@@ -66,7 +137,7 @@ def compute_partition_gradient(psi: np.ndarray, p_table: np.ndarray | None = Non
     max_val = int(np.ceil(abs_squared.max())) + 10
 
     if p_table is None:
-        p_table = partition_table(max_val)
+        p_table = get_partition_table(max_val)
 
     # Convert abs² to nearest integer for indexing into p(n)
     indices = np.clip(abs_squared.astype(int), 0, max_val)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+import numpy as np
+
+# Field storage per precision mode (config.toml [engine] precision)
+PRECISIONS: dict[str, np.dtype] = {
+    "fp64": np.dtype(np.float64),
+    "fp32": np.dtype(np.float32),
+}
+
+
+FIELD_TYPES = ("complex", "real")
+
+
+def storage_dtype(precision: str, field_type: str = "real") -> np.dtype:
+    """
+    Storage dtype for a precision mode ("fp32" or "fp64") and field type
+    ("real" or "complex", e.g. fp32 + complex -> complex64).
+    """
+    try:
+        real = PRECISIONS[precision.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown precision '{precision}'; expected one of {tuple(PRECISIONS)}") from None
+    if field_type not in FIELD_TYPES:
+        raise ValueError(f"Unknown field type '{field_type}'; expected one of {FIELD_TYPES}")
+    return delta_dtype(real) if field_type == "complex" else real
+
+
+def real_dtype(dtype: np.dtype | type) -> np.dtype:
+    """
+    Real counterpart of a field dtype (complex64 -> float32, float64 -> float64).
+    Kernels read partition tables and write ℛ/𝒯 in this type.
+    """
+    return np.finfo(dtype).dtype
+
+
+def delta_dtype(dtype: np.dtype | type) -> np.dtype:
+    """
+    Complex dtype of Δ𝒜 for a field dtype (float32 -> complex64, float64 -> complex128).
+    """
+    return np.result_type(dtype, np.complex64)
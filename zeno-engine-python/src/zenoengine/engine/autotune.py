@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+import numba
+import numpy as np
+
+from zenoengine.core.precision import delta_dtype, real_dtype, storage_dtype
+
+if TYPE_CHECKING:
+    from zenoengine.config.config import ZenoConfig
+
+KERNELS = ("fused", "gather", "reference")
+DB_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """
+    One configuration the tuner times: operator kernel variant, 3D tile
+    shape (fused kernel only) and Numba thread count.
+    """
+    kernel: str
+    tile: Optional[tuple[int, int, int]]
+    threads: int
+
+    @property
+    def label(self) -> str:
+        tile = "x".join(map(str, self.tile)) if self.tile else "rows"
+        return f"{self.kernel}/{tile}/{self.threads}t"
+
+
+@dataclass
+class TuningResult:
+    """
+    Winner for one (operator, shape, dtype) key, plus every candidate's
+    throughput in cells/s for inspection.
+    """
+    key: str
+    kernel: str
+    tile: Optional[tuple[int, int, int]]
+    threads: int
+    cells_per_second: float
+    trials: dict[str, float] = field(default_factory=dict)
+    tuned_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> TuningResult:
+        tile = raw.get("tile")
+        return cls(**{**raw, "tile": tuple(tile) if tile else None})
+
+
+def host_fingerprint() -> dict[str, Any]:
+    """
+    What makes timings from one machine invalid on another; a tuning
+    database recorded under a different fingerprint is ignored.
+    """
+    cpu = platform.processor()
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpu = next((line.split(":", 1)[1].strip() for line in f if line.startswith("model name")), cpu)
+    except OSError:
+        pass
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "cpu": cpu,
+        "cores": os.cpu_count(),
+        "numba_threads": numba.config.NUMBA_NUM_THREADS,
+        "numba": numba.__version__,
+    }
+
+
+def default_db_path() -> str:
+    path = os.getenv("ZENO_TUNING_DB")
+    if path:
+        return path
+    return os.path.join(os.path.expanduser("~"), ".cache", "zeno", f"tuning-{platform.node() or 'host'}.json")
+
+
+def tuning_key(operator: str, shape: Sequence[int], dtype: np.dtype, halo: int = 0) -> str:
+    key = f"{operator}/{len(shape)}d/{'x'.join(map(str, shape))}/{np.dtype(dtype).name}"
+    return f"{key}/halo{halo}" if halo else key
+
+
+class TuningDB:
+    """
+    Per-host JSON store of autotuning winners, keyed by `tuning_key`.
+    Writes go through a temporary file and a rename, so concurrent runs
+    never read a half-written database.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = os.path.expanduser(path or default_db_path())
+        self.fingerprint = host_fingerprint()
+        self.entries: dict[str, TuningResult] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                raw = json.load(f)
+        except (OSError, ValueError) as exc:
+            print(f"[Autotune] Ignoring unreadable tuning database {self.path}: {exc}")
+            return
+        if raw.get("version") != DB_VERSION or raw.get("host") != self.fingerprint:
+            print(f"[Autotune] Tuning database {self.path} was recorded on another host/setup; retuning")
+            return
+        self.entries = {key: TuningResult.from_dict(entry) for key, entry in raw.get("entries", {}).items()}
+
+    def get(self, key: str) -> TuningResult | None:
+        return self.entries.get(key)
+
+    def put(self, result: TuningResult) -> None:
+        self.entries[result.key] = result
+        self.save()
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        payload = {
+            "version": DB_VERSION,
+            "host": self.fingerprint,
+            "entries": {key: asdict(entry) for key, entry in sorted(self.entries.items())},
+        }
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp, self.path)
+
+
+def thread_candidates(cores: int | None = None) -> list[int]:
+    cores = cores or numba.config.NUMBA_NUM_THREADS
+    counts = {cores}
+    t = 1
+    while t < cores:
+        counts.add(t)
+        t *= 2
+    return sorted(counts)
+
+
+def candidates(
+    operator: str,
+    shape: Sequence[int],
+    *,
+    halo: int = 0,
+    cores: int | None = None,
+    soa: bool = False
+) -> list[Candidate]:
+    """
+    Configurations worth timing for `operator` on a grid of `shape`.
+    PGNS varies kernel, tile and threads (plus the structure-of-arrays
+    kernel when `soa` is set, i.e. for bare complex fields); the classical
+    and REHTE operators have a single kernel each, so only the thread
+    count is tuned.
+    """
+    threads = thread_candidates(cores)
+    if operator == "classical":
+        return [Candidate("laplacian", None, t) for t in threads]
+    if operator == "rehte":
+        return [Candidate("reference", None, t) for t in threads]
+    if operator != "pgns":
+        raise ValueError(f"No autotuning candidates for operator '{operator}'")
+
+    kernels = [k for k in KERNELS if not (halo and k == "reference")]
+    tiles: list[Optional[tuple[int, int, int]]] = [None]
+    if len(shape) == 3:
+        nz = shape[2]
+        tiles += sorted({(min(t, shape[0]), min(t, shape[1]), min(nz, 256)) for t in (4, 8, 16)})
+    found = []
+    for kernel in kernels:
+        for tile in tiles if kernel == "fused" else [None]:
+            found.extend(Candidate(kernel, tile, t) for t in threads)
+    if soa and not halo:
+        found.extend(Candidate("soa", None, t) for t in threads)
+    return found
+
+
+def _runner(operator: str, candidate: Candidate, psi: np.ndarray, dim: int, halo: int) -> Callable[[], Any]:
+    # Each runner does one step's operator work the way the simulation does it,
+    # including the metric side outputs the engine records every step.
+    if operator == "classical":
+        from zenoengine.utils.diff_ops import compute_laplacian_nd
+
+        return lambda: compute_laplacian_nd(psi, dim)
+
+    if operator == "rehte":
+        from zenoengine.core.operators.curvature import curvature_operator
+        from zenoengine.core.operators.entropy import entropy_operator
+
+        def rehte():
+            R = curvature_operator(psi, dim)
+            S = entropy_operator(psi, dim)
+            return -1j * (R + S)
+        return rehte
+
+    from zenoengine.core.operators.fused import metric_partials
+    from zenoengine.core.operators.main import symbolic_pgns_operator
+
+    if candidate.kernel == "soa":
+        from zenoengine.core.operators.soa import soa_pgns_operator
+
+        re, im = np.ascontiguousarray(psi.real), np.ascontiguousarray(psi.imag)
+        planes = np.empty((2,) + psi.shape, dtype=re.dtype)
+        partials = metric_partials(psi)
+        return lambda: soa_pgns_operator(re, im, dim, out=planes, partials=partials)
+
+    interior = psi[(slice(halo, -halo),) * dim] if halo else psi
+    out = np.empty(interior.shape, dtype=delta_dtype(psi.dtype))
+    if candidate.kernel == "fused":
+        partials = metric_partials(interior, candidate.tile)
+        return lambda: symbolic_pgns_operator(
+            psi, dim, backend="fused", halo=halo, tile=candidate.tile, partials=partials, out=out
+        )
+    curv = np.empty(interior.shape, dtype=real_dtype(psi.dtype))
+    tors = np.empty(interior.shape, dtype=real_dtype(psi.dtype))
+    return lambda: symbolic_pgns_operator(
+        psi, dim, backend=candidate.kernel, halo=halo, curv=curv, tors=tors, out=out
+    )
+
+
+def autotune(
+    operator: str,
+    shape: Sequence[int],
+    dtype: np.dtype = np.float64,
+    *,
+    halo: int = 0,
+    repeats: int = 3,
+    cores: int | None = None,
+    verbose: bool = False
+) -> TuningResult:
+    """
+    Time every candidate for `operator` on a synthetic field and pick the
+    fastest.
+
+    Args:
+        operator: "pgns", "rehte" or "classical"
+        shape: interior grid shape
+        dtype: field storage dtype
+        halo: ghost-cell width of the field storage
+        repeats: timed calls per candidate (best one counts); one untimed call compiles
+        cores: largest thread count to try (defaults to NUMBA_NUM_THREADS)
+        verbose: print each candidate's throughput
+
+    Returns:
+        TuningResult for `tuning_key(operator, shape, dtype, halo)`
+    """
+    from zenoengine.fields.halo import pad_shape
+
+    dim = len(shape)
+    rng = np.random.default_rng(0)
+    psi = np.zeros(pad_shape(tuple(shape), halo), dtype=dtype)
+    interior = psi[(slice(halo, -halo),) * dim] if halo else psi
+    interior[...] = 0.02 * rng.normal(size=interior.shape)
+    if np.iscomplexobj(psi):
+        interior += 0.02j * rng.normal(size=interior.shape)
+
+    cells = int(np.prod(shape))
+    previous = numba.get_num_threads()
+    trials: dict[str, float] = {}
+    best: tuple[float, Candidate] | None = None
+    try:
+        soa = operator == "pgns" and np.iscomplexobj(psi)
+        for candidate in candidates(operator, shape, halo=halo, cores=cores, soa=soa):
+            numba.set_num_threads(candidate.threads)
+            run = _runner(operator, candidate, psi, dim, halo)
+            run()
+            seconds = min(_timed(run) for _ in range(max(repeats, 1)))
+            rate = cells / max(seconds, 1e-12)
+            trials[candidate.label] = rate
+            if verbose:
+                print(f"[Autotune] {candidate.label:24s} {rate / 1e6:8.1f} Mcells/s")
+            if best is None or rate > best[0]:
+                best = (rate, candidate)
+    finally:
+        numba.set_num_threads(previous)
+
+    rate, winner = best
+    return TuningResult(
+        tuning_key(operator, shape, dtype, halo), winner.kernel, winner.tile, winner.threads, rate, trials
+    )
+
+
+def _timed(run: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def _grid_shape(config: ZenoConfig) -> tuple[int, ...]:
+    grid = config.defaults.grid_size
+    n = grid[0] if isinstance(grid, (tuple, list)) else grid
+    return (int(n),) * int(config.defaults.dimensions)
+
+
+def apply_tuning(config: ZenoConfig, db: TuningDB | None = None) -> ZenoConfig:
+    """
+    Resolve `engine.kernel = "auto"`: reuse this host's tuned winner for the
+    run's (operator, shape, engine.precision), tuning and storing it on a miss. Tile
+    shape and thread count are only filled in where the config leaves them
+    open (`tile_shape` unset, `num_threads = "auto"`); an SoA winner switches
+    `layout` to "soa".
+
+    Returns:
+        config with a concrete kernel (unchanged if kernel is not "auto")
+    """
+    engine = config.engine
+    if str(engine.kernel).lower() != "auto":
+        return config
+
+    # Ensembles, brick fields, temporal blocking and multi-process runs have their own fixed kernels
+    if engine.ensemble or engine.layout == "bricks" or engine.time_block > 1 or engine.workers > 1 or engine.ranks:
+        return replace(config, engine=replace(engine, kernel="fused"))
+
+    operator = config.defaults.operator.lower() if engine.backend == "symbolic" else "classical"
+    shape = _grid_shape(config)
+    halo = engine.halo if engine.boundary == "periodic" else max(engine.halo, 1)
+    dtype = storage_dtype(engine.precision, engine.field_type)
+    db = db or TuningDB(engine.tuning_db)
+    key = tuning_key(operator, shape, dtype, halo)
+
+    result = db.get(key)
+    if result is None:
+        print(f"[Autotune] No tuning for {key} on this host; benchmarking candidates")
+        result = autotune(operator, shape, dtype, halo=halo, verbose=config.debug.verbose)
+        db.put(result)
+    print(f"[Autotune] {key}: {result.kernel}, tile={result.tile}, {result.threads} threads "
+          f"({result.cells_per_second / 1e6:.1f} Mcells/s)")
+
+    kernel = result.kernel if operator == "pgns" else "fused"
+    layout = engine.layout
+    if kernel == "soa":
+        # The SoA winner is a storage layout running the fused kernel (row sweep only)
+        kernel = "fused"
+        layout = "soa" if engine.tile_shape is None else layout
+    tile = engine.tile_shape if engine.tile_shape is not None else result.tile
+    threads = result.threads if str(engine.num_threads).lower() == "auto" else engine.num_threads
+    return replace(
+        config, engine=replace(engine, kernel=kernel, layout=layout, tile_shape=tile, num_threads=threads)
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Autotune Zeno Engine kernels for this host")
+    parser.add_argument("--operator", default="pgns", choices=["pgns", "rehte", "classical"])
+    parser.add_argument("--dim", type=int, choices=[1, 2, 3], default=2)
+    parser.add_argument("--grid", type=int, nargs="+", default=[64, 128, 256])
+    parser.add_argument("--halo", type=int, default=0)
+    parser.add_argument("--db", help="Tuning database path (default $ZENO_TUNING_DB or ~/.cache/zeno)")
+    args = parser.parse_args(argv)
+
+    db = TuningDB(args.db)
+    for n in args.grid:
+        result = autotune(args.operator, (n,) * args.dim, halo=args.halo, verbose=True)
+        db.put(result)
+        print(f"[Autotune] {result.key}: {result.kernel}, tile={result.tile}, {result.threads} threads")
+    print(f"[Autotune] Saved to {db.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,11 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 from zenoengine.io.export import export_snapshot
+from zenoengine.engine.scheduler import apply_thread_budget
+from zenoengine.engine.workspace import Workspace
 
 if TYPE_CHECKING:
-    from from zenocore.config.types import ZenoConfig
+    from zenoengine.config.config import ZenoConfig
     from zenoengine.fields.field import SymbolicField
 
 
@@ -21,6 +23,8 @@ class BaseSimulation(ABC):
     def __init__(self, config: ZenoConfig):
         self.config = config
         self.field: SymbolicField = self._init_field()
+        # Scratch buffers shared by all operators for the lifetime of the run
+        self.workspace = Workspace(self.field.shape, self.field.dtype)
         self.time: float = 0.0
         self.step_count: int = 0
 
@@ -32,21 +36,58 @@ class BaseSimulation(ABC):
         """
         ...
 
+    def advance(self, steps: int) -> None:
+        """
+        Advance the simulation by `steps` timesteps.
+        Subclasses may override this with a multi-step sweep that only
+        observes (renders/records metrics) at the end of the block.
+        """
+        for _ in range(steps):
+            self.step()
+
     def run(self) -> None:
-        print(f"[{self.__class__.__name__}] Starting simulation in mode: {self.config.engine.backend}")
+        threads = apply_thread_budget(self.config.engine.num_threads)
+        print(f"[{self.__class__.__name__}] Starting simulation in mode: {self.config.engine.backend} "
+              f"({threads} threads)")
         start = time.perf_counter()
 
-        for _ in range(self.config.defaults.simulation_steps):
-            self.step()
-            self.step_count += 1
+        # step() owns step_count; run() only schedules blocks of engine.time_block steps
+        total = self.config.defaults.simulation_steps
+        block = max(int(self.config.engine.time_block), 1)
+        while not self.done():
+            before = self.step_count
+            self.advance(max(min(block, total - self.step_count), 1))
 
-            if self.config.debug.verbose and self.step_count % 100 == 0:
-                print(f"[{self.__class__.__name__}] Step {self.step_count}/{self.config.defaults.simulation_steps}")
+            if self.config.debug.verbose and self.step_count // 100 > before // 100:
+                print(f"[{self.__class__.__name__}] Step {self.step_count}/{total}")
 
         end = time.perf_counter()
-        export_snapshot(self.field, self.config)
+        self.export()
         print(f"[{self.__class__.__name__}] Done. Duration: {end - start:.2f} seconds")
 
+    def done(self) -> bool:
+        """
+        Whether the run is complete: `simulation_steps` steps by default;
+        adaptive time stepping ends at a target time instead.
+        """
+        return self.step_count >= self.config.defaults.simulation_steps
+
+    def export(self) -> None:
+        """
+        Write the final snapshot. Distributed runs override this to assemble
+        the field on rank 0 first.
+        """
+        # Brick fields are exported as their active bricks rather than densified
+        export_snapshot(self.field if self.field.sparse else self.field.to_aos(), self.config)
+
     def _init_field(self) -> SymbolicField:
+        from zenoengine.core.precision import storage_dtype
         from zenoengine.fields.field import SymbolicField
-        return SymbolicField(self.config)
+
+        engine = self.config.engine
+        halo = engine.halo if engine.boundary == "periodic" else max(engine.halo, 1)
+        return SymbolicField(
+            self.config, halo=halo, boundary=engine.boundary, members=engine.ensemble, seed=engine.seed,
+            dtype=storage_dtype(engine.precision, engine.field_type), layout=engine.layout,
+            brick_size=engine.brick_size, brick_threshold=engine.brick_threshold, symmetric=engine.symmetry
+        )
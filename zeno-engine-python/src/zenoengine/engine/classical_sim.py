@@ -1,13 +1,16 @@
 from __future__ import annotations
 import numpy as np
+from typing import TYPE_CHECKING
 
-from zenoengine.sim.base import BaseSimulation
-from zenoengine.config.config import PGNSConfig
+from zenoengine.engine.base import BaseSimulation
 from zenoengine.utils.diff_ops import compute_laplacian_nd
 from zenoengine.vis.renderer import render_frame
 from zenoengine.vis.animator import FrameCollector
 from zenoengine.io.metrics import MetricTracker
 
+if TYPE_CHECKING:
+    from zenoengine.config.config import PGNSConfig
+
 
 class ClassicalSimulation(BaseSimulation):
     def __init__(self, config: PGNSConfig):
@@ -1,27 +1,64 @@
 from __future__ import annotations
 
-from from zenocore.config.types import ZenoConfig
-from zenoengine.engine.base import BaseSimulation
-from zenoengine.engine.pgns_sim import PGNSSimulation
-from zenoengine.engine.classical_sim import ClassicalSimulation
-from zenoengine.engine.rehte.sim import REHTESimulation
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from zenoengine.engine.distributed import DEFAULT_PORT, launch_local, localhost_hosts
+
+if TYPE_CHECKING:
+    from zenoengine.config.config import ZenoConfig
+    from zenoengine.engine.base import BaseSimulation
 
 
 def run_simulation(config: ZenoConfig) -> None:
+    """
+    Run the configured simulation. With `engine.ranks` set, this process is
+    one rank of a distributed run (rank from $ZENO_RANK or `engine.rank`).
+    With `engine.kernel = "auto"` the operator variant comes from the
+    per-host tuning database (tuned on first use).
+    """
+    from zenoengine.engine.autotune import apply_tuning
+    from zenoengine.engine.warmup import refresh_cache
+
+    # Drop cached kernels compiled from older engine sources before any kernel loads
+    refresh_cache()
+    # engine.kernel = "auto" picks this host's tuned kernel/tile/threads for the grid
+    config = apply_tuning(config)
     sim_class = resolve_simulation(config)
     sim = sim_class(config)
     sim.run()
 
 
+def run_local_ranks(config: ZenoConfig, ranks: int, port: int = DEFAULT_PORT) -> None:
+    """
+    Run a distributed simulation as `ranks` processes on localhost
+    (TCP ports port .. port + ranks - 1).
+    """
+    from zenoengine.engine.warmup import refresh_cache
+
+    # Refreshed once up front so the ranks find the cache current instead of racing to clear it
+    refresh_cache()
+    engine = replace(config.engine, ranks=localhost_hosts(ranks, port))
+    launch_local(_run_rank, ranks, replace(config, engine=engine))
+
+
+def _run_rank(rank: int, config: ZenoConfig) -> None:
+    run_simulation(replace(config, engine=replace(config.engine, rank=rank)))
+
+
 def resolve_simulation(config: ZenoConfig) -> type[BaseSimulation]:
+    # Simulation modules are imported on demand so one mode's dependencies do not gate the others
     operator = config.defaults.operator.lower()
-    mode = config.defaults.mode.lower()
+    mode = config.engine.backend.lower()
 
     if operator == "pgns" and mode == "symbolic":
+        from zenoengine.engine.pgns_sim import PGNSSimulation
         return PGNSSimulation
     elif operator == "rehte" and mode == "symbolic":
+        from zenoengine.engine.rehte.sim import REHTESimulation
         return REHTESimulation
     elif mode == "classical":
+        from zenoengine.engine.classical_sim import ClassicalSimulation
         return ClassicalSimulation
     else:
         raise ValueError(f"Unsupported simulation mode/operator: mode={mode}, operator={operator}")
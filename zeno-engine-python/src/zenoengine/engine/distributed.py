@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import os
+import multiprocessing as mp
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from zenoengine.engine.decomposition import slab_bounds
+
+_RANK_HEADER = struct.Struct("!I")
+_CONNECT_TIMEOUT = 60.0
+DEFAULT_PORT = 5750
+
+
+def parse_hosts(hosts: list[str]) -> list[tuple[str, int]]:
+    """
+    Parse ["host:port", ...] rank addresses (index = rank).
+    """
+    addresses = []
+    for entry in hosts:
+        host, _, port = entry.rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(f"Rank address must be 'host:port', got '{entry}'")
+        addresses.append((host, int(port)))
+    return addresses
+
+
+def resolve_rank(configured: int | None = None) -> int:
+    """
+    This process's rank: $ZENO_RANK if set, else the configured value.
+    """
+    env = os.getenv("ZENO_RANK")
+    return int(env) if env is not None else int(configured or 0)
+
+
+def localhost_hosts(ranks: int, port: int = DEFAULT_PORT) -> list[str]:
+    """
+    Rank addresses for `ranks` processes on this machine, on consecutive ports.
+    """
+    return [f"127.0.0.1:{port + rank}" for rank in range(ranks)]
+
+
+def launch_local(target, ranks: int, *args, start_method: str = "spawn") -> None:
+    """
+    Run `target(rank, *args)` in `ranks` local processes and wait for all of them.
+    Used to exercise the TCP backend on one machine.
+    """
+    ctx = mp.get_context(start_method)
+    procs = [ctx.Process(target=target, args=(rank,) + args) for rank in range(ranks)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+    failed = [rank for rank, proc in enumerate(procs) if proc.exitcode != 0]
+    if failed:
+        raise RuntimeError(f"[Distributed] Ranks {failed} exited with an error")
+
+
+@dataclass
+class CommTiming:
+    """
+    Per-rank wall time split into kernels vs. socket traffic (incl. waiting on peers).
+    """
+    rank: int
+    compute: float = 0.0
+    comm: float = 0.0
+
+
+class TcpComm:
+    """
+    Minimal rank-to-rank messaging over plain TCP.
+
+    Each rank listens on its own address. Rank r connects to every lower
+    rank it talks to and accepts the higher ones, so only the pairs a slab
+    decomposition needs exist: ring neighbours plus every rank to rank 0
+    (for gathers). Messages are raw array bytes; both sides know the shapes,
+    and per-socket ordering follows program order on both ends.
+    """
+
+    def __init__(self, rank: int, hosts: list[str]):
+        self.rank = rank
+        self.size = len(hosts)
+        if not 0 <= rank < self.size:
+            raise ValueError(f"Rank {rank} outside 0..{self.size - 1}")
+
+        addresses = parse_hosts(hosts)
+        self.left = (rank - 1) % self.size
+        self.right = (rank + 1) % self.size
+        self.peers: dict[int, socket.socket] = {}
+
+        wanted = self._wanted_peers()
+        listener = socket.create_server(addresses[rank], reuse_port=False)
+        try:
+            for peer in sorted(p for p in wanted if p < rank):
+                self.peers[peer] = self._connect(addresses[peer])
+            expected = {p for p in wanted if p > rank}
+            listener.settimeout(_CONNECT_TIMEOUT)
+            while expected:
+                sock, _ = listener.accept()
+                peer = _RANK_HEADER.unpack(_recv_exact(sock, _RANK_HEADER.size))[0]
+                expected.discard(peer)
+                self.peers[peer] = _tune(sock)
+        finally:
+            listener.close()
+
+    def _wanted_peers(self) -> set[int]:
+        if self.size == 1:
+            return set()
+        wanted = {self.left, self.right}
+        wanted.update(range(self.size) if self.rank == 0 else {0})
+        wanted.discard(self.rank)
+        return wanted
+
+    def _connect(self, address: tuple[str, int]) -> socket.socket:
+        deadline = time.monotonic() + _CONNECT_TIMEOUT
+        while True:
+            try:
+                sock = socket.create_connection(address, timeout=_CONNECT_TIMEOUT)
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+        sock.sendall(_RANK_HEADER.pack(self.rank))
+        return _tune(sock)
+
+    def send(self, peer: int, array: np.ndarray) -> None:
+        self.peers[peer].sendall(memoryview(np.ascontiguousarray(array)).cast("B"))
+
+    def recv_into(self, peer: int, array: np.ndarray) -> None:
+        view = memoryview(array).cast("B")
+        sock = self.peers[peer]
+        while view:
+            n = sock.recv_into(view)
+            if n == 0:
+                raise ConnectionError(f"[Distributed] Rank {peer} closed the connection")
+            view = view[n:]
+
+    def exchange(self, outgoing: dict[int, list[np.ndarray]], incoming: list[tuple[int, np.ndarray]]) -> None:
+        """
+        Send every peer's message list on its own thread (so two ranks sending
+        large halos to each other cannot deadlock on full socket buffers)
+        while receiving `incoming` in order.
+        """
+        threads = [
+            threading.Thread(target=lambda p=peer, msgs=msgs: [self.send(p, m) for m in msgs])
+            for peer, msgs in outgoing.items()
+        ]
+        for thread in threads:
+            thread.start()
+        for peer, array in incoming:
+            self.recv_into(peer, array)
+        for thread in threads:
+            thread.join()
+
+    def close(self) -> None:
+        for sock in self.peers.values():
+            sock.close()
+        self.peers.clear()
+
+
+def _tune(sock: socket.socket) -> socket.socket:
+    sock.settimeout(None)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    data = b""
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            raise ConnectionError("[Distributed] Peer closed during handshake")
+        data += chunk
+    return data
+
+
+class SlabDomain:
+    """
+    One rank's slab of a periodic field, stepped with TCP halo exchange.
+
+    The slab is stored with one ghost row on each side of the leading axis
+    and evaluated with the fused kernel's `rows=` path, so every cell sees
+    the same operands as in a single-process run (bitwise-identical result).
+    """
+
+    def __init__(
+        self,
+        comm: TcpComm,
+        psi: np.ndarray,
+        *,
+        dt: float,
+        lambda_: float = 0.4,
+        kappa: float = 0.9,
+        beta: float = 0.3,
+        metrics: bool = False
+    ):
+        from zenoengine.core.partition_geometry import get_partition_table
+        from zenoengine.core.precision import real_dtype
+
+        self.comm = comm
+        self.shape = psi.shape
+        self.bounds = slab_bounds(psi.shape[0], comm.size)
+        self.i0, self.i1 = self.bounds[comm.rank]
+        n = self.i1 - self.i0
+
+        self.local = np.empty((n + 2,) + psi.shape[1:], dtype=psi.dtype)
+        self.local[1:-1] = psi[self.i0:self.i1]
+        self.delta = np.empty((n,) + psi.shape[1:], dtype=np.result_type(psi.dtype, np.complex64))
+        self.partials = np.zeros((n, 4)) if metrics else None
+        self.dt = dt
+        self.coefficients = (lambda_, kappa, beta)
+        self.p_table = get_partition_table(dtype=real_dtype(psi.dtype))
+        self.timing = CommTiming(comm.rank)
+
+    @property
+    def interior(self) -> np.ndarray:
+        return self.local[1:-1]
+
+    def exchange_halos(self) -> None:
+        start = time.perf_counter()
+        comm = self.comm
+        if comm.size == 1:
+            self.local[0] = self.local[-2]
+            self.local[-1] = self.local[1]
+        else:
+            # Every rank sends "to-left" (its first row) before "to-right" (its last row);
+            # reading the right peer first keeps the order right when left == right.
+            outgoing: dict[int, list[np.ndarray]] = {}
+            outgoing.setdefault(comm.left, []).append(self.local[1])
+            outgoing.setdefault(comm.right, []).append(self.local[-2])
+            comm.exchange(outgoing, [(comm.right, self.local[-1]), (comm.left, self.local[0])])
+        self.timing.comm += time.perf_counter() - start
+
+    def advance(self, steps: int) -> None:
+        from zenoengine.core.operators.fused import fused_pgns_operator
+
+        lambda_, kappa, beta = self.coefficients
+        n = self.i1 - self.i0
+        for _ in range(steps):
+            self.exchange_halos()
+            start = time.perf_counter()
+            fused_pgns_operator(
+                self.local, self.local.ndim, lambda_=lambda_, kappa=kappa, beta=beta,
+                p_table=self.p_table, rows=(1, n + 1), out=self.delta, partials=self.partials
+            )
+            np.multiply(self.delta, self.dt, out=self.delta)
+            self.interior[...] += self.delta
+            self.timing.compute += time.perf_counter() - start
+
+    def gather(
+        self,
+        local: np.ndarray,
+        out: np.ndarray | None,
+        bounds: list[tuple[int, int]] | None = None
+    ) -> np.ndarray | None:
+        """
+        Assemble per-rank row blocks of `out` on rank 0 (returns None elsewhere).
+        Blocks follow the slab bounds unless `bounds` is given.
+        """
+        start = time.perf_counter()
+        comm = self.comm
+        if comm.rank == 0:
+            for rank, (i0, i1) in enumerate(bounds or self.bounds):
+                if rank == 0:
+                    out[i0:i1] = local
+                else:
+                    block = np.empty((i1 - i0,) + out.shape[1:], dtype=out.dtype)
+                    comm.recv_into(rank, block)
+                    out[i0:i1] = block
+        else:
+            comm.send(0, local)
+            out = None
+        self.timing.comm += time.perf_counter() - start
+        return out
+
+    def gather_field(self) -> np.ndarray | None:
+        return self.gather(self.interior, np.empty(self.shape, dtype=self.local.dtype) if self.comm.rank == 0 else None)
+
+    def gather_partials(self) -> np.ndarray | None:
+        # Row partials are gathered (not pre-summed) so rank 0 reduces them in
+        # the same order as a single-process run.
+        if self.partials is None:
+            return None
+        out = np.empty((self.shape[0], 4)) if self.comm.rank == 0 else None
+        return self.gather(self.partials, out)
+
+    def gather_timings(self) -> list[CommTiming] | None:
+        row = np.array([self.timing.compute, self.timing.comm])
+        size = self.comm.size
+        table = self.gather(
+            row[None, :], np.empty((size, 2)) if self.comm.rank == 0 else None,
+            bounds=[(rank, rank + 1) for rank in range(size)]
+        )
+        if table is None:
+            return None
+        return [CommTiming(rank, float(c), float(m)) for rank, (c, m) in enumerate(table)]
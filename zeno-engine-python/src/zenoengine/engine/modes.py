@@ -0,0 +1,93 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from zenoengine.config.config import ZenoConfig
+    from zenoengine.fields.field import SymbolicField
+
+# Engine modes a PGNS run can switch on, and the setting each one stands for
+MODES: dict[str, str] = {
+    "unfused": "engine.kernel other than 'fused'",
+    "tile": "engine.tile_shape",
+    "time_block": "engine.time_block > 1",
+    "workers": "engine.workers > 1",
+    "ranks": "engine.ranks",
+    "ensemble": "engine.ensemble",
+    "halo": "padded storage (engine.halo > 0, a non-periodic boundary or a mirror symmetry)",
+    "soa": "engine.layout = 'soa'",
+    "bricks": "engine.layout = 'bricks'",
+    "incremental": "engine.incremental",
+    "amr": "engine.amr_levels > 1",
+    "symmetry": "engine.symmetry",
+    "integrator": "engine.integrator other than 'euler'",
+}
+
+# Modes each mode cannot be combined with. The relation is symmetric, so every
+# pair is listed once, under the mode that imposes it.
+CONFLICTS: dict[str, tuple[str, ...]] = {
+    # The SoA and brick layouts have their own in-process fused kernels
+    "soa": ("unfused", "tile", "time_block", "workers", "ranks", "incremental", "amr", "integrator"),
+    "bricks": ("unfused", "tile", "time_block", "workers", "ranks", "incremental", "amr"),
+    # Multi-step sweeps and slab decompositions step one bare field with the fused kernel
+    "time_block": ("unfused", "ensemble", "workers", "ranks", "integrator"),
+    "workers": ("unfused", "ensemble", "halo", "ranks", "integrator", "symmetry"),
+    "ranks": ("unfused", "ensemble", "halo", "integrator", "symmetry"),
+    "ensemble": ("unfused", "tile"),
+    # Incremental evaluation and AMR keep per-cell state of one bare periodic AoS field
+    "incremental": ("unfused", "tile", "time_block", "workers", "ranks", "ensemble", "halo", "amr"),
+    "amr": ("unfused", "tile", "time_block", "workers", "ranks", "ensemble", "halo", "integrator"),
+    # Box metrics of a reduced domain come from the fused kernel's partials
+    "symmetry": ("unfused",),
+}
+
+
+def active_modes(config: ZenoConfig, field: SymbolicField, kernel: str) -> set[str]:
+    """
+    Modes of `MODES` a run with `config` (and the resolved `kernel`) switches on.
+    """
+    engine = config.engine
+    flags = {
+        "unfused": kernel != "fused",
+        "tile": engine.tile_shape is not None,
+        "time_block": engine.time_block > 1,
+        "workers": engine.workers > 1,
+        "ranks": bool(engine.ranks),
+        "ensemble": field.ensemble,
+        "halo": field.padded,
+        "soa": field.soa,
+        "bricks": field.sparse,
+        "incremental": engine.incremental,
+        "amr": engine.amr_levels > 1,
+        "symmetry": field.reduced,
+        "integrator": engine.integrator != "euler",
+    }
+    return {mode for mode, on in flags.items() if on}
+
+
+def validate_modes(config: ZenoConfig, field: SymbolicField, kernel: str) -> set[str]:
+    """
+    Raise ValueError for a combination of engine modes a PGNS run cannot
+    execute, or a mode whose own requirements the config does not meet.
+
+    Returns:
+        the active modes
+    """
+    modes = active_modes(config, field, kernel)
+    for mode in sorted(modes):
+        for other in CONFLICTS.get(mode, ()):
+            if other in modes:
+                raise ValueError(f"{MODES[mode]} cannot be combined with {MODES[other]}")
+
+    if "halo" in modes and kernel == "reference":
+        raise ValueError("engine.kernel 'reference' needs bare periodic storage; use 'gather' or 'fused' with a halo")
+    dimensions = config.defaults.dimensions
+    if "time_block" in modes and (dimensions != 3 or field.boundary != "periodic"):
+        raise ValueError("engine.time_block > 1 is only supported for periodic 3D runs")
+    if "amr" in modes and dimensions != 2:
+        raise ValueError("engine.amr_levels > 1 is only supported for 2D runs")
+    if "symmetry" in modes and field.symmetry.mirror and config.defaults.lambda_ != 0:
+        raise ValueError(
+            "engine.symmetry: the torsion term 𝒯 is odd under reflection, so a mirror-reduced domain "
+            "is only exact with lambda_ = 0; set lambda_ = 0 or engine.symmetry = false"
+        )
+    return modes
@@ -2,10 +2,21 @@ from __future__ import annotations
 import numpy as np
 
 from zenoengine.engine.base import BaseSimulation
-from from zenocore.config.types import ZenoConfig
+from zenoengine.config.config import ZenoConfig
+from zenoengine.core.integrators import Integrator
 from zenoengine.core.operators.main import symbolic_pgns_operator
-from zenoengine.core.operators.curvature import curvature_operator
-from zenoengine.core.operators.torsion import torsion_operator
+from zenoengine.core.precision import delta_dtype, real_dtype
+from zenoengine.engine.autotune import KERNELS
+from zenoengine.core.operators.fused import partial_rows, reduce_partials
+from zenoengine.core.operators.incremental import IncrementalPGNS
+from zenoengine.core.operators.bricks import brick_pgns_operator
+from zenoengine.core.operators.batched import batched_pgns_operator, reduce_member_partials
+from zenoengine.core.operators.soa import soa_pgns_operator
+from zenoengine.core.operators.temporal import DEFAULT_TEMPORAL_TILE, advance_pgns_blocked
+from zenoengine.engine.decomposition import SlabDecomposition
+from zenoengine.engine.distributed import SlabDomain, TcpComm, resolve_rank
+from zenoengine.engine.modes import validate_modes
+from zenoengine.fields.amr import AMRField
 from zenoengine.vis.renderer import render_frame
 from zenoengine.vis.animator import FrameCollector
 from zenoengine.io.metrics import MetricTracker
@@ -21,55 +32,465 @@ class PGNSSimulation(BaseSimulation):
         super().__init__(config)
 
         self.animator = FrameCollector(config)
+        # Frames (and PIL) are only needed when an image or video sink is enabled
+        self.render = config.defaults.dimensions in (1, 2) and bool({"png", "mp4"} & set(config.output.formats))
         self.metrics = MetricTracker(
             scene=config.defaults.field,
             output_dir=config.output.save_dir
         )
 
-        # Symbolic coefficients — these can later be passed via config.toml
-        self.lambda_ = 0.4
-        self.kappa = 0.9
-        self.beta = 0.3
+        # Symbolic coefficients (config.toml [defaults] lambda_, kappa, beta)
+        self.lambda_ = config.defaults.lambda_
+        self.kappa = config.defaults.kappa
+        self.beta = config.defaults.beta
+
+        # Δt per step (config.toml [defaults] time_step); a run covers simulation_steps of it
+        self.dt = config.defaults.time_step
+        self.end_time = config.defaults.simulation_steps * self.dt
+
+        # Operator variant ("auto" is resolved by the controller's autotuning; fused otherwise)
+        self.kernel = config.engine.kernel if config.engine.kernel != "auto" else "fused"
+        if self.kernel not in KERNELS:
+            raise ValueError(f"Unknown engine.kernel '{self.kernel}'; expected one of {KERNELS} or 'auto'")
+
+        # 3D cache blocking for the fused kernel (None keeps the row sweep)
+        tile = config.engine.tile_shape
+        self.tile = tuple(tile) if tile is not None else None
+
+        # Every combination of engine modes is checked against one table before anything is built
+        engine = config.engine
+        self.modes = validate_modes(config, self.field, self.kernel)
+
+        # Higher-order / adaptive time stepping (forward Euler keeps the single-evaluation path)
+        self.integrator: Integrator | None = None
+        if "integrator" in self.modes:
+            self.integrator = Integrator(
+                engine.integrator,
+                self.field.bricks.pool.shape if self.field.sparse else self.field.values.shape,
+                self.field.dtype,
+                dt=self.dt,
+                rtol=engine.rtol,
+                atol=engine.atol
+            )
+
+        # Symmetry-reduced domains scale metrics back to the box from the fused kernel's partials.
+        # Box Σ|𝒯| of multi-axis mirror domains, from the same (pre-update) field as the partials
+        self.box_torsion: float | None = None
+
+        # Incremental evaluation keeps last step's quantized indices and ℛ/𝒯 between steps
+        self.incremental: IncrementalPGNS | None = None
+        if "incremental" in self.modes:
+            self.incremental = IncrementalPGNS(self.field.shape, self.field.dtype)
+
+        # Adaptive refinement steps a 2D patch hierarchy; the field keeps the level-0 view
+        self.amr: AMRField | None = None
+        if "amr" in self.modes:
+            self.amr = AMRField(
+                self.field.values,
+                levels=engine.amr_levels,
+                patch=engine.amr_patch,
+                threshold=engine.amr_threshold,
+                interval=engine.amr_interval
+            )
+
+        # Δ and the per-row (or per-tile) metric sums live in the workspace, so steps allocate nothing;
+        # Δ follows the field precision (as real/imaginary planes for SoA fields) while metric sums
+        # always accumulate in float64
+        shape = self.field.shape
+        if self.field.soa:
+            self.delta = self.workspace.buffer("delta", real_dtype(self.field.dtype), (2,) + shape)
+        elif self.field.sparse:
+            # Brick buffers follow the pool (one Δ brick and one metric row per slot) and grow with it
+            self.delta = self.workspace.buffer("delta", delta_dtype(self.field.dtype), self.field.bricks.pool.shape)
+        else:
+            self.delta = self.workspace.buffer("delta", delta_dtype(self.field.dtype))
+        # Ensembles keep per-member row sums: (members, rows, 4)
+        if self.field.ensemble:
+            partials_shape = shape[:2] + (4,)
+        elif self.field.sparse:
+            partials_shape = (self.field.bricks.capacity, 4)
+        else:
+            partials_shape = (partial_rows(shape, self.tile), 4)
+        metrics = config.output.enable_metrics
+        self.partials = self.workspace.buffer("metric_partials", np.float64, partials_shape) if metrics else None
+        # Unfused kernels evaluate ℛ, 𝒯, |𝒜|²𝒜 and 𝒮* into workspace buffers (reduced into the same
+        # partials from the pre-update state, so metrics do not depend on engine.kernel)
+        real = real_dtype(self.field.dtype)
+        unfused = self.kernel != "fused"
+        self.curv = self.workspace.buffer("curv", real) if unfused else None
+        self.tors = self.workspace.buffer("tors", real) if unfused else None
+        self.entropy = self.workspace.buffer("entropy", self.field.dtype) if unfused else None
+        self.nonlinear = self.workspace.buffer("nonlinear", self.field.dtype) if unfused else None
+        # The gather backend quantizes the whole (padded) storage once per evaluation
+        self.gathered = (
+            self.workspace.buffer("gathered", real, self.field.data.shape) if self.kernel == "gather" else None
+        )
+
+        # Temporal blocking: engine.time_block steps per sweep (3D, periodic, complex ψ)
+        self.time_block = max(int(config.engine.time_block), 1)
+        if self.time_block > 1:
+            self._init_temporal_blocking()
+
+        # Multi-process slabs in shared memory (engine.workers > 1)
+        self.decomposition: SlabDecomposition | None = None
+        if "workers" in self.modes:
+            self._init_decomposition()
+
+        # Multi-node slabs with TCP halo exchange (engine.ranks); rank 0 observes and exports
+        self.domain: SlabDomain | None = None
+        if "ranks" in self.modes:
+            self._init_distributed()
 
     def step(self) -> None:
-        psi = self.field.values
+        if self.amr is not None:
+            return self._step_amr()
+
+        if self.field.sparse:
+            self._update_bricks()
+
+        if self.integrator is not None:
+            # Runge–Kutta stages set the field to each stage state and evaluate Δ𝒜 there
+            state = self.field.bricks.pool if self.field.sparse else self.field.values
+            dt = self.integrator.step(state, self._evaluate, self._next_dt())
+        else:
+            # Forward Euler
+            dt = self.dt
+            self.field.apply_delta(self._evaluate(self.delta, True), dt)
+        self.time += dt
+        self.step_count += 1
+
+        self._observe(self.partials)
+
+    def _evaluate(self, out: np.ndarray, observe: bool) -> np.ndarray:
+        """
+        Δ𝒜 at the field's current state, into `out` (pool-shaped for brick
+        fields). Metric partials of that state are only produced when
+        `observe` is set.
+        """
         dim = self.config.defaults.dimensions
+        partials = self.partials if observe else None
+
+        # Padded fields run the modulo-free interior kernels on refreshed ghosts
+        if self.field.padded:
+            self.field.refresh_halo()
+
+        if self.field.soa:
+            # Real and imaginary planes in, real and imaginary planes of Δ out
+            delta = soa_pgns_operator(
+                self.field.re,
+                self.field.im,
+                dim,
+                lambda_=self.lambda_,
+                kappa=self.kappa,
+                beta=self.beta,
+                partials=partials,
+                out=out
+            )
+        elif self.field.sparse:
+            # Sweep the active bricks only; free slots get a zero Δ so RK stages can combine the whole pool
+            bricks = self.field.bricks
+            out[bricks.count:] = 0
+            delta = brick_pgns_operator(
+                bricks.pool,
+                bricks.index,
+                bricks.coords,
+                bricks.count,
+                lambda_=self.lambda_,
+                kappa=self.kappa,
+                beta=self.beta,
+                partials=partials,
+                out=out
+            )
+        elif self.incremental is not None:
+            # ℛ/𝒯 recomputed only around cells whose quantized index changed
+            delta = self.incremental(
+                self.field.values,
+                lambda_=self.lambda_,
+                kappa=self.kappa,
+                beta=self.beta,
+                partials=partials,
+                out=out
+            )
+        elif self.field.ensemble:
+            # Every member in one launch, parallel over (member, row)
+            delta = batched_pgns_operator(
+                self.field.values,
+                dim,
+                lambda_=self.lambda_,
+                kappa=self.kappa,
+                beta=self.beta,
+                partials=partials,
+                out=out
+            )
+        else:
+            # Composite symbolic PGNS operator
+            delta = symbolic_pgns_operator(
+                psi=self.field.data,
+                dim=dim,
+                halo=self.field.halo,
+                tile=self.tile,
+                lambda_=self.lambda_,
+                kappa=self.kappa,
+                beta=self.beta,
+                backend=self.kernel,
+                curv=self.curv,
+                tors=self.tors,
+                entropy=self.entropy,
+                nonlinear=self.nonlinear,
+                gathered=self.gathered,
+                partials=partials,
+                out=out
+            )
 
-        # Composite symbolic PGNS operator
-        delta = symbolic_pgns_operator(
-            psi=psi,
-            dim=dim,
+        if self.field.reduced and partials is not None:
+            self.box_torsion = self.field.symmetry.torsion_energy(self.field.data, self.field.halo)
+        return delta
+
+    def _next_dt(self) -> float:
+        # Adaptive steps follow the controller's proposal but land exactly on the end time
+        if self.integrator.adaptive:
+            return min(self.integrator.dt, self.end_time - self.time)
+        return self.dt
+
+    def _step_amr(self) -> None:
+        # Every level steps with the same Δt; metrics sum leaf cells, area-weighted per level
+        sums = self.amr.step(
+            self.dt,
             lambda_=self.lambda_,
             kappa=self.kappa,
-            beta=self.beta
+            beta=self.beta,
+            metrics=self.partials is not None
         )
-
-        # Apply update
-        self.field.apply_delta(delta, self.config.defaults.simulation_steps)
-        self.time += self.config.defaults.simulation_steps
+        self.amr.composite(0, out=self.field.values)
+        self.time += self.dt
         self.step_count += 1
+        self._observe(sums)
+
+    def _update_bricks(self) -> None:
+        # Activate bricks the front reached once per step, so every RK stage sees the same pool layout
+        added, released = self.field.bricks.update()
+        self._fit_brick_buffers()
+        if self.integrator is not None and (added or released):
+            self.integrator.resize(self.field.bricks.pool.shape)
+
+    def _fit_brick_buffers(self) -> None:
+        # The pool may have grown during update(); the workspace reallocates on a shape change
+        pool = self.field.bricks.pool
+        self.delta = self.workspace.buffer("delta", delta_dtype(pool.dtype), pool.shape)
+        if self.partials is not None:
+            self.partials = self.workspace.buffer("metric_partials", np.float64, (pool.shape[0], 4))
+
+    def done(self) -> bool:
+        # Adaptive runs end at the target time rather than after a step count
+        if self.integrator is not None and self.integrator.adaptive:
+            return self.time >= self.end_time * (1 - 1e-12)
+        return super().done()
 
-        # Live render (1D and 2D only for now)
-        if dim in (1, 2):
-            frame = render_frame(self.field, self.config, step=self.step_count)
+    @property
+    def is_root(self) -> bool:
+        return self.domain is None or self.domain.comm.rank == 0
+
+    def _observe(self, partials: np.ndarray | None) -> None:
+        if not self.is_root:
+            return
+
+        # Live render (1D and 2D only for now; ensembles show member 0)
+        if self.render:
+            if self.amr is not None:
+                field = self.field.view(self.amr.composite())
+            else:
+                field = self.field.member(0) if self.field.ensemble else self.field.to_aos()
+            frame = render_frame(field, self.config, step=self.step_count)
             self.animator.add(frame, step=self.step_count)
 
-        # Track symbolic operators for metrics
-        R = curvature_operator(psi, dim)
-        T = torsion_operator(psi, dim)
+        if partials is not None and self.field.ensemble:
+            self.metrics.record_members(self.step_count, self.time, reduce_member_partials(partials))
+        elif partials is not None:
+            # Each stored cell of a symmetry-reduced domain stands for `multiplicity` box cells
+            scale = self.field.multiplicity
+            field_energy, curvature_energy, torsion_energy, entropy_energy = (
+                total * scale for total in reduce_partials(partials)
+            )
+            if self.box_torsion is not None:
+                torsion_energy = self.box_torsion
+            self.metrics.record_scalars(
+                step=self.step_count,
+                time=self.time,
+                field_energy=field_energy,
+                curvature_energy=curvature_energy,
+                torsion_energy=torsion_energy,
+                entropy_energy=entropy_energy
+            )
 
-        self.metrics.record(
-            step=self.step_count,
-            time=self.time,
-            psi=psi.copy(),
-            R=R.copy(),
-            T=T.copy()
+    def _finish_block(self, steps: int, partials: np.ndarray | None) -> None:
+        # Multi-step paths observe once per block, at the block's last step
+        for _ in range(steps):
+            self.time += self.dt  # same rounding as step()
+        self.step_count += steps
+        self._observe(partials)
+
+    def _init_temporal_blocking(self) -> None:
+        shape = self.field.values.shape
+        self.block_tile = self.tile or DEFAULT_TEMPORAL_TILE
+        self.psi_next = self.workspace.buffer("psi_next", self.field.values.dtype)
+        self.block_partials = (
+            self.workspace.buffer("block_partials", np.float64, (partial_rows(shape, self.block_tile), 4))
+            if self.config.output.enable_metrics else None
+        )
+
+    def _init_decomposition(self) -> None:
+        engine = self.config.engine
+        self.decomposition = SlabDecomposition(
+            self.field.values,
+            engine.workers,
+            dt=self.dt,
+            lambda_=self.lambda_,
+            kappa=self.kappa,
+            beta=self.beta,
+            metrics=self.config.output.enable_metrics,
+            numa=engine.numa,
         )
+        # The field now lives in the shared segment the workers step
+        self.field.data = self.field.values = self.decomposition.values
+        print(f"[PGNSSimulation] {engine.workers} worker processes, slabs {self.decomposition.bounds}")
+
+    def _init_distributed(self) -> None:
+        engine = self.config.engine
+        # Every rank builds the same initial field and keeps only its slab
+        comm = TcpComm(resolve_rank(engine.rank), list(engine.ranks))
+        self.domain = SlabDomain(
+            comm,
+            self.field.values,
+            dt=self.dt,
+            lambda_=self.lambda_,
+            kappa=self.kappa,
+            beta=self.beta,
+            metrics=self.config.output.enable_metrics,
+        )
+        if comm.rank == 0:
+            print(f"[PGNSSimulation] {comm.size} TCP ranks, slabs {self.domain.bounds}")
+
+    def _gather_field(self) -> None:
+        values = self.domain.gather_field()
+        if values is not None:
+            self.field.values[...] = values
+
+    def advance(self, steps: int) -> None:
+        if self.domain is not None:
+            self.domain.advance(steps)
+            partials = self.domain.gather_partials()
+            # Rank 0 renders the assembled field (1D/2D live view)
+            if self.render:
+                self._gather_field()
+            self._finish_block(steps, partials)
+            return
+
+        if self.decomposition is not None:
+            self.decomposition.advance(steps)
+            partials = self.decomposition.partials if self.config.output.enable_metrics else None
+            self._finish_block(steps, partials)
+            return
+
+        if self.time_block == 1 or steps == 1:
+            return super().advance(steps)
+
+        # One sweep advances every tile by `steps`; metrics come from the last
+        # sub-step, so they match what step() would record at this step count.
+        advance_pgns_blocked(
+            self.field.values,
+            steps,
+            self.dt,
+            lambda_=self.lambda_,
+            kappa=self.kappa,
+            beta=self.beta,
+            tile=self.block_tile,
+            out=self.psi_next,
+            partials=self.block_partials
+        )
+        self.field.values[...] = self.psi_next
+        self._finish_block(steps, self.block_partials)
+
+    def export(self) -> None:
+        if self.domain is not None:
+            self._gather_field()
+            if not self.is_root:
+                return
+        super().export()
 
     def run(self) -> None:
-        super().run()
+        try:
+            super().run()
+            if self.field.sparse:
+                bricks = self.field.bricks
+                dense = bricks.dtype.itemsize * int(np.prod(bricks.shape))
+                print(
+                    f"[PGNSSimulation] bricks: {bricks.count}/{bricks.index.size} active "
+                    f"({bricks.active_fraction:.1%}), {bricks.nbytes / 2**20:.1f} MiB vs {dense / 2**20:.1f} MiB dense"
+                )
+            if self.field.reduced:
+                domain = "x".join(map(str, self.field.shape))
+                box = "x".join(map(str, self.field.full_shape))
+                print(
+                    f"[PGNSSimulation] symmetry: simulated the {domain} fundamental domain of the {box} box "
+                    f"({self.field.multiplicity}x fewer cells)"
+                )
+            if self.integrator is not None:
+                stats = self.integrator.stats
+                print(
+                    f"[PGNSSimulation] {self.integrator.method}: {stats.accepted} accepted, {stats.rejected} rejected "
+                    f"steps, {stats.evaluations} Δ𝒜 evaluations to t = {self.time:.4g} "
+                    f"(dt {stats.dt_min:.3g}–{stats.dt_max:.3g})"
+                )
+            if self.amr is not None:
+                self._report_amr()
+            if self.incremental is not None:
+                stats = self.incremental.stats
+                print(
+                    f"[PGNSSimulation] incremental: ℛ/𝒯 recomputed on {stats.mean_active:.1%} of cells per step "
+                    f"(last step: {stats.changed:.1%} changed, {stats.active:.1%} recomputed)"
+                )
+            if self.domain is not None:
+                self._report_distributed()
+        finally:
+            if self.domain is not None:
+                self.domain.comm.close()
+            if self.decomposition is not None:
+                self._report_decomposition()
+                self.field.data = self.field.values = self.field.values.copy()
+                self.decomposition.close()
+                self.decomposition = None
+        if not self.is_root:
+            return
         self.animator.save_gif()
         self.animator.save_mp4()
         self.metrics.export_json()
         self.metrics.export_csv()
         self.metrics.summarize()
+
+    def _report_amr(self) -> None:
+        amr = self.amr
+        levels = ", ".join(
+            f"L{level} {patches.count} patches ({patches.coverage:.1%})" for level, patches in enumerate(amr.levels)
+        )
+        finest = amr.levels[-1].n ** 2
+        print(
+            f"[PGNSSimulation] AMR: {levels}; {amr.cells()} cells per step vs {finest} uniform at the finest level, "
+            f"{amr.regrids} regrids"
+        )
+
+    def _report_decomposition(self) -> None:
+        for timing, (i0, i1) in zip(self.decomposition.timings, self.decomposition.bounds):
+            print(
+                f"[PGNSSimulation] rank {timing.rank} rows [{i0}, {i1}): "
+                f"compute {timing.compute:.3f}s, halo wait {timing.wait:.3f}s"
+            )
+
+    def _report_distributed(self) -> None:
+        timings = self.domain.gather_timings()
+        if timings is None:
+            return
+        for timing, (i0, i1) in zip(timings, self.domain.bounds):
+            print(
+                f"[PGNSSimulation] rank {timing.rank} rows [{i0}, {i1}): "
+                f"compute {timing.compute:.3f}s, communication {timing.comm:.3f}s"
+            )
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import numpy as np
 from zenoengine.engine.base import BaseSimulation
-from from zenocore.config.types import ZenoConfig
+from zenoengine.config.config import ZenoConfig
 from zenoengine.core.operators.curvature import curvature_operator
-from zenoengine.core.operators.topology import topology_operator
+from zenoengine.core.operators.topology import torsion_operator as topology_operator
 from zenoengine.core.operators.entropy import entropy_operator
 from zenoengine.vis.renderer import render_frame
 from zenoengine.vis.animator import FrameCollector
@@ -25,14 +25,16 @@ class REHTESimulation(BaseSimulation):
         super().__init__(config)
 
         self.animator = FrameCollector(config)
+        # Frames (and PIL) are only needed when an image or video sink is enabled
+        self.render = config.defaults.dimensions in (1, 2) and bool({"png", "mp4"} & set(config.output.formats))
         self.metrics = MetricTracker(
-            scene=config.defaults.scene,
+            scene=config.defaults.field,
             output_dir=config.output.save_dir
         )
 
-        # Symbolic constants
-        self.lambda_ = 0.4
-        self.beta = 0.3
+        # Symbolic constants (config.toml [defaults] lambda_, beta)
+        self.lambda_ = config.defaults.lambda_
+        self.beta = config.defaults.beta
 
     def step(self) -> None:
         psi = self.field.values
@@ -41,7 +43,7 @@ class REHTESimulation(BaseSimulation):
         # Symbolic composite operator
         R = curvature_operator(psi, dim)
         S = entropy_operator(psi, dim)
-        T = topology_operator(psi, dim)
+        T = topology_operator(self.field)
 
         delta = -1j * (R + self.beta * S + self.lambda_ * T)
 
@@ -51,7 +53,7 @@ class REHTESimulation(BaseSimulation):
         self.step_count += 1
 
         # Optional frame rendering
-        if dim in (1, 2):
+        if self.render:
             frame = render_frame(self.field, self.config, step=self.step_count)
             self.animator.add(frame, step=self.step_count)
 
@@ -2,8 +2,6 @@ from __future__ import annotations
 import numpy as np
 from typing import Callable, TYPE_CHECKING
 
-from zenoengine.config.config import PGNSConfig
-
 # `if TYPE_CHECKING: ...` resolves circular import because
 # `SymbolicField` is no longer accessed at runtime
 # and instead is just hinted at for static type checking
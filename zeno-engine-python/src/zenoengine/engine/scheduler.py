@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import numba
+import numpy as np
+from numba import njit, prange
+
+if TYPE_CHECKING:
+    from zenoengine.config.config import ZenoConfig
+
+
+def thread_budget(num_threads: Any, cores: int | None = None) -> int:
+    """
+    Resolve `engine.num_threads` to a Numba thread count.
+
+    Args:
+        num_threads: "auto" (every core), "none" or 0 (single thread), or an int
+        cores: upper bound (defaults to NUMBA_NUM_THREADS)
+
+    Returns:
+        thread count in [1, cores]
+    """
+    cores = cores or numba.config.NUMBA_NUM_THREADS
+    if isinstance(num_threads, str):
+        key = num_threads.lower()
+        if key == "auto":
+            return cores
+        if key == "none":
+            return 1
+        num_threads = int(key)
+    return max(1, min(int(num_threads or 1), cores))
+
+
+def apply_thread_budget(num_threads: Any) -> int:
+    """
+    Set the calling thread's Numba thread count from `engine.num_threads`.
+    Numba keeps this setting per Python thread, so each job thread can
+    carry its own budget.
+    """
+    threads = thread_budget(num_threads)
+    numba.set_num_threads(threads)
+    return threads
+
+
+@njit(parallel=True, cache=True)
+def _probe(a):
+    for i in prange(a.shape[0]):
+        a[i] = i
+
+
+def launches_are_threadsafe() -> bool:
+    """
+    True if parallel kernels may be launched from several Python threads at
+    once. TBB and OpenMP allow it; the workqueue fallback does not.
+    """
+    _probe(np.zeros(1))  # the threading layer is only chosen at the first parallel launch
+    return numba.threading_layer() != "workqueue"
+
+
+@dataclass
+class Job:
+    """
+    One scheduled unit of work and its lifecycle:
+    queued → running → done | failed.
+    """
+    id: int
+    name: str
+    threads: int
+    state: str = "queued"
+    error: Optional[BaseException] = None
+    result: Any = None
+    submitted: float = field(default_factory=time.perf_counter)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    def summary(self) -> dict[str, Any]:
+        end = self.finished or time.perf_counter()
+        return {
+            "id": self.id,
+            "name": self.name,
+            "state": self.state,
+            "threads": self.threads,
+            "queued_s": (self.started or end) - self.submitted,
+            "running_s": end - self.started if self.started else 0.0,
+            "error": repr(self.error) if self.error else None,
+        }
+
+
+class CoreScheduler:
+    """
+    Runs jobs on their own threads under a machine-wide core budget.
+
+    Each job is granted a thread count up front and only starts once that
+    many cores are free; Numba's thread count is set to the grant inside the
+    job thread, so concurrent simulations share the machine instead of each
+    launching `prange` across every core. Jobs start in submission order, so
+    a wide job at the head of the queue is never starved by narrow ones.
+    """
+
+    def __init__(self, cores: int | None = None, default_threads: int | None = None):
+        self.cores = cores or numba.config.NUMBA_NUM_THREADS
+        self.default_threads = min(default_threads or self.cores, self.cores)
+        # Under workqueue only one job may be inside a parallel kernel at a time
+        self.exclusive = not launches_are_threadsafe()
+        self.jobs: dict[int, Job] = {}
+        self._free = self.cores
+        self._running = 0
+        self._queue: deque[Job] = deque()
+        self._cond = threading.Condition()
+        self._ids = itertools.count(1)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, threads: int | None = None, name: str | None = None) -> Job:
+        """
+        Queue `fn(*args)` with a budget of `threads` cores (default
+        `default_threads`, clamped to the machine).
+        """
+        budget = thread_budget(threads or self.default_threads, self.cores)
+        job = Job(next(self._ids), name or getattr(fn, "__name__", "job"), budget)
+        with self._cond:
+            self.jobs[job.id] = job
+            self._queue.append(job)
+        threading.Thread(target=self._run, args=(job, fn, args), name=f"zeno-job-{job.id}", daemon=True).start()
+        return job
+
+    def submit_simulation(self, config: ZenoConfig, name: str | None = None) -> Job:
+        """
+        Queue a simulation; its `engine.num_threads` becomes the job budget
+        and is rewritten to the granted thread count.
+        """
+        from zenoengine.engine.controller import run_simulation
+
+        requested = config.engine.num_threads
+        threads = self.default_threads if str(requested).lower() == "auto" else thread_budget(requested, self.cores)
+        config = replace(config, engine=replace(config.engine, num_threads=threads))
+        return self.submit(run_simulation, config, threads=threads, name=name or config.defaults.field)
+
+    def status(self) -> list[dict[str, Any]]:
+        with self._cond:
+            return [job.summary() for job in self.jobs.values()]
+
+    def wait_all(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for job in list(self.jobs.values()):
+            remaining = None if deadline is None else max(deadline - time.perf_counter(), 0.0)
+            if not job.wait(remaining):
+                return False
+        return True
+
+    def _can_start(self, job: Job) -> bool:
+        if self._queue[0] is not job or job.threads > self._free:
+            return False
+        return not (self.exclusive and self._running)
+
+    def _run(self, job: Job, fn: Callable[..., Any], args: tuple) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._can_start(job))
+            self._queue.popleft()
+            self._free -= job.threads
+            self._running += 1
+            job.state = "running"
+            job.started = time.perf_counter()
+            self._cond.notify_all()
+
+        try:
+            numba.set_num_threads(min(job.threads, numba.config.NUMBA_NUM_THREADS))
+            job.result = fn(*args)
+            job.state = "done"
+        except BaseException as exc:
+            job.error = exc
+            job.state = "failed"
+            print(f"[Scheduler] Job {job.id} ({job.name}) failed: {exc!r}")
+        finally:
+            with self._cond:
+                self._free += job.threads
+                self._running -= 1
+                job.finished = time.perf_counter()
+                self._cond.notify_all()
+            job._done.set()
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import itertools
+import json
+import multiprocessing as mp
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Sequence, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from zenoengine.config.config import ZenoConfig
+
+# A dimension is either a list of choices or a (low, high) range (random/LHS designs only)
+Axis = Union[Sequence[Any], tuple[float, float]]
+SweepSpace = dict[str, Axis]
+
+RESULT_COLUMNS = (
+    "point_id", "scene", "grid_size", "lambda_", "kappa", "beta", "steps", "dt", "seed",
+    "status", "seconds", "field_energy", "curvature_energy", "torsion_energy", "entropy_energy", "error",
+)
+DEFAULT_POINT = {"scene": "RTI_2D", "grid_size": 64, "lambda_": 0.4, "kappa": 0.9, "beta": 0.3}
+
+
+# --- Designs -----------------------------------------------------------------
+
+def _is_range(axis: Axis) -> bool:
+    return isinstance(axis, tuple) and len(axis) == 2 and all(isinstance(v, (int, float)) for v in axis)
+
+
+def grid_design(space: SweepSpace) -> list[dict[str, Any]]:
+    """
+    Full factorial design: every combination of the listed choices.
+    """
+    for name, axis in space.items():
+        if _is_range(axis):
+            raise ValueError(f"Grid designs need explicit values for '{name}', got range {axis}")
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+
+def random_design(space: SweepSpace, samples: int, seed: int = 0) -> list[dict[str, Any]]:
+    """
+    Independent uniform samples: ranges are drawn continuously, choices uniformly.
+    """
+    rng = np.random.default_rng(seed)
+    points = [{} for _ in range(samples)]
+    for name, axis in space.items():
+        for point in points:
+            if _is_range(axis):
+                point[name] = float(rng.uniform(*axis))
+            else:
+                point[name] = axis[int(rng.integers(len(axis)))]
+    return points
+
+
+def latin_hypercube(space: SweepSpace, samples: int, seed: int = 0) -> list[dict[str, Any]]:
+    """
+    Latin-hypercube design: each dimension is cut into `samples` equal strata
+    and every stratum is used exactly once, so each coefficient's range is
+    covered evenly with far fewer runs than a grid. Choice lists are
+    stratified the same way (each choice gets an equal share of the runs).
+    """
+    rng = np.random.default_rng(seed)
+    points = [{} for _ in range(samples)]
+    for name, axis in space.items():
+        u = (rng.permutation(samples) + rng.uniform(size=samples)) / samples
+        for point, x in zip(points, u):
+            if _is_range(axis):
+                lo, hi = axis
+                point[name] = float(lo + x * (hi - lo))
+            else:
+                point[name] = axis[min(int(x * len(axis)), len(axis) - 1)]
+    return points
+
+
+DESIGNS = {"grid": grid_design, "random": random_design, "lhs": latin_hypercube}
+
+
+def point_id(point: dict[str, Any], steps: int, dt: float, seed: int) -> str:
+    """
+    Stable key of a run (independent of design order), used for resuming.
+    """
+    key = json.dumps({**point, "steps": steps, "dt": dt, "seed": seed}, sort_keys=True)
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+# --- One run -----------------------------------------------------------------
+
+def point_config(
+    point: dict[str, Any],
+    steps: int,
+    dt: float,
+    seed: int = 0,
+    config_path: str | None = None
+) -> ZenoConfig:
+    """
+    The config a normal run of `point` would use: the TOML config
+    (`config_path`, else the default config path) with the point's scene,
+    grid and coefficients applied, and rendering and export turned off.
+    Point keys of the form "section.key" (e.g. "engine.precision") override
+    that setting directly.
+    """
+    from zenoengine.config.config_loader import load_config_with_overrides
+    from zenoengine.engine.autotune import apply_tuning
+    from zenoengine.scenes.registry import SCENES
+
+    point = {**DEFAULT_POINT, **point}
+    if point.get("operator", "pgns") != "pgns":
+        raise ValueError(f"Sweeps run the PGNS operator only, got operator '{point['operator']}'")
+    scene = SCENES.get(point["scene"])
+    if scene is None:
+        raise ValueError(f"Unknown scene: {point['scene']}")
+
+    size = int(point["grid_size"])
+    overrides = {
+        "defaults.operator": "pgns",
+        "defaults.field": scene.name,
+        "defaults.dimensions": scene.dimension,
+        "defaults.grid_size": (size,) * scene.dimension,
+        "defaults.lambda_": float(point["lambda_"]),
+        "defaults.kappa": float(point["kappa"]),
+        "defaults.beta": float(point["beta"]),
+        "defaults.simulation_steps": steps,
+        "defaults.time_step": dt,
+        "engine.seed": seed,
+        "output.formats": [],
+        "output.enable_metrics": True,
+        **{key: value for key, value in point.items() if "." in key},
+    }
+    config = apply_tuning(load_config_with_overrides(config_path, overrides))
+    if config.engine.ranks:
+        raise ValueError("Sweep points run on a single node; drop engine.ranks")
+    # The field reads the flat scene settings
+    config.grid_size, config.dimension, config.scene = size, scene.dimension, scene.name
+    return config
+
+
+def run_point(
+    point: dict[str, Any],
+    steps: int,
+    dt: float,
+    seed: int = 0,
+    config_path: str | None = None
+) -> dict[str, Any]:
+    """
+    Headless PGNS run of one sweep point (no rendering or export), stepped
+    exactly like a normal run of `point_config(point, ...)`.
+
+    Returns:
+        energies recorded at the last step, plus wall time
+    """
+    from zenoengine.engine.pgns_sim import PGNSSimulation
+
+    start = time.perf_counter()
+    config = point_config(point, steps, dt, seed, config_path)
+    sim = PGNSSimulation(config)
+    # The same blocks BaseSimulation.run() advances by, without its logging and export
+    block = max(int(config.engine.time_block), 1)
+    try:
+        while not sim.done():
+            sim.advance(max(min(block, steps - sim.step_count), 1))
+    finally:
+        if sim.decomposition is not None:
+            sim.decomposition.close()
+
+    last = sim.metrics.data[-1]
+    return {
+        "seconds": time.perf_counter() - start,
+        "field_energy": last["field_energy"],
+        "curvature_energy": last["curvature_energy"],
+        "torsion_energy": last["torsion_energy"],
+        "entropy_energy": last["entropy_energy"],
+    }
+
+
+def _warm_worker(dims: Sequence[int], dtypes: Sequence[np.dtype], threads: int) -> None:
+    # Runs once per pool process: pin the thread budget and compile every
+    # kernel the sweep will hit, so no task pays import or JIT time.
+    import numba
+    from zenoengine.engine.warmup import warmup
+
+    numba.set_num_threads(min(threads, numba.config.NUMBA_NUM_THREADS))
+    warmup(dims, dtypes)
+
+
+def _run_task(
+    point: dict[str, Any],
+    steps: int,
+    dt: float,
+    seed: int,
+    config_path: str | None
+) -> dict[str, Any]:
+    try:
+        return {"status": "ok", **run_point(point, steps, dt, seed, config_path)}
+    except Exception:
+        return {"status": "error", "error": traceback.format_exc(limit=3)}
+
+
+# --- Results table -----------------------------------------------------------
+
+def load_results(path: str) -> dict[str, np.ndarray]:
+    """
+    Read a sweep results file into one array per column.
+    """
+    if not os.path.exists(path):
+        return {name: np.array([]) for name in RESULT_COLUMNS}
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    columns = {}
+    for name in RESULT_COLUMNS:
+        values = [row[name] for row in rows]
+        try:
+            columns[name] = np.array([float(v) if v != "" else np.nan for v in values])
+        except ValueError:
+            columns[name] = np.array(values, dtype=object)
+    return columns
+
+
+def _completed_ids(path: str) -> set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline="") as f:
+        return {row["point_id"] for row in csv.DictReader(f) if row["status"] == "ok"}
+
+
+# --- Runner ------------------------------------------------------------------
+
+def run_sweep(
+    points: Sequence[dict[str, Any]],
+    results_path: str,
+    *,
+    steps: int = 100,
+    dt: float = 1e-3,
+    seed: int = 0,
+    workers: int | None = None,
+    threads_per_worker: int = 1,
+    resume: bool = True,
+    config_path: str | None = None
+) -> int:
+    """
+    Run every sweep point in a persistent pool of pre-warmed processes.
+    Points run PGNSSimulation under the normal run config (see
+    `point_config`); REHTE and classical runs are not swept.
+
+    Each finished run is appended to `results_path` as one row (one column
+    per parameter and metric) and flushed immediately, so an interrupted
+    sweep restarts where it stopped: with `resume`, points whose id already
+    has an "ok" row are skipped (failed points are retried).
+
+    Args:
+        points: sweep points (see `DESIGNS`); missing keys use DEFAULT_POINT
+        results_path: CSV results table (created or appended)
+        steps, dt, seed: run length, timestep and scene noise seed per point
+        workers: concurrency limit (processes); defaults to the usable CPU count
+        threads_per_worker: Numba threads per process
+        resume: skip points already completed in `results_path`
+        config_path: TOML config the points override (default: the normal run's)
+
+    Returns:
+        number of points run by this call
+    """
+    from zenoengine.config.config_loader import load_config_with_overrides
+    from zenoengine.core.precision import storage_dtype
+    from zenoengine.engine.warmup import refresh_cache
+    from zenoengine.scenes.registry import SCENES
+
+    if workers is None:
+        workers = max(len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1, 1)
+    done = _completed_ids(results_path) if resume else set()
+    pending = []
+    for point in points:
+        point = {**DEFAULT_POINT, **point}
+        pid = point_id(point, steps, dt, seed)
+        if pid not in done:
+            done.add(pid)  # also de-duplicates repeated design points
+            pending.append((pid, point))
+    if not pending:
+        print(f"[Sweep] Nothing to run: all {len(points)} points are in {results_path}")
+        return 0
+
+    dims = sorted({SCENES[p["scene"]].dimension for _, p in pending if p["scene"] in SCENES})
+    engine = load_config_with_overrides(config_path).engine
+    dtypes = sorted({
+        storage_dtype(p.get("engine.precision", engine.precision), p.get("engine.field_type", engine.field_type))
+        for _, p in pending
+    }, key=str)
+    print(f"[Sweep] {len(pending)} of {len(points)} points pending, {workers} workers")
+
+    # Once here, so pool processes never clear the cache while another one is filling it
+    refresh_cache()
+    os.makedirs(os.path.dirname(os.path.abspath(results_path)), exist_ok=True)
+    new_file = not os.path.exists(results_path) or os.path.getsize(results_path) == 0
+    with open(results_path, "a", newline="") as f, ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_warm_worker,
+        initargs=(dims, dtypes, threads_per_worker),
+    ) as pool:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS, restval="")
+        if new_file:
+            writer.writeheader()
+        futures = {pool.submit(_run_task, point, steps, dt, seed, config_path): (pid, point) for pid, point in pending}
+        for n, future in enumerate(as_completed(futures), 1):
+            pid, point = futures[future]
+            row = {"point_id": pid, **point, "steps": steps, "dt": dt, "seed": seed, **future.result()}
+            writer.writerow({k: row.get(k, "") for k in RESULT_COLUMNS})
+            f.flush()
+            print(f"[Sweep] {n}/{len(pending)} {pid} {row['status']}", flush=True)
+    return len(pending)
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import os
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Sequence
+
+import numpy as np
+
+DIMS = (1, 2, 3)
+DTYPES = (np.float64, np.complex128)
+# Storage dtypes each engine.precision mode can produce (real and complex fields)
+PRECISION_DTYPES = {
+    "fp64": (np.float64, np.complex128),
+    "fp32": (np.float32, np.complex64),
+}
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Subpackages whose modules define kernels or the helpers and constants kernels inline
+KERNEL_SOURCES = ("core", "fields", "utils")
+# Digest of those sources when the cached kernels were written (see `refresh_cache`)
+SOURCE_STAMP = os.path.join(PACKAGE_DIR, "__pycache__", "kernel_sources.sha256")
+
+
+@dataclass
+class WarmupReport:
+    """
+    Outcome of `warmup`: wall time and how many specializations came from the
+    on-disk cache vs. were compiled (and written to it).
+    """
+    seconds: float
+    loaded: int
+    compiled: int
+
+    def __str__(self) -> str:
+        return f"{self.seconds:.2f}s ({self.loaded} loaded from cache, {self.compiled} compiled)"
+
+
+def _kernel_modules() -> list:
+    from zenoengine.core import integrators
+    from zenoengine.core.operators import (
+        batched, bricks, curvature, entropy, fused, incremental, legacy_symbolic_pgns, nonlinear, patches, soa,
+        stencil, temporal, torsion
+    )
+    from zenoengine.fields import amr, bricks as brick_grid, field, symmetry
+    from zenoengine.utils import diff_ops
+
+    return [integrators, batched, bricks, curvature, entropy, fused, incremental, legacy_symbolic_pgns, nonlinear, patches, soa,
+            stencil, temporal, torsion, amr, brick_grid, field, symmetry, diff_ops]
+
+
+def _dispatchers() -> list:
+    from numba.core.dispatcher import Dispatcher
+
+    found = []
+    for module in _kernel_modules():
+        found.extend(v for v in vars(module).values() if isinstance(v, Dispatcher))
+    return found
+
+
+def _cache_counts(dispatchers) -> tuple[int, int]:
+    hits = misses = 0
+    for d in dispatchers:
+        stats = d.stats
+        hits += sum(stats.cache_hits.values())
+        misses += sum(stats.cache_misses.values())
+    return hits, misses
+
+
+def _warm_dimension(dim: int, dtype: np.dtype) -> None:
+    from zenoengine.core.operators.batched import batched_pgns_operator, member_partials
+    from zenoengine.core.operators.bricks import brick_pgns_operator
+    from zenoengine.core.operators.curvature import curvature_operator
+    from zenoengine.core.operators.entropy import entropy_operator
+    from zenoengine.core.operators.fused import fused_pgns_operator, metric_partials
+    from zenoengine.core.operators.incremental import IncrementalPGNS
+    from zenoengine.core.operators.legacy_symbolic_pgns import symbolic_pgns_operator as legacy_pgns
+    from zenoengine.core.operators.nonlinear import nonlinear_operator
+    from zenoengine.core.operators.soa import soa_pgns_operator
+    from zenoengine.core.operators.stencil import curvature_torsion
+    from zenoengine.core.operators.torsion import torsion_operator
+    from zenoengine.core.integrators import Integrator
+    from zenoengine.core.precision import delta_dtype
+    from zenoengine.fields.amr import AMRField
+    from zenoengine.fields.bricks import BrickGrid
+    from zenoengine.fields.symmetry import Symmetry
+    from zenoengine.fields.field import _axpy_1d, _axpy_2d, _axpy_3d, _axpy_flat, _axpy_split, _interleave_flat
+    from zenoengine.utils.diff_ops import compute_laplacian_nd
+
+    psi = np.zeros((4,) * dim, dtype=dtype)
+    padded = np.zeros((6,) * dim, dtype=dtype)
+    ensemble = np.zeros((2,) + (4,) * dim, dtype=dtype)
+    delta = np.empty(psi.shape, dtype=delta_dtype(dtype))
+
+    # Fused engine path: periodic and padded, with and without metric partials
+    for partials in (None, metric_partials(psi)):
+        fused_pgns_operator(psi, dim, out=delta, partials=partials)
+        fused_pgns_operator(padded, dim, halo=1, out=delta, partials=partials)
+        if dim == 3:
+            tiled = None if partials is None else metric_partials(psi, (2, 2, 4))
+            fused_pgns_operator(psi, dim, tile=(2, 2, 4), out=delta, partials=tiled)
+            fused_pgns_operator(padded, dim, halo=1, tile=(2, 2, 4), out=delta, partials=tiled)
+    for partials in (None, member_partials(ensemble)):
+        batched_pgns_operator(ensemble, dim, partials=partials)
+    incremental = IncrementalPGNS(psi.shape, dtype)
+    for partials in (None, metric_partials(psi)):
+        incremental(psi, out=delta, partials=partials)
+
+    # Block-sparse path: active-set update, brick sweep with and without partials, densify
+    grid = BrickGrid.from_dense(np.ones_like(psi), 2)
+    grid.update()
+    for partials in (None, np.zeros((grid.capacity, 4))):
+        brick_pgns_operator(grid.pool, grid.index, grid.coords, grid.count, partials=partials)
+    grid.to_dense()
+
+    # Runge–Kutta stage combination and embedded error norm (complex ψ)
+    if np.iscomplexobj(psi):
+        stepper = Integrator("rk23", psi.shape, dtype, dt=0.0)
+        stepper.step(psi, lambda out, observe: fused_pgns_operator(psi, dim, out=out))
+
+    # Adaptive refinement (2D, complex ψ): patch sweep, ghost fill, restriction and regrid on a refined step
+    if dim == 2 and np.iscomplexobj(psi):
+        hierarchy = AMRField(np.zeros((8, 8), dtype=dtype), levels=2, patch=4, threshold=0, interval=1)
+        for metrics in (False, True):
+            hierarchy.step(0.0, metrics=metrics)
+
+    # Box torsion sum of mirror-reduced domains (needs two or more mirrored axes)
+    if dim > 1:
+        Symmetry(mirror=tuple(range(dim))).torsion_energy(padded, 1)
+
+    # Reference and gather backends, REHTE and the legacy kernels
+    curvature_operator(psi, dim)
+    torsion_operator(psi, dim)
+    entropy_operator(psi, dim)
+    nonlinear_operator(psi)
+    curvature_torsion(psi, dim)
+    curvature_torsion(padded, dim, halo=1)
+    legacy_pgns(SimpleNamespace(values=psi, config=SimpleNamespace(dimension=dim)))
+    if dtype == np.float64:
+        compute_laplacian_nd(psi, dim)
+
+    # ψ += Δ·dt on bare (flat) and padded (strided) storage; only complex ψ takes a complex Δ
+    if np.iscomplexobj(psi):
+        _axpy_flat(psi.reshape(-1), delta.reshape(-1), 0.0)
+
+        # Structure-of-arrays layout: planes in, planes out, plus the split/interleave helpers
+        planes = np.zeros((2,) + psi.shape, dtype=psi.real.dtype)
+        for partials in (None, metric_partials(psi)):
+            soa_pgns_operator(planes[0], planes[1], dim, out=planes.copy(), partials=partials)
+        _axpy_flat(planes[0].reshape(-1), planes[1].reshape(-1), 0.0)
+        _axpy_split(planes[0].reshape(-1), planes[1].reshape(-1), delta.reshape(-1), 0.0)
+        _interleave_flat(planes[0].reshape(-1), planes[1].reshape(-1), psi.reshape(-1))
+        interior = padded[(slice(1, -1),) * dim]
+        (_axpy_1d, _axpy_2d, _axpy_3d)[dim - 1](interior, delta, 0.0)
+
+    if dim == 3 and np.iscomplexobj(psi):
+        from zenoengine.core.operators.temporal import advance_pgns_blocked
+
+        advance_pgns_blocked(psi, 2, 0.0, tile=(2, 2, 2), partials=metric_partials(psi, (2, 2, 2)))
+
+
+def warmup(
+    dims: Sequence[int] = DIMS,
+    dtypes: Sequence[np.dtype] = DTYPES,
+    verbose: bool = False
+) -> WarmupReport:
+    """
+    Compile (or load from Numba's on-disk cache) every kernel specialization
+    the engine uses for the given dimensions and field dtypes, so the first
+    simulation step runs at full speed.
+
+    Args:
+        dims: spatial dimensions to prepare
+        dtypes: field storage dtypes to prepare
+        verbose: print one line per dimension/dtype
+
+    Returns:
+        WarmupReport with wall time and cache hit/compile counts
+    """
+    start = time.perf_counter()
+    refresh_cache()
+    dispatchers = _dispatchers()
+    hits0, misses0 = _cache_counts(dispatchers)
+    for dim in dims:
+        for dtype in dtypes:
+            t0 = time.perf_counter()
+            _warm_dimension(dim, np.dtype(dtype))
+            if verbose:
+                print(f"[Warmup] {dim}D {np.dtype(dtype).name}: {time.perf_counter() - t0:.2f}s")
+    hits1, misses1 = _cache_counts(dispatchers)
+    return WarmupReport(time.perf_counter() - start, hits1 - hits0, misses1 - misses0)
+
+
+def uncached_copy(kernel):
+    """
+    Recompile `kernel`'s signatures without the disk cache. Numba cannot
+    inspect LLVM IR or assembly of code loaded from the cache, so IR checks
+    run against this copy.
+    """
+    from numba import njit
+
+    options = {k: v for k, v in kernel.targetoptions.items() if k != "nopython"}
+    fresh = njit(**options)(kernel.py_func)
+    for signature in kernel.signatures:
+        fresh.compile(signature)
+    return fresh
+
+
+def clear_cache() -> int:
+    """
+    Delete the engine's cached kernels (*.nbi/*.nbc), e.g. to time a cold
+    start. After source edits `refresh_cache` does this automatically.
+
+    Returns:
+        number of files removed
+    """
+    removed = 0
+    for module in _kernel_modules():
+        folder = os.path.join(os.path.dirname(module.__file__), "__pycache__")
+        stem = os.path.splitext(os.path.basename(module.__file__))[0]
+        for path in glob.glob(os.path.join(folder, f"{stem}.*.nb[ic]")):
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def source_digest() -> str:
+    """
+    SHA-256 over every module in `KERNEL_SOURCES` (path and contents).
+    """
+    digest = hashlib.sha256()
+    for sub in KERNEL_SOURCES:
+        for path in sorted(glob.glob(os.path.join(PACKAGE_DIR, sub, "**", "*.py"), recursive=True)):
+            digest.update(os.path.relpath(path, PACKAGE_DIR).encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def refresh_cache() -> bool:
+    """
+    Clear the cached kernels if the engine sources changed since they were
+    written. Numba only checks each kernel's own file, so editing a helper
+    or constant another module inlines (fused.py, partition_geometry.py)
+    would otherwise keep stale machine code. Entry points call this before
+    the first kernel runs.
+
+    Returns:
+        whether the cache was cleared
+    """
+    digest = source_digest()
+    try:
+        with open(SOURCE_STAMP) as f:
+            if f.read().strip() == digest:
+                return False
+    except OSError:
+        pass
+    removed = clear_cache()
+    try:
+        os.makedirs(os.path.dirname(SOURCE_STAMP), exist_ok=True)
+        with open(SOURCE_STAMP, "w") as f:
+            f.write(digest)
+    except OSError as exc:
+        print(f"[Warmup] Could not record the kernel source digest: {exc}")
+    if removed:
+        print(f"[Warmup] Engine sources changed; removed {removed} stale cached kernel files")
+    return True
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Precompile Zeno Engine kernels into the on-disk cache")
+    parser.add_argument("--dims", type=int, nargs="+", default=list(DIMS))
+    parser.add_argument("--precision", nargs="+", choices=list(PRECISION_DTYPES), default=["fp64"])
+    parser.add_argument("--clear", action="store_true", help="Drop cached kernels before compiling")
+    args = parser.parse_args(argv)
+
+    if args.clear:
+        print(f"[Warmup] Removed {clear_cache()} cached kernel files")
+    dtypes = [dtype for precision in args.precision for dtype in PRECISION_DTYPES[precision]]
+    report = warmup(args.dims, dtypes, verbose=True)
+    print(f"[Warmup] Done: {report}")
+
+
+if __name__ == "__main__":
+    main()
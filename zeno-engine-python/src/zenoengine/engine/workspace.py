@@ -0,0 +1,47 @@
+from __future__ import annotations
+import numpy as np
+
+
+class Workspace:
+    """
+    Named scratch buffers allocated once per run and reused on every step.
+
+    Operators write into these via their `out=` arguments, so a steady-state
+    step performs no array allocations.
+    """
+
+    def __init__(self, shape: tuple[int, ...], dtype: np.dtype | type = np.float64):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self._buffers: dict[str, np.ndarray] = {}
+
+    def buffer(
+        self,
+        name: str,
+        dtype: np.dtype | type | None = None,
+        shape: tuple[int, ...] | None = None
+    ) -> np.ndarray:
+        """
+        Return the buffer registered under `name`, allocating it on first use.
+
+        Asking for the same name with a different shape or dtype replaces the
+        buffer; callers are expected to use a stable layout per name.
+        """
+        dtype = self.dtype if dtype is None else np.dtype(dtype)
+        shape = self.shape if shape is None else tuple(shape)
+
+        buf = self._buffers.get(name)
+        if buf is None or buf.dtype != dtype or buf.shape != shape:
+            buf = np.zeros(shape, dtype=dtype)
+            self._buffers[name] = buf
+        return buf
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._buffers
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buf.nbytes for buf in self._buffers.values())
+
+    def release(self) -> None:
+        self._buffers.clear()
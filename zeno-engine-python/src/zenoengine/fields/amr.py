@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+from zenoengine.core.operators.patches import patch_pgns_operator
+from zenoengine.core.partition_geometry import PARTITION_TABLE_SIZE, QUANTIZATION_SCALE
+from zenoengine.core.precision import delta_dtype
+from zenoengine.fields.bricks import _blocks
+from zenoengine.fields.field import _axpy_3d
+
+
+class PatchLevel:
+    """
+    One refinement level: the live P×P patches of an n×n periodic grid,
+    each stored with a one-cell ghost layer in `pool[:count]`.
+
+    `index` maps patch-grid positions to pool slots (-1 = not refined
+    here); `covered` flags the cells the next finer level represents.
+    """
+
+    def __init__(self, n: int, patch: int, dtype: np.dtype, blocks: np.ndarray):
+        self.n = n
+        self.patch = patch
+        self.count = len(blocks)
+        capacity = max(self.count, 1)
+
+        self.index = np.full((n // patch, n // patch), -1, dtype=np.int64)
+        self.coords = np.zeros((capacity, 2), dtype=np.int64)
+        self.coords[:self.count] = blocks
+        self.index[tuple(self.coords[:self.count].T)] = np.arange(self.count)
+
+        self.pool = np.zeros((capacity, patch + 2, patch + 2), dtype=dtype)
+        self.covered = np.zeros((capacity, patch, patch), dtype=np.bool_)
+        self.delta = np.zeros((capacity, patch, patch), dtype=delta_dtype(dtype))
+        self.partials = np.zeros((capacity, 4), dtype=np.float64)
+
+    @property
+    def interior(self) -> np.ndarray:
+        return self.pool[:self.count, 1:-1, 1:-1]
+
+    @property
+    def coverage(self) -> float:
+        return self.count / self.index.size
+
+
+class AMRField:
+    """
+    Block-structured adaptive refinement of a 2D periodic field.
+
+    Level 0 covers the base grid; level ℓ has twice the resolution of
+    level ℓ - 1 and only holds the patches `regrid()` tagged, i.e. where
+    the quantized index q = min(int(|ψ|·50), 499) jumps by at least
+    `threshold` between neighbouring cells of the parent level (plus
+    `buffer` patches around them). Patches nest inside their parent's,
+    and `step()` re-tags every `interval` steps (0 = never).
+
+    Every level is stepped with the same stencil and Δt: the partition-
+    geometry operators are index-space differences with no grid-spacing
+    factor, so a refined patch evolves exactly like the same region of a
+    uniformly finer grid. Ghost layers are filled coarse to fine
+    (piecewise-constant injection, then same-level copies where a
+    neighbour patch exists), and after each step fine levels are
+    restricted (2×2 averages) onto their parents.
+
+    `composite()` gives the leaf-level view for rendering; per-step metric
+    sums count leaf cells only, weighted by cell area relative to level 0.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        levels: int = 2,
+        patch: int = 16,
+        threshold: int = 2,
+        interval: int = 10,
+        buffer: int = 1
+    ):
+        if values.ndim != 2 or values.shape[0] != values.shape[1]:
+            raise ValueError("AMR supports square 2D fields")
+        if patch < 2 or patch % 2 or values.shape[0] % patch:
+            raise ValueError(f"Grid {values.shape[0]} must be a multiple of the (even) patch size {patch}")
+        if levels < 1:
+            raise ValueError("AMR needs at least one level")
+        if not np.iscomplexobj(values):
+            raise TypeError("AMR steps the complex PGNS field; store it as complex (engine.field_type = 'complex')")
+
+        self.max_levels = levels
+        self.patch = patch
+        self.threshold = threshold
+        self.interval = interval
+        self.buffer = buffer
+        self.dtype = values.dtype
+        self.steps = 0
+        self.regrids = 0
+
+        n = values.shape[0]
+        blocks = np.argwhere(np.ones((n // patch, n // patch), dtype=np.bool_))
+        base = PatchLevel(n, patch, self.dtype, blocks)
+        base.interior[...] = _blocks(values, patch)[tuple(blocks.T)]
+        self.levels = [base]
+        self.regrid()
+
+    @property
+    def depth(self) -> int:
+        return len(self.levels)
+
+    def fill_ghosts(self, level: int) -> None:
+        """
+        Refresh the ghost layer of every patch on `level` from the finest
+        data available at each ghost cell.
+        """
+        target = self.levels[level]
+        for k in range(level + 1):
+            source = self.levels[k]
+            _sample(target.pool, target.coords, target.count, target.n, source.pool, source.index, 2 ** (level - k), True)
+
+    def synchronize(self) -> None:
+        """
+        Restrict every level onto its parent, finest first.
+        """
+        for level in range(self.depth - 1, 0, -1):
+            fine, coarse = self.levels[level], self.levels[level - 1]
+            _restrict(fine.pool, fine.coords, fine.count, coarse.pool, coarse.index)
+
+    def regrid(self) -> None:
+        """
+        Re-tag every level from its parent's data and rebuild the patch
+        sets. New patches are injected from the coarser levels, then keep
+        whatever the previous patches of their level held.
+        """
+        self.synchronize()
+        for level in range(1, self.max_levels):
+            tags = self._tag(level - 1)
+            n = self.levels[level - 1].n * 2
+            new = PatchLevel(n, self.patch, self.dtype, np.argwhere(tags))
+            if new.count == 0:
+                del self.levels[level:]
+                break
+            for k in range(level):
+                source = self.levels[k]
+                _sample(new.pool, new.coords, new.count, n, source.pool, source.index, 2 ** (level - k), False)
+            if level < self.depth:
+                old = self.levels[level]
+                _sample(new.pool, new.coords, new.count, n, old.pool, old.index, 1, False)
+                self.levels[level] = new
+            else:
+                self.levels.append(new)
+        self._mark_covered()
+        self.regrids += 1
+
+    def step(
+        self,
+        dt: float,
+        *,
+        lambda_: float = 0.4,
+        kappa: float = 0.9,
+        beta: float = 0.3,
+        metrics: bool = True
+    ) -> np.ndarray | None:
+        """
+        Advance every level by one step of `dt`, synchronize, and regrid
+        when `interval` steps have passed.
+
+        Returns:
+            (levels, 4) area-weighted leaf metric sums (see `reduce_partials`), or None
+        """
+        for level in range(self.depth):
+            self.fill_ghosts(level)
+        for patches in self.levels:
+            patch_pgns_operator(
+                patches.pool,
+                patches.count,
+                lambda_=lambda_,
+                kappa=kappa,
+                beta=beta,
+                out=patches.delta,
+                partials=patches.partials if metrics else None,
+                covered=patches.covered
+            )
+        for patches in self.levels:
+            _axpy_3d(patches.interior, patches.delta[:patches.count], dt)
+        self.synchronize()
+
+        sums = None
+        if metrics:
+            sums = np.stack([
+                patches.partials[:patches.count].sum(axis=0) * 0.25 ** level
+                for level, patches in enumerate(self.levels)
+            ])
+        self.steps += 1
+        if self.interval and self.steps % self.interval == 0:
+            self.regrid()
+        return sums
+
+    def composite(self, level: int | None = None, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Dense view at the resolution of `level` (default: the finest):
+        each region comes from the finest level covering it, coarser data
+        repeated to the target resolution.
+        """
+        level = self.depth - 1 if level is None else level
+        n = self.levels[level].n
+        if out is None:
+            out = np.empty((n, n), dtype=self.dtype)
+        for k in range(level + 1):
+            patches = self.levels[k]
+            r = 2 ** (level - k)
+            data = patches.interior
+            if r > 1:
+                data = data.repeat(r, axis=1).repeat(r, axis=2)
+            _blocks(out, self.patch * r)[tuple(patches.coords[:patches.count].T)] = data
+        return out
+
+    def cells(self) -> int:
+        """
+        Cells updated per step, summed over levels.
+        """
+        return sum(patches.count for patches in self.levels) * self.patch ** 2
+
+    def _tag(self, level: int) -> np.ndarray:
+        # Child-patch mask for level + 1: quantized-index jumps on `level`, dilated, inside its coverage
+        parent = self.levels[level]
+        self.fill_ghosts(level)
+        pool = parent.pool[:parent.count]
+        q = np.minimum((np.abs(pool) * QUANTIZATION_SCALE).astype(np.int64), PARTITION_TABLE_SIZE - 1)
+        jump_i = np.abs(np.diff(q, axis=1)) >= self.threshold
+        jump_j = np.abs(np.diff(q, axis=2)) >= self.threshold
+        tagged = jump_i[:, :-1, 1:-1] | jump_i[:, 1:, 1:-1] | jump_j[:, 1:-1, :-1] | jump_j[:, 1:-1, 1:]
+
+        h = self.patch // 2
+        quadrants = tagged.reshape(parent.count, 2, h, 2, h).any(axis=(2, 4))
+        grid = 2 * parent.index.shape[0]
+        tags = np.zeros((grid, grid), dtype=np.bool_)
+        a, b = parent.coords[:parent.count, 0], parent.coords[:parent.count, 1]
+        for qa in range(2):
+            for qb in range(2):
+                tags[2 * a + qa, 2 * b + qb] = quadrants[:, qa, qb]
+
+        for _ in range(self.buffer):
+            grown = tags.copy()
+            for axis in (0, 1):
+                grown |= np.roll(tags, 1, axis) | np.roll(tags, -1, axis)
+            tags = grown
+        inside = (parent.index >= 0).repeat(2, axis=0).repeat(2, axis=1)
+        return tags & inside
+
+    def _mark_covered(self) -> None:
+        h = self.patch // 2
+        for level, patches in enumerate(self.levels):
+            patches.covered[:] = False
+            if level + 1 == self.depth:
+                continue
+            child = self.levels[level + 1].index >= 0
+            grid = patches.index.shape[0]
+            quadrants = child.reshape(grid, 2, grid, 2)[patches.coords[:patches.count, 0], :, patches.coords[:patches.count, 1], :]
+            patches.covered[:patches.count] = quadrants.repeat(h, axis=1).repeat(h, axis=2)
+
+
+# --- Inter-level transfer ---------------------------------------------------
+
+@njit(parallel=True, cache=True)
+def _sample(pool, coords, count, n, src, src_index, ratio, ghosts_only):
+    # Inject source-level values into padded patches of an n×n level (ratio = resolution factor);
+    # cells whose source patch is missing are left alone
+    P = pool.shape[1] - 2
+    for s in prange(count):
+        a0 = coords[s, 0] * P - 1
+        b0 = coords[s, 1] * P - 1
+        for i in range(P + 2):
+            stride = P + 1 if ghosts_only and 0 < i < P + 1 else 1
+            for j in range(0, P + 2, stride):
+                ci = ((a0 + i) % n) // ratio
+                cj = ((b0 + j) % n) // ratio
+                t = src_index[ci // P, cj // P]
+                if t >= 0:
+                    pool[s, i, j] = src[t, ci % P + 1, cj % P + 1]
+
+
+@njit(parallel=True, cache=True)
+def _restrict(pool, coords, count, dst, dst_index):
+    # 2×2 average of each fine patch onto the parent cells it covers
+    P = pool.shape[1] - 2
+    h = P // 2
+    for s in prange(count):
+        ci = coords[s, 0] * h
+        cj = coords[s, 1] * h
+        t = dst_index[ci // P, cj // P]
+        if t < 0:
+            continue
+        oi = ci % P + 1
+        oj = cj % P + 1
+        for i in range(h):
+            x = 2 * i + 1
+            for j in range(h):
+                y = 2 * j + 1
+                dst[t, oi + i, oj + j] = 0.25 * (
+                    (pool[s, x, y] + pool[s, x + 1, y]) + (pool[s, x, y + 1] + pool[s, x + 1, y + 1])
+                )
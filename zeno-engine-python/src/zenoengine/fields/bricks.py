@@ -0,0 +1,304 @@
+from __future__ import annotations
+from typing import Callable
+
+import numpy as np
+from numba import njit, prange
+
+from zenoengine.core.partition_geometry import QUANTIZATION_SCALE
+
+_SCALE = QUANTIZATION_SCALE
+
+# Brick edge per dimension when engine.brick_size is 0 (4–8 KiB of complex128 per brick)
+DEFAULT_BRICK_SIZE = {1: 256, 2: 16, 3: 8}
+
+SlabFunc = Callable[[int, int], np.ndarray]
+
+
+class BrickGrid:
+    """
+    Block-sparse periodic field: the grid is cut into cubic bricks of edge
+    `brick`, and only bricks that carry signal are stored.
+
+    Active bricks live contiguously in `pool[:count]`; `coords[s]` is the
+    brick-grid position of slot `s` and `index` maps brick-grid positions
+    back to slots (-1 = not allocated, i.e. ψ = 0 throughout). The pool
+    grows on demand, so memory follows the active set rather than the box.
+
+    `update()` keeps the active set in step with the field: a zero cell
+    only receives a nonzero Δ𝒜 when a stencil neighbour has a nonzero
+    quantized index (|ψ| ≥ 1/50), so bricks are activated exactly where
+    such a cell sits on the face of an active brick. Bricks whose |ψ|
+    stays at or below `threshold` and that no such face touches are
+    released; with `threshold = 0` only all-zero bricks are, and the
+    evolution matches the dense field step for step.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        brick: int,
+        dtype: np.dtype | type = np.complex128,
+        threshold: float = 0.0,
+        capacity: int = 0
+    ):
+        if len(shape) not in (1, 2, 3):
+            raise ValueError("Brick grids support 1–3 dimensions")
+        if brick < 1 or any(n % brick for n in shape):
+            raise ValueError(f"Grid {tuple(shape)} is not a whole number of {brick}-cell bricks")
+
+        self.shape = tuple(shape)
+        self.brick = brick
+        self.dtype = np.dtype(dtype)
+        self.threshold = threshold
+        self.dim = len(shape)
+        self.grid = tuple(n // brick for n in shape)
+        self.index = np.full(self.grid, -1, dtype=np.int64)
+        self.count = 0
+
+        capacity = max(capacity, 1)
+        self.pool = np.zeros((capacity,) + (brick,) * self.dim, dtype=self.dtype)
+        self.coords = np.zeros((capacity, self.dim), dtype=np.int64)
+        self._scratch(capacity)
+
+    @classmethod
+    def from_slabs(
+        cls,
+        shape: tuple[int, ...],
+        brick: int,
+        dtype: np.dtype | type,
+        slab: SlabFunc,
+        threshold: float = 0.0
+    ) -> BrickGrid:
+        """
+        Build the grid one brick-thick slab at a time, so the dense field is
+        never materialized.
+
+        Args:
+            shape, brick, dtype, threshold: as for `BrickGrid`
+            slab: slab(i0, i1) returns the field rows [i0, i1) of the leading axis
+
+        Returns:
+            grid holding the bricks whose max |ψ| exceeds `threshold`
+        """
+        grid = cls(shape, brick, dtype, threshold)
+        for a in range(grid.grid[0]):
+            values = np.asarray(slab(a * brick, (a + 1) * brick), dtype=grid.dtype)
+            blocks = _blocks(values, brick)
+            keep = np.abs(blocks).reshape(blocks.shape[:grid.dim] + (-1,)).max(axis=-1) > threshold
+            positions = np.argwhere(keep)
+            positions[:, 0] = a
+            grid._append(positions, blocks[keep])
+        return grid
+
+    @classmethod
+    def from_dense(cls, values: np.ndarray, brick: int, threshold: float = 0.0) -> BrickGrid:
+        """
+        Brick a dense periodic field, dropping bricks whose max |ψ| is at or below `threshold`.
+        """
+        return cls.from_slabs(values.shape, brick, values.dtype, lambda i0, i1: values[i0:i1], threshold)
+
+    @property
+    def capacity(self) -> int:
+        return self.pool.shape[0]
+
+    @property
+    def active(self) -> np.ndarray:
+        """
+        The active bricks, pool[:count].
+        """
+        return self.pool[:self.count]
+
+    @property
+    def active_fraction(self) -> float:
+        return self.count / self.index.size
+
+    @property
+    def nbytes(self) -> int:
+        return self.pool.nbytes + self.coords.nbytes + self.index.nbytes
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Grow the pool (by at least half) so it holds `capacity` bricks.
+        """
+        if capacity <= self.capacity:
+            return
+        capacity = max(capacity, self.capacity + self.capacity // 2)
+        pool = np.zeros((capacity,) + self.pool.shape[1:], dtype=self.dtype)
+        pool[:self.count] = self.pool[:self.count]
+        coords = np.zeros((capacity, self.dim), dtype=np.int64)
+        coords[:self.count] = self.coords[:self.count]
+        self.pool, self.coords = pool, coords
+        self._scratch(capacity)
+
+    def update(self) -> tuple[int, int]:
+        """
+        Activate bricks the front has reached and release cold ones.
+        Call before every operator sweep.
+
+        Returns:
+            (activated, released) brick counts
+        """
+        count = self.count
+        flat = self.index.reshape(-1)
+        grid = np.array(self.grid, dtype=np.int64)
+        cube = self.pool[:count].reshape((count,) + self.pool.shape[1:] + (1,) * (3 - self.dim))
+
+        _brick_stats(cube, self.dim, self._amax, self._hot)
+        added, released = _plan(
+            flat, grid, self.coords, count, self._amax, self._hot, self.threshold, self._adds, self._frees
+        )
+        pool = self.pool.reshape(self.capacity, -1)
+        count = _release(pool, self.coords, flat, grid, count, self._frees, released)
+        adds = self._adds  # reserve() replaces the scratch buffers; keep the planned additions
+        self.reserve(count + added)
+        self.count = _activate(self.pool.reshape(self.capacity, -1), self.coords, flat, grid, count, adds, added)
+        return added, released
+
+    def to_dense(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Dense copy of the field (zeros outside the active bricks).
+        """
+        if out is None:
+            out = np.zeros(self.shape, dtype=self.dtype)
+        else:
+            out.fill(0)
+        _blocks(out, self.brick)[tuple(self.coords[:self.count].T)] = self.active
+        return out
+
+    def save(self, path: str) -> None:
+        """
+        Write the active bricks (not the dense field) to an .npz file.
+        """
+        np.savez(
+            path, shape=np.array(self.shape), brick=self.brick, threshold=self.threshold,
+            coords=self.coords[:self.count], bricks=self.active
+        )
+
+    def _append(self, positions: np.ndarray, bricks: np.ndarray) -> None:
+        n = len(positions)
+        self.reserve(self.count + n)
+        slots = np.arange(self.count, self.count + n)
+        self.pool[slots] = bricks
+        self.coords[slots] = positions
+        self.index[tuple(positions.T)] = slots
+        self.count += n
+
+    def _scratch(self, capacity: int) -> None:
+        # Per-step planning buffers, sized with the pool so update() does not allocate
+        self._amax = np.zeros(capacity, dtype=np.float64)
+        self._hot = np.zeros((capacity, 6), dtype=np.bool_)
+        self._adds = np.zeros(capacity * 2 * self.dim, dtype=np.int64)
+        self._frees = np.zeros(capacity, dtype=np.int64)
+
+
+def _blocks(values: np.ndarray, brick: int) -> np.ndarray:
+    # (n0, ..., nd) -> (n0/B, ..., nd/B, B, ..., B) view of a C-contiguous array
+    dim = values.ndim
+    split = tuple(x for n in values.shape for x in (n // brick, brick))
+    return values.reshape(split).transpose(tuple(range(0, 2 * dim, 2)) + tuple(range(1, 2 * dim, 2)))
+
+
+# --- Active-set maintenance -------------------------------------------------
+
+@njit(parallel=True, cache=True)
+def _brick_stats(pool, dim, amax, hot):
+    # Max |ψ| per brick, and which faces hold a cell with a nonzero quantized index.
+    # 1D/2D pools arrive with trailing unit axes, so one kernel serves every dimension.
+    n, b0, b1, b2 = pool.shape
+    for s in prange(n):
+        for f in range(6):
+            hot[s, f] = False
+        peak = 0.0
+        for i in range(b0):
+            for j in range(b1):
+                for k in range(b2):
+                    x = abs(pool[s, i, j, k])
+                    if x > peak:
+                        peak = x
+                    if x * _SCALE >= 1.0:
+                        if i == 0:
+                            hot[s, 0] = True
+                        if i == b0 - 1:
+                            hot[s, 1] = True
+                        if dim > 1 and j == 0:
+                            hot[s, 2] = True
+                        if dim > 1 and j == b1 - 1:
+                            hot[s, 3] = True
+                        if dim > 2 and k == 0:
+                            hot[s, 4] = True
+                        if dim > 2 and k == b2 - 1:
+                            hot[s, 5] = True
+        amax[s] = peak
+
+
+@njit(inline="always")
+def _flat(coords, s, grid):
+    f = 0
+    for m in range(grid.shape[0]):
+        f = f * grid[m] + coords[s, m]
+    return f
+
+
+@njit(cache=True)
+def _plan(flat, grid, coords, count, amax, hot, threshold, adds, frees):
+    dim = grid.shape[0]
+    keep = np.empty(count, dtype=np.bool_)
+    for s in range(count):
+        keep[s] = amax[s] > threshold or amax[s] * _SCALE >= 1.0
+
+    # A hot face drives Δ𝒜 into the neighbouring brick: keep it, or activate it
+    added = 0
+    for s in range(count):
+        for m in range(dim):
+            for side in range(2):
+                if not hot[s, 2 * m + side]:
+                    continue
+                f = 0
+                for n in range(dim):
+                    c = coords[s, n]
+                    if n == m:
+                        c = (c + (1 if side else -1)) % grid[n]
+                    f = f * grid[n] + c
+                slot = flat[f]
+                if slot >= 0:
+                    keep[slot] = True
+                elif slot == -1:
+                    flat[f] = -2  # pending, so each brick is activated once
+                    adds[added] = f
+                    added += 1
+
+    # Descending, so swap-removal in _release never moves a brick that is still to be freed
+    released = 0
+    for s in range(count - 1, -1, -1):
+        if not keep[s]:
+            frees[released] = s
+            released += 1
+    return added, released
+
+
+@njit(cache=True)
+def _release(pool, coords, flat, grid, count, frees, released):
+    for t in range(released):
+        s = frees[t]
+        flat[_flat(coords, s, grid)] = -1
+        last = count - 1
+        if s != last:
+            pool[s] = pool[last]
+            coords[s] = coords[last]
+            flat[_flat(coords, s, grid)] = s
+        count -= 1
+    return count
+
+
+@njit(cache=True)
+def _activate(pool, coords, flat, grid, count, adds, added):
+    dim = grid.shape[0]
+    for t in range(added):
+        s = count + t
+        f = adds[t]
+        flat[f] = s
+        for m in range(dim - 1, -1, -1):
+            coords[s, m] = f % grid[m]
+            f //= grid[m]
+        pool[s] = 0
+    return count + added
@@ -1,29 +1,331 @@
 from __future__ import annotations
 import numpy as np
+from numba import njit, prange
 from typing import TYPE_CHECKING
 
+from zenoengine.fields.bricks import DEFAULT_BRICK_SIZE, BrickGrid
+from zenoengine.fields.halo import BoundarySpec, interior, pad_shape, refresh_halo
+
 if TYPE_CHECKING:
     from zenoengine.config.config import PGNSConfig
 
 
 class SymbolicField:
-    def __init__(self, config: PGNSConfig):
+    """
+    Field storage for a simulation.
+
+    With `halo` > 0 the array lives in padded storage (`data`) with `halo`
+    ghost layers per side, and `values` is a view of the interior. Call
+    `refresh_halo()` before a stencil pass to apply the boundary condition.
+
+    With `members` > 0 the field is an ensemble: `values` gains a leading
+    member axis and every member is initialized from the scene separately
+    (member b seeded with `seed + b` when a seed is given).
+
+    `dtype` sets the storage precision (float32 halves the bytes every
+    stencil sweep streams) and whether the field is complex; scene
+    initializers write into it directly.
+
+    `layout="soa"` stores a complex field as separate real and imaginary
+    planes (`planes`, with `re`/`im` views) for the structure-of-arrays
+    kernels. `values` and `data` are then None; `as_complex()` and
+    `to_aos()` give observers an interleaved copy.
+
+    `layout="bricks"` stores a bare periodic field block-sparsely in
+    `bricks` (a `BrickGrid` of `brick_size`-cell bricks, keeping only those
+    whose |ψ| exceeds `brick_threshold`). Scenes with an analytic sampler
+    are initialized brick slab by brick slab, so grids that would not fit
+    densely can still be built; `values` and `data` are None.
+
+    `symmetric=True` stores only the fundamental domain of the scene's
+    declared `Symmetry` (e.g. one octant of a mirror-symmetric 3D pulse),
+    with the halo and boundary that enforce it. `shape` is then the
+    domain's; `full_shape` is the box, and `snapshot()` rebuilds it.
+    """
+
+    def __init__(
+        self,
+        config: PGNSConfig,
+        halo: int = 0,
+        boundary: BoundarySpec = "periodic",
+        fill_value: float = 0.0,
+        members: int = 0,
+        seed: int | None = None,
+        dtype: np.dtype | type = np.float64,
+        layout: str = "aos",
+        brick_size: int = 0,
+        brick_threshold: float = 0.0,
+        symmetric: bool = False
+    ):
         # 👇 Deferred import to avoid circular dependency
-        from zenoengine.scenes.scene_registry import SCENES
+        from zenoengine.scenes.registry import SCENES
 
-        self.config = config
         shape = (config.grid_size,) * config.dimension
-        self.values: np.ndarray = np.zeros(shape, dtype=np.float64)
-
-        # Use scene-specific initializer
         scene = SCENES.get(config.scene)
-        if scene:
-            scene.init(self)
+        self.full_shape = shape
+        self.symmetry = None
+        if symmetric and (scene is None or scene.symmetry is None):
+            print(f"[Field] Warning: scene {config.scene} declares no symmetry; simulating the full box")
+        elif symmetric:
+            if members or layout != "aos" or not isinstance(boundary, str):
+                raise ValueError("Symmetry-reduced fields use single-field AoS storage with one box boundary")
+            scene.symmetry.check(shape, boundary)
+            self.symmetry = scene.symmetry
+            shape = self.symmetry.domain(shape)
+            boundary = self.symmetry.boundary(len(shape), boundary)
+            if self.symmetry.mirror:
+                halo = max(halo, 1)
+
+        if halo == 0 and boundary != "periodic":
+            raise ValueError("Non-periodic boundaries require a halo of at least 1")
+        if members and halo:
+            raise ValueError("Ensemble fields use bare periodic storage (halo = 0)")
+        if layout not in ("aos", "soa", "bricks"):
+            raise ValueError(f"Unknown field layout '{layout}'; expected 'aos', 'soa' or 'bricks'")
+        if layout == "soa" and (not np.issubdtype(dtype, np.complexfloating) or halo or members):
+            raise ValueError("SoA layout needs a complex dtype on bare single-field storage (halo = 0)")
+        if layout == "bricks" and (halo or members):
+            raise ValueError("Brick layout needs bare periodic single-field storage (halo = 0)")
+
+        self.config = config
+        self.halo = halo
+        self.boundary = boundary
+        self.fill_value = fill_value
+        self.members = members
+        self.layout = "aos"
+
+        if layout == "bricks":
+            brick = brick_size or DEFAULT_BRICK_SIZE[config.dimension]
+            if scene is not None and scene.sample is not None:
+                # Analytic scenes are sampled one brick-thick slab at a time; the dense field never exists
+                axes = [np.linspace(-1, 1, n) for n in shape]
+
+                def slab(i0: int, i1: int) -> np.ndarray:
+                    return scene.sample(*np.meshgrid(axes[0][i0:i1], *axes[1:], indexing="ij", sparse=True))
+
+                self.bricks = BrickGrid.from_slabs(shape, brick, dtype, slab, brick_threshold)
+                self.data = self.values = None
+                self.layout = "bricks"
+                return
+
+        if members:
+            self.data: np.ndarray = np.zeros((members,) + shape, dtype=dtype)
+            self.values: np.ndarray = self.data
         else:
+            self.data = np.zeros(pad_shape(shape, halo), dtype=dtype)
+            self.values = self.data[interior(len(shape), halo)]
+
+        # Use scene-specific initializer
+        if not scene:
             print(f"[Field] Warning: No initializer found for scene: {config.scene}")
+        elif self.reduced:
+            self._init_domain(scene, seed)
+        elif members:
+            for b in range(members):
+                if seed is not None:
+                    np.random.seed(seed + b)
+                scene.init(self.member(b))
+        else:
+            if seed is not None:
+                np.random.seed(seed)
+            scene.init(self)
+
+        if layout == "soa":
+            # Scenes initialize interleaved storage once; it is then split into planes
+            self.planes = np.empty((2,) + shape, dtype=np.finfo(dtype).dtype)
+            self.planes[0] = self.values.real
+            self.planes[1] = self.values.imag
+            self.re, self.im = self.planes
+            self.data = self.values = None
+            self.layout = "soa"
+        elif layout == "bricks":
+            self.bricks = BrickGrid.from_dense(self.values, brick, brick_threshold)
+            self.data = self.values = None
+            self.layout = "bricks"
+
+    def _init_domain(self, scene, seed: int | None) -> None:
+        # Analytic scenes are sampled on the domain only; others fill the box once and keep the domain
+        window = self.symmetry.window(self.full_shape)
+        if scene.sample is not None:
+            axes = [np.linspace(-1, 1, n)[w] for n, w in zip(self.full_shape, window)]
+            self.values[...] = scene.sample(*np.meshgrid(*axes, indexing="ij", sparse=True))
+            return
+        if seed is not None:
+            np.random.seed(seed)
+        box = self.view(np.zeros(self.full_shape, dtype=self.values.dtype))
+        scene.init(box)
+        self.values[...] = box.values[window]
+
+    @property
+    def reduced(self) -> bool:
+        return self.symmetry is not None
+
+    @property
+    def multiplicity(self) -> int:
+        """
+        Box cells each stored cell stands for (1 unless symmetry-reduced).
+        """
+        return self.symmetry.multiplicity(self.full_shape) if self.reduced else 1
+
+    @property
+    def ensemble(self) -> bool:
+        return self.members > 0
+
+    @property
+    def soa(self) -> bool:
+        return self.layout == "soa"
+
+    @property
+    def sparse(self) -> bool:
+        return self.layout == "bricks"
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        if self.sparse:
+            return self.bricks.shape
+        return self.re.shape if self.soa else self.values.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        if self.sparse:
+            return self.bricks.dtype
+        return np.result_type(self.re.dtype, np.complex64) if self.soa else self.values.dtype
+
+    def as_complex(self, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Interleaved dense copy of an SoA or brick field (the field itself when already dense AoS).
+        """
+        if self.sparse:
+            return self.bricks.to_dense(out)
+        if not self.soa:
+            return self.values
+        if out is None:
+            out = np.empty(self.shape, dtype=self.dtype)
+        _interleave_flat(self.re.reshape(-1), self.im.reshape(-1), out.reshape(-1))
+        return out
+
+    def to_aos(self) -> SymbolicField:
+        """
+        AoS field for renderers and exporters: `self`, or a detached
+        interleaved (dense) copy of an SoA or brick field.
+        """
+        if not (self.soa or self.sparse):
+            return self
+        view = SymbolicField.__new__(SymbolicField)
+        view.__dict__.update(self.__dict__)
+        view.layout = "aos"
+        view.data = view.values = self.as_complex()
+        return view
+
+    def member(self, b: int) -> SymbolicField:
+        """
+        Single-field view of ensemble member `b` (shares storage with the ensemble).
+        """
+        return self.view(self.values[b])
+
+    def view(self, values: np.ndarray) -> SymbolicField:
+        """
+        Bare AoS field over `values` with this field's settings, e.g. an
+        ensemble member or the composite of an adaptive hierarchy.
+        """
+        view = SymbolicField.__new__(SymbolicField)
+        view.config = self.config
+        view.halo = 0
+        view.boundary = self.boundary
+        view.fill_value = self.fill_value
+        view.members = 0
+        view.layout = "aos"
+        view.symmetry = None
+        view.full_shape = values.shape
+        view.data = view.values = values
+        return view
+
+    @property
+    def padded(self) -> bool:
+        return self.halo > 0
+
+    def refresh_halo(self) -> None:
+        """
+        Fill the ghost layers from the interior according to `boundary`.
+        """
+        refresh_halo(self.data, self.halo, self.boundary, self.fill_value)
 
     def apply_delta(self, delta: np.ndarray, dt: float) -> None:
-        self.values += delta * dt
+        """
+        In-place forward update ψ ← ψ + Δ·dt, without a Δ·dt temporary.
+        SoA fields take Δ as (2, *shape) real/imaginary planes or as a
+        complex array; brick fields take Δ in the pool's layout (one brick
+        per active slot, as `brick_pgns_operator` returns it).
+        """
+        if np.iscomplexobj(delta) and not np.issubdtype(self.dtype, np.complexfloating):
+            raise TypeError(
+                "A real field cannot take a complex Δ without losing its imaginary part; "
+                "store the field as complex (engine.field_type = 'complex')"
+            )
+        if self.sparse:
+            count = self.bricks.count
+            _axpy_flat(self.bricks.active.reshape(-1), delta[:count].reshape(-1), dt)
+            return
+        if self.soa:
+            re, im = self.re.reshape(-1), self.im.reshape(-1)
+            if np.iscomplexobj(delta):
+                _axpy_split(re, im, delta.reshape(-1), dt)
+            else:
+                _axpy_flat(re, delta[0].reshape(-1), dt)
+                _axpy_flat(im, delta[1].reshape(-1), dt)
+            return
+        if self.values.flags.c_contiguous:
+            _axpy_flat(self.values.reshape(-1), delta.reshape(-1), dt)
+        elif self.values.ndim == 1:
+            _axpy_1d(self.values, delta, dt)
+        elif self.values.ndim == 2:
+            _axpy_2d(self.values, delta, dt)
+        else:
+            _axpy_3d(self.values, delta, dt)
 
     def snapshot(self) -> np.ndarray:
-        return self.values.copy()
+        if self.reduced:
+            return self.symmetry.expand(self.values, self.full_shape)
+        return self.as_complex() if self.soa or self.sparse else self.values.copy()
+
+
+@njit(parallel=True, cache=True)
+def _axpy_flat(values, delta, dt):
+    for i in prange(values.size):
+        values[i] += delta[i] * dt
+
+
+# Interior views of padded storage are strided, so they get shape-aware loops
+@njit(parallel=True, cache=True)
+def _axpy_1d(values, delta, dt):
+    for i in prange(values.shape[0]):
+        values[i] += delta[i] * dt
+
+
+@njit(parallel=True, cache=True)
+def _axpy_2d(values, delta, dt):
+    for i in prange(values.shape[0]):
+        for j in range(values.shape[1]):
+            values[i, j] += delta[i, j] * dt
+
+
+@njit(parallel=True, cache=True)
+def _axpy_3d(values, delta, dt):
+    for i in prange(values.shape[0]):
+        for j in range(values.shape[1]):
+            for k in range(values.shape[2]):
+                values[i, j, k] += delta[i, j, k] * dt
+
+
+@njit(parallel=True, cache=True)
+def _axpy_split(re, im, delta, dt):
+    for i in prange(re.size):
+        d = delta[i]
+        re[i] += d.real * dt
+        im[i] += d.imag * dt
+
+
+@njit(parallel=True, cache=True)
+def _interleave_flat(re, im, out):
+    for i in prange(re.size):
+        out[i] = complex(re[i], im[i])
@@ -0,0 +1,97 @@
+from __future__ import annotations
+import numpy as np
+from typing import Literal, Sequence, Union
+
+Boundary = Literal["periodic", "reflect", "fixed"]
+BoundarySpec = Union[Boundary, Sequence[Union[Boundary, Sequence[Boundary]]]]
+
+BOUNDARIES: tuple[str, ...] = ("periodic", "reflect", "fixed")
+
+
+def interior(ndim: int, halo: int) -> tuple[slice, ...]:
+    """
+    Index selecting the interior of padded storage with `halo` ghost layers per side.
+    """
+    if halo == 0:
+        return (slice(None),) * ndim
+    return (slice(halo, -halo),) * ndim
+
+
+def pad_shape(shape: tuple[int, ...], halo: int) -> tuple[int, ...]:
+    return tuple(n + 2 * halo for n in shape)
+
+
+def refresh_halo(
+    data: np.ndarray,
+    halo: int,
+    boundary: BoundarySpec = "periodic",
+    fill_value: float = 0.0
+) -> None:
+    """
+    Fill the ghost layers of padded field storage in place.
+
+    Boundaries:
+        periodic: ghosts copy the opposite edge of the interior
+        reflect:  ghosts mirror the interior about the boundary face (zero flux)
+        fixed:    ghosts hold `fill_value` (Dirichlet)
+
+    `boundary` is one mode for every side, one mode per axis, or a
+    (low, high) pair per axis. Axes are filled in order, so edge and corner
+    ghosts end up consistent with the faces they touch.
+    """
+    if halo == 0:
+        return
+
+    for axis, (low, high) in enumerate(_per_axis(boundary, data.ndim)):
+        n = data.shape[axis] - 2 * halo
+        if n < halo and "fixed" not in (low, high):
+            raise ValueError(f"Axis {axis} interior ({n}) is narrower than the halo ({halo})")
+        _fill_side(data, axis, halo, n, low, fill_value, high_side=False)
+        _fill_side(data, axis, halo, n, high, fill_value, high_side=True)
+
+
+def _per_axis(boundary: BoundarySpec, ndim: int) -> list[tuple[str, str]]:
+    if isinstance(boundary, str):
+        specs: list = [boundary] * ndim
+    else:
+        specs = list(boundary)
+        if len(specs) != ndim:
+            raise ValueError(f"Expected {ndim} boundary specs, got {len(specs)}")
+
+    sides = []
+    for spec in specs:
+        low, high = (spec, spec) if isinstance(spec, str) else tuple(spec)
+        for mode in (low, high):
+            if mode not in BOUNDARIES:
+                raise ValueError(f"Unknown boundary: {mode}")
+        sides.append((low, high))
+    return sides
+
+
+def _fill_side(
+    data: np.ndarray,
+    axis: int,
+    halo: int,
+    n: int,
+    mode: str,
+    fill_value: float,
+    high_side: bool
+) -> None:
+    def sl(start: int, stop: int, step: int = 1) -> tuple[slice, ...]:
+        index = [slice(None)] * data.ndim
+        index[axis] = slice(start, stop, step) if step > 0 else slice(stop - 1, _rev_stop(start), -1)
+        return tuple(index)
+
+    ghost = sl(halo + n, 2 * halo + n) if high_side else sl(0, halo)
+
+    if mode == "fixed":
+        data[ghost] = fill_value
+    elif mode == "periodic":
+        data[ghost] = data[sl(halo, 2 * halo)] if high_side else data[sl(n, n + halo)]
+    else:  # reflect
+        data[ghost] = data[sl(n, n + halo, -1)] if high_side else data[sl(halo, 2 * halo, -1)]
+
+
+def _rev_stop(start: int) -> int | None:
+    # slice(stop - 1, start - 1, -1) must use None when walking down to index 0
+    return start - 1 if start > 0 else None
@@ -0,0 +1,146 @@
+from __future__ import annotations
+import itertools
+from dataclasses import dataclass
+
+import numpy as np
+from numba import njit, prange
+
+from zenoengine.core.operators.fused import _acc, _p
+from zenoengine.core.partition_geometry import get_partition_table
+from zenoengine.core.precision import real_dtype
+from zenoengine.fields.halo import Boundary, BoundarySpec
+
+
+@dataclass(frozen=True)
+class Symmetry:
+    """
+    A symmetry a scene's initial field has and the dynamics keep, so only
+    a fundamental domain of the periodic box needs to be simulated.
+
+    mirror: axes along which ψ[i] = ψ[n - 1 - i] (reflection about the box
+            centre). The domain keeps the upper half of each such axis; its
+            low face is the centre plane (a reflecting halo), and its high
+            face is the box edge, which under periodic wrap also borders
+            the mirror image. Halves the cells per mirrored axis.
+    period: translation period in cells along every axis (0 = none). The
+            domain is one period cell, kept periodic.
+
+    Translations commute with every operator. Reflections do not commute
+    with the torsion term 𝒯 (odd under reflection), so simulations
+    decide whether a mirror reduction is exact for their coefficients,
+    and box sums of |𝒯| need `torsion_energy` rather than a rescale.
+    """
+
+    mirror: tuple[int, ...] = ()
+    period: int = 0
+
+    def check(self, shape: tuple[int, ...], boundary: Boundary = "periodic") -> None:
+        """
+        Raise ValueError unless the reduction is exact on a box of `shape` with `boundary`.
+        """
+        if bool(self.mirror) == bool(self.period):
+            raise ValueError("A symmetry is either a mirror or a translation period")
+        for axis in self.mirror:
+            if axis >= len(shape) or shape[axis] % 2:
+                raise ValueError(f"Mirror axis {axis} needs an even number of cells, got shape {shape}")
+        if self.period:
+            if any(n % self.period for n in shape):
+                raise ValueError(f"Grid {shape} is not a whole number of {self.period}-cell periods")
+            if boundary != "periodic":
+                raise ValueError("Translation symmetry needs a periodic box")
+
+    def window(self, shape: tuple[int, ...]) -> tuple[slice, ...]:
+        """
+        Index of the fundamental domain within the full box.
+        """
+        if self.period:
+            return (slice(0, self.period),) * len(shape)
+        return tuple(slice(n // 2, n) if axis in self.mirror else slice(None) for axis, n in enumerate(shape))
+
+    def domain(self, shape: tuple[int, ...]) -> tuple[int, ...]:
+        return tuple(len(range(*s.indices(n))) for s, n in zip(self.window(shape), shape))
+
+    def multiplicity(self, shape: tuple[int, ...]) -> int:
+        """
+        Full-box cells per domain cell (8 for a 3D octant).
+        """
+        return int(np.prod(shape)) // int(np.prod(self.domain(shape)))
+
+    def boundary(self, ndim: int, box: Boundary = "periodic") -> BoundarySpec:
+        """
+        Halo boundary of the domain: reflecting at mirror planes, the box's own condition elsewhere.
+        """
+        if not self.mirror:
+            return box
+        edge = "reflect" if box == "periodic" else box
+        return [("reflect", edge) if axis in self.mirror else box for axis in range(ndim)]
+
+    def expand(self, values: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+        """
+        Full-box field rebuilt from the domain `values`.
+        """
+        if self.period:
+            return np.tile(values, tuple(n // self.period for n in shape))
+        for axis in self.mirror:
+            values = np.concatenate((np.flip(values, axis), values), axis=axis)
+        return values
+
+    def torsion_energy(self, data: np.ndarray, halo: int, p_table: np.ndarray | None = None) -> float | None:
+        """
+        Σ|𝒯| over the full box from a mirror domain with refreshed halos.
+
+        A mirror image flips the sign of 𝒯's differences along the
+        reflected axes, so |𝒯| of an image is not |𝒯| of the domain cell
+        once two or more axes are mirrored; every image is summed here.
+
+        Returns:
+            the box sum, or None when multiplicity × domain sum is already exact
+        """
+        if len(self.mirror) < 2:
+            return None
+        if p_table is None:
+            p_table = get_partition_table(dtype=real_dtype(data.dtype))
+        ndim = data.ndim
+        flips = np.array(
+            [[sign[self.mirror.index(a)] if a in self.mirror else 1.0 for a in range(ndim)]
+             for sign in itertools.product((1.0, -1.0), repeat=len(self.mirror))]
+        )
+        rows = np.zeros(data.shape[0] - 2 * halo, dtype=np.float64)
+        kernel = _image_torsion_2d if ndim == 2 else _image_torsion_3d
+        kernel(data, halo, p_table, flips, rows)
+        return float(rows.sum())
+
+
+# --- Box torsion sums over mirror images (padded storage) -------------------
+
+@njit(parallel=True, cache=True)
+def _image_torsion_2d(data, h, p_table, flips, rows):
+    nx = data.shape[0] - 2 * h
+    ny = data.shape[1] - 2 * h
+    for r in prange(nx):
+        i = r + h
+        total = 0.0
+        for j in range(h, ny + h):
+            tx = _p(p_table, data[i + 1, j]) - _p(p_table, data[i - 1, j])
+            ty = _p(p_table, data[i, j + 1]) - _p(p_table, data[i, j - 1])
+            for s in range(flips.shape[0]):
+                total = _acc(total, abs(flips[s, 0] * tx + flips[s, 1] * ty))
+        rows[r] = total
+
+
+@njit(parallel=True, cache=True)
+def _image_torsion_3d(data, h, p_table, flips, rows):
+    nx = data.shape[0] - 2 * h
+    ny = data.shape[1] - 2 * h
+    nz = data.shape[2] - 2 * h
+    for r in prange(nx):
+        i = r + h
+        total = 0.0
+        for j in range(h, ny + h):
+            for k in range(h, nz + h):
+                tx = _p(p_table, data[i + 1, j, k]) - _p(p_table, data[i - 1, j, k])
+                ty = _p(p_table, data[i, j + 1, k]) - _p(p_table, data[i, j - 1, k])
+                tz = _p(p_table, data[i, j, k + 1]) - _p(p_table, data[i, j, k - 1])
+                for s in range(flips.shape[0]):
+                    total = _acc(total, abs(flips[s, 0] * tx + flips[s, 1] * ty + flips[s, 2] * tz))
+        rows[r] = total
@@ -2,7 +2,10 @@ from __future__ import annotations
 import os
 import json
 import csv
-from zenoengine.config.config import PGNSConfig
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from zenoengine.config.config import PGNSConfig
 
 
 def export_benchmark_metrics(
@@ -1,25 +1,38 @@
+from __future__ import annotations
 import os
 import numpy as np
-from PIL import Image
-from zenoengine.fields.field import SymbolicField
-from zenoengine.config.config import PGNSConfig
+from typing import TYPE_CHECKING
+
 from zenoengine.io.snapshot import save_npy
+from zenoengine.vis.renderer import grayscale
+
+if TYPE_CHECKING:
+    from zenoengine.fields.field import SymbolicField
+    from zenoengine.config.config import PGNSConfig
 
 
 def export_snapshot(field: SymbolicField, config: PGNSConfig) -> None:
     """
     Save final field snapshot as both .npy and .png image.
+    Brick fields are written as their active bricks (.npz) instead of .npy.
     """
-    arr = field.snapshot()
     os.makedirs(config.output_dir, exist_ok=True)
+    if field.sparse:
+        path = os.path.join(config.output_dir, f"{config.scene}_final_bricks.npz")
+        field.bricks.save(path)
+        print(f"[Export] Saved {field.bricks.count} active bricks to {path}")
+        if config.dimension == 3:
+            # 3D has no image export, and the dense field may not fit in memory
+            return
+    arr = field.snapshot()
 
     # Save .npy raw data
-    npy_filename = f"{config.scene}_final.npy"
-    save_npy(arr, filename=npy_filename, output_dir=config.output_dir)
+    if not field.sparse:
+        npy_filename = f"{config.scene}_final.npy"
+        save_npy(arr, filename=npy_filename, output_dir=config.output_dir)
 
-    # Save image
-    norm = (arr - arr.min()) / (arr.max() - arr.min() + 1e-8)
-    image_data = np.uint8(norm * 255)
+    # Save image (complex fields by magnitude)
+    image_data = grayscale(arr)
 
     if config.dimension == 2:
         rgb = np.stack([image_data] * 3, axis=-1)
@@ -31,6 +44,8 @@ def export_snapshot(field: SymbolicField, config: PGNSConfig) -> None:
         print("[Export] Unsupported dimension for image export.")
         return
 
+    from PIL import Image
+
     img = Image.fromarray(rgb)
     img_path = os.path.join(config.output_dir, f"{config.scene}_final.png")
     img.save(img_path)
@@ -1,3 +1,4 @@
+from __future__ import annotations
 import os
 import json
 import csv
@@ -9,16 +10,63 @@ class MetricTracker:
         self.output_dir = output_dir
         self.data = []
 
-    def record(self, step: int, time: float, psi: np.ndarray, R: np.ndarray, T: np.ndarray) -> None:
+    def record(
+        self,
+        step: int,
+        time: float,
+        psi: np.ndarray,
+        R: np.ndarray,
+        T: np.ndarray,
+        S: np.ndarray | None = None
+    ) -> None:
+        self.record_scalars(
+            step=step,
+            time=time,
+            field_energy=float(np.sum(np.abs(psi))),
+            curvature_energy=float(np.sum(np.abs(R))),
+            torsion_energy=float(np.sum(np.abs(T))),
+            entropy_energy=float(np.sum(np.abs(S))) if S is not None else None
+        )
+
+    def record_scalars(
+        self,
+        step: int,
+        time: float,
+        field_energy: float,
+        curvature_energy: float,
+        torsion_energy: float,
+        entropy_energy: float | None = None
+    ) -> None:
+        """
+        Record pre-reduced energies (e.g. from in-kernel partial sums) without touching any grid.
+        Every row carries the same keys; an energy the caller did not compute is None.
+        """
         metrics = {
             "step": step,
             "time": round(time, 6),
-            "field_energy": float(np.sum(np.abs(psi))),
-            "curvature_energy": float(np.sum(np.abs(R))),
-            "torsion_energy": float(np.sum(np.abs(T)))
+            "field_energy": field_energy,
+            "curvature_energy": curvature_energy,
+            "torsion_energy": torsion_energy,
+            "entropy_energy": entropy_energy
         }
         self.data.append(metrics)
 
+    def record_members(self, step: int, time: float, energies: np.ndarray) -> None:
+        """
+        Record one row per ensemble member from a (members, 4) array of
+        (field, curvature, torsion, entropy) energies.
+        """
+        for member, (field_energy, curvature_energy, torsion_energy, entropy_energy) in enumerate(energies):
+            self.record_scalars(
+                step=step,
+                time=time,
+                field_energy=float(field_energy),
+                curvature_energy=float(curvature_energy),
+                torsion_energy=float(torsion_energy),
+                entropy_energy=float(entropy_energy)
+            )
+            self.data[-1]["member"] = member
+
     def export_json(self) -> None:
         path = os.path.join(self.output_dir, f"{self.scene}_metrics.json")
         os.makedirs(self.output_dir, exist_ok=True)
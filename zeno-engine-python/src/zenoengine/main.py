@@ -4,7 +4,6 @@ import argparse
 from typing import Dict, Any
 
 from zenoengine.config.config_loader import load_config_with_overrides
-from zenoengine.sim.controller import run_simulation
 
 
 def parse_cli_args() -> tuple[dict[str, Any], str | None]:
@@ -17,6 +16,8 @@ def parse_cli_args() -> tuple[dict[str, Any], str | None]:
     parser.add_argument("--dim", type=int, choices=[1, 2, 3], help="Number of dimensions")
     parser.add_argument("--grid", type=int, help="Grid size (assumes NxN or NxNxN)")
     parser.add_argument("--steps", type=int, help="Total simulation steps")
+    parser.add_argument("--dt", type=float, help="Time step (adaptive integrators: initial step)")
+    parser.add_argument("--integrator", type=str, choices=["euler", "rk2", "rk4", "rk23"], help="Time integrator")
     parser.add_argument("--lattice", type=str, help="Lattice type (grid, hex, etc.)")
     parser.add_argument("--mode", type=str, choices=["symbolic", "classical"], help="Simulation mode")
     parser.add_argument("--threads", type=int, help="Thread count (or 0 to disable multithreading)")
@@ -40,6 +41,10 @@ def parse_cli_args() -> tuple[dict[str, Any], str | None]:
         overrides["defaults.grid_size"] = (args.grid,) * args.dim if args.dim else (args.grid, args.grid)
     if args.steps:
         overrides["defaults.simulation_steps"] = args.steps
+    if args.dt:
+        overrides["defaults.time_step"] = args.dt
+    if args.integrator:
+        overrides["engine.integrator"] = args.integrator
     if args.lattice:
         overrides["defaults.lattice_type"] = args.lattice
     if args.mode:
@@ -61,6 +66,9 @@ def parse_cli_args() -> tuple[dict[str, Any], str | None]:
 
 
 def main() -> None:
+    # The engine (Numba kernels, renderers) is only imported once a run actually starts
+    from zenoengine.engine.controller import run_simulation
+
     overrides, config_path = parse_cli_args()
 
     config = load_config_with_overrides(
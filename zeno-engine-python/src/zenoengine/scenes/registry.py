@@ -2,14 +2,29 @@ from __future__ import annotations
 import numpy as np
 from typing import Callable
 from zenoengine.fields.field import SymbolicField
+from zenoengine.fields.symmetry import Symmetry
 
 SceneInitFunc = Callable[[SymbolicField], None]
+# Analytic scenes: values at open-grid coordinates on [-1, 1] (np.meshgrid(..., sparse=True))
+SceneSampleFunc = Callable[..., np.ndarray]
 
 
 class SimulationScene:
-    def __init__(self, name: str, init: SceneInitFunc):
+    def __init__(
+        self,
+        name: str,
+        init: SceneInitFunc,
+        dimension: int,
+        sample: SceneSampleFunc | None = None,
+        symmetry: Symmetry | None = None
+    ):
         self.name = name
         self.init = init
+        self.dimension = dimension
+        # Lets block-sparse fields initialize brick by brick without a dense array
+        self.sample = sample
+        # Lets engine.symmetry simulate only a fundamental domain
+        self.symmetry = symmetry
 
 
 def rti_2d_initializer(field: SymbolicField) -> None:
@@ -20,9 +35,13 @@ def rti_2d_initializer(field: SymbolicField) -> None:
     arr += np.random.normal(scale=0.05, size=arr.shape)
 
 
+def pulse_1d_sample(x: np.ndarray) -> np.ndarray:
+    return np.exp(-100 * x**2)
+
+
 def pulse_1d_initializer(field: SymbolicField) -> None:
     x = np.linspace(-1, 1, field.config.grid_size)
-    field.values[:] = np.exp(-100 * x**2)
+    field.values[:] = pulse_1d_sample(x)
 
 
 def checkerboard_2d_initializer(field: SymbolicField) -> None:
@@ -31,18 +50,22 @@ def checkerboard_2d_initializer(field: SymbolicField) -> None:
             field.values[i, j] = (-1) ** (i + j)
 
 
+def pulse_3d_sample(X: np.ndarray, Y: np.ndarray, Z: np.ndarray) -> np.ndarray:
+    return np.exp(-50 * (X**2 + Y**2 + Z**2))
+
+
 def pulse_3d_initializer(field: SymbolicField) -> None:
     size = field.config.grid_size
     x = np.linspace(-1, 1, size)
     y = np.linspace(-1, 1, size)
     z = np.linspace(-1, 1, size)
     X, Y, Z = np.meshgrid(x, y, z, indexing="ij")
-    field.values[:] = np.exp(-50 * (X**2 + Y**2 + Z**2))
+    field.values[:] = pulse_3d_sample(X, Y, Z)
 
 
 SCENES: dict[str, SimulationScene] = {
-    "RTI_2D": SimulationScene("RTI_2D", rti_2d_initializer),
-    "Pulse_1D": SimulationScene("Pulse_1D", pulse_1d_initializer),
-    "Checkerboard_2D": SimulationScene("Checkerboard_2D", checkerboard_2d_initializer),
-    "Pulse_3D": SimulationScene("Pulse_3D", pulse_3d_initializer),
+    "RTI_2D": SimulationScene("RTI_2D", rti_2d_initializer, 2),
+    "Pulse_1D": SimulationScene("Pulse_1D", pulse_1d_initializer, 1, pulse_1d_sample, Symmetry(mirror=(0,))),
+    "Checkerboard_2D": SimulationScene("Checkerboard_2D", checkerboard_2d_initializer, 2, symmetry=Symmetry(period=2)),
+    "Pulse_3D": SimulationScene("Pulse_3D", pulse_3d_initializer, 3, pulse_3d_sample, Symmetry(mirror=(0, 1, 2))),
 }
@@ -2,12 +2,10 @@ from __future__ import annotations
 import os
 import time
 import numpy as np
-import imageio.v3 as iio
 from typing import List, Optional, TYPE_CHECKING
 
-from zenoengine.config.config import PGNSConfig
-
 if TYPE_CHECKING:
+    from zenoengine.config.config import PGNSConfig
     from zenoengine.fields.field import SymbolicField
 
 
@@ -46,6 +44,8 @@ class FrameCollector:
         if not self.frames or not self.config.save_images:
             return
 
+        import imageio.v3 as iio
+
         os.makedirs(self.config.output_dir, exist_ok=True)
         path = os.path.join(self.config.output_dir, f"{self.config.scene}_evolution.gif")
         iio.imwrite(path, self.frames, duration=1 / 10, loop=0)
@@ -55,6 +55,8 @@ class FrameCollector:
         if not self.frames or not self.config.save_video:
             return
 
+        import imageio.v3 as iio
+
         os.makedirs(self.config.output_dir, exist_ok=True)
         path = os.path.join(self.config.output_dir, f"{self.config.scene}_evolution.mp4")
         iio.imwrite(path, self.frames, fps=30)
@@ -1,8 +1,21 @@
 from __future__ import annotations
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-from zenoengine.fields.field import SymbolicField
-from zenoengine.config.config import PGNSConfig
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from zenoengine.fields.field import SymbolicField
+    from zenoengine.config.config import PGNSConfig
+
+
+def grayscale(values: np.ndarray) -> np.ndarray:
+    """
+    Map a field to 0–255 gray levels over its own range. Complex fields
+    are shown by magnitude |ψ| (min/max of complex values would order them
+    lexicographically, and the uint8 cast would drop the imaginary part).
+    """
+    data = np.abs(values) if np.iscomplexobj(values) else values
+    norm = (data - data.min()) / (data.max() - data.min() + 1e-8)
+    return np.uint8(255 * norm)
 
 
 def render_frame(
@@ -15,16 +28,18 @@ def render_frame(
     Render a grayscale RGB image with step count and FPS overlay.
     Supports 1D, 2D, and 3D (via center slice).
     """
+    # PIL is only loaded once a frame is actually rendered
+    from PIL import Image, ImageDraw, ImageFont
+
     psi = field.snapshot()
     dim = config.dimension
 
     # Normalize field values to 0–255
-    data = psi.copy()
+    data = psi
     if dim == 3:
         mid = data.shape[2] // 2
         data = data[:, :, mid]
-    data_norm = (data - data.min()) / (data.max() - data.min() + 1e-8)
-    gray = np.uint8(255 * data_norm)
+    gray = grayscale(data)
 
     # Expand grayscale to RGB
     if dim == 1:
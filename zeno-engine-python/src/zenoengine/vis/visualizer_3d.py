@@ -1,10 +1,12 @@
-import pyvista as pv
+from __future__ import annotations
 import numpy as np
 
 def visualize_3d_field(field: np.ndarray, title: str = "3D Field Visualization") -> None:
     """
     Show a live 3D volume of a scalar field using PyVista.
     """
+    import pyvista as pv
+
     grid = pv.UniformGrid()
 
     # Set grid dimensions
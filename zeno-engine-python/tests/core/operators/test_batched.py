@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+from zenoengine.core.operators.batched import batched_pgns_operator, member_partials, reduce_member_partials
+from zenoengine.core.operators.fused import fused_pgns_operator, metric_partials, reduce_partials
+
+
+@pytest.mark.parametrize("shape", [(5, 11), (4, 6, 7), (3, 4, 5, 6)])
+def test_batched_matches_per_member_fused(shape):
+    rng = np.random.default_rng(len(shape))
+    psi = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    dim = len(shape) - 1
+
+    partials = member_partials(psi)
+    delta = batched_pgns_operator(psi, dim, partials=partials)
+    energies = reduce_member_partials(partials)
+
+    for b in range(shape[0]):
+        member = metric_partials(psi[b])
+        np.testing.assert_array_equal(delta[b], fused_pgns_operator(psi[b], dim, partials=member))
+        assert tuple(energies[b]) == reduce_partials(member)
+
+
+def test_batched_rejects_missing_member_axis():
+    with pytest.raises(ValueError):
+        batched_pgns_operator(np.zeros((8, 8)), 2)
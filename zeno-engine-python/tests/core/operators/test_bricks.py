@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from zenoengine.core.operators.bricks import brick_pgns_operator
+from zenoengine.core.operators.fused import fused_pgns_operator, metric_partials, reduce_partials
+from zenoengine.fields.bricks import BrickGrid
+from zenoengine.fields.field import _axpy_flat
+
+
+def _blob(shape, lo, hi, seed=2):
+    # Complex noise confined to [lo, hi) on every axis, zero elsewhere
+    rng = np.random.default_rng(seed)
+    psi = np.zeros(shape, dtype=np.complex128)
+    box = (slice(lo, hi),) * len(shape)
+    psi[box] = 0.05 * (rng.normal(size=psi[box].shape) + 1j * rng.normal(size=psi[box].shape))
+    return psi
+
+
+@pytest.mark.parametrize("shape, brick", [((64,), 8), ((32, 32), 8), ((16, 16, 16), 4)])
+def test_bricks_step_like_the_dense_field(shape, brick):
+    # The blob ends on a brick face, so the first update has to activate the neighbours
+    dense = _blob(shape, shape[0] // 2 - 3, shape[0] // 2)
+    grid = BrickGrid.from_dense(dense, brick)
+    start = grid.count
+
+    for _ in range(20):
+        dense_partials = metric_partials(dense)
+        expected = fused_pgns_operator(dense, len(shape), partials=dense_partials)
+        grid.update()
+        partials = np.full((grid.capacity, 4), np.nan)
+        delta = brick_pgns_operator(grid.pool, grid.index, grid.coords, grid.count, partials=partials)
+
+        _axpy_flat(dense.reshape(-1), expected.reshape(-1), 1e-5)
+        _axpy_flat(grid.active.reshape(-1), delta[:grid.count].reshape(-1), 1e-5)
+        np.testing.assert_array_equal(grid.to_dense(), dense)
+        np.testing.assert_allclose(reduce_partials(partials), reduce_partials(dense_partials), rtol=1e-12)
+
+    assert grid.count > start
+
+
+def test_unallocated_neighbours_read_as_zero():
+    psi = np.zeros((16, 16), dtype=np.complex128)
+    psi[4:8, 4:8] = 0.3 + 0.1j
+    grid = BrickGrid.from_dense(psi, 8)
+
+    delta = brick_pgns_operator(grid.pool, grid.index, grid.coords, grid.count, lambda_=0.2)
+
+    assert grid.count == 1
+    np.testing.assert_array_equal(delta[0], fused_pgns_operator(psi, 2, lambda_=0.2)[:8, :8])
+    with pytest.raises(ValueError):
+        brick_pgns_operator(grid.pool, grid.index.reshape(-1), grid.coords, grid.count)
@@ -1,5 +1,11 @@
+import re
 import numpy as np
+import pytest
+from zenoengine.core.operators import curvature, torsion
 from zenoengine.core.operators.curvature import curvature_operator
+from zenoengine.core.operators.torsion import torsion_operator
+from zenoengine.core.partition_geometry import get_partition_table
+from zenoengine.engine.warmup import uncached_copy
 
 def test_curvature_1d():
     values = np.ones(10)
@@ -22,3 +28,40 @@ def test_curvature_invalid_dim():
         assert False, "Expected ValueError for unsupported dim"
     except ValueError:
         pass
+
+
+def test_curvature_writes_into_out():
+    values = np.linspace(0, 1, 27).reshape(3, 3, 3)
+    out = np.empty_like(values)
+    result = curvature_operator(values, dim=3, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, curvature_operator(values, dim=3))
+
+
+def _llvm_ir(kernel):
+    return "\n".join(uncached_copy(kernel).inspect_llvm().values())
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3])
+def test_curvature_and_torsion_kernels_do_not_allocate(dim):
+    values = np.linspace(-1, 1, 4**dim).reshape((4,) * dim)
+    curvature_operator(values, dim)
+    torsion_operator(values, dim)
+
+    for kernel in (getattr(curvature, f"_curvature_{dim}d"), getattr(torsion, f"_torsion_{dim}d")):
+        ir = _llvm_ir(kernel)
+        assert not re.search(r"call [^\n]*@\"?NRT_MemInfo_(alloc|new)", ir)
+        assert re.search(r"<\d+ x double>", ir), f"{kernel.__name__} inner loop did not vectorize"
+
+
+@pytest.mark.parametrize("shape", [(1,), (2,), (2, 2), (7, 9), (3, 4, 5)])
+def test_curvature_matches_per_neighbour_reference(shape):
+    values = np.random.default_rng(3).uniform(-12.0, 12.0, size=shape)
+    p_table = get_partition_table()
+    P = p_table[np.minimum((np.abs(values) * 50).astype(int), 499)]
+
+    expected = np.zeros_like(P)
+    for axis in range(len(shape)):
+        expected += (P - np.roll(P, 1, axis=axis)) + (P - np.roll(P, -1, axis=axis))
+
+    np.testing.assert_allclose(curvature_operator(values, len(shape)), expected, atol=1e-12)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from zenoengine.core.operators.entropy import entropy_operator
+
+
+def _entropy_reference(values):
+    grad_squared = np.zeros_like(values)
+    for axis in range(values.ndim):
+        grad = 0.5 * (np.roll(values, -1, axis=axis) - np.roll(values, 1, axis=axis))
+        grad_squared += grad**2
+    return -np.sqrt(grad_squared) * values
+
+
+@pytest.mark.parametrize("shape", [(16,), (6, 7), (4, 5, 6)])
+def test_entropy_matches_roll_definition(shape):
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=shape)
+    np.testing.assert_allclose(entropy_operator(values, len(shape)), _entropy_reference(values), rtol=1e-12)
+
+
+def test_entropy_complex_values():
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=(6, 6)) + 1j * rng.normal(size=(6, 6))
+    np.testing.assert_allclose(entropy_operator(values, 2), _entropy_reference(values), rtol=1e-12)
+
+
+def test_entropy_writes_into_out():
+    values = np.linspace(-1, 1, 12)
+    out = np.empty_like(values)
+    assert entropy_operator(values, 1, out=out) is out
+
+
+def test_entropy_invalid_dim():
+    with pytest.raises(ValueError):
+        entropy_operator(np.ones((2, 2, 2, 2)), 4)
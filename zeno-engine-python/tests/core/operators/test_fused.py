@@ -0,0 +1,204 @@
+import numpy as np
+import pytest
+from zenoengine.core.operators.fused import fused_pgns_operator, metric_partials, partial_rows, reduce_partials
+from zenoengine.core.operators.stencil import curvature_torsion
+
+
+def _composite(psi, lambda_, kappa, beta):
+    R, T = curvature_torsion(psi, psi.ndim)
+    N = np.abs(psi) ** 2 * psi
+    grad_squared = np.zeros_like(psi)
+    for axis in range(psi.ndim):
+        grad = 0.5 * (np.roll(psi, -1, axis=axis) - np.roll(psi, 1, axis=axis))
+        grad_squared = grad_squared + grad**2
+    S = -np.sqrt(grad_squared) * psi
+    return -1j * (R + lambda_ * T + kappa * N + beta * S)
+
+
+@pytest.mark.parametrize("shape", [(32,), (12, 10), (6, 7, 8)])
+def test_fused_matches_composite_real(shape):
+    rng = np.random.default_rng(1)
+    psi = rng.uniform(-2.0, 2.0, size=shape)
+
+    delta = fused_pgns_operator(psi, len(shape), lambda_=0.4, kappa=0.9, beta=0.3)
+
+    assert delta.dtype == np.complex128
+    np.testing.assert_allclose(delta, _composite(psi, 0.4, 0.9, 0.3), rtol=1e-12, atol=1e-9)
+
+
+@pytest.mark.parametrize("shape", [(32,), (12, 10), (6, 7, 8)])
+def test_fused_matches_composite_complex(shape):
+    rng = np.random.default_rng(2)
+    psi = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+
+    delta = fused_pgns_operator(psi, len(shape), lambda_=0.1, kappa=0.5, beta=0.7)
+
+    np.testing.assert_allclose(delta, _composite(psi, 0.1, 0.5, 0.7), rtol=1e-12, atol=1e-9)
+
+
+def test_fused_writes_into_out_buffer():
+    psi = np.linspace(-1, 1, 16).reshape(4, 4)
+    out = np.empty((4, 4), dtype=np.complex128)
+    assert fused_pgns_operator(psi, 2, out=out) is out
+
+
+def test_fused_invalid_dim():
+    with pytest.raises(ValueError):
+        fused_pgns_operator(np.ones((2, 2, 2, 2)), 4)
+
+
+@pytest.mark.parametrize("shape", [(32,), (12, 10), (6, 7, 8)])
+def test_fused_exposes_curvature_and_torsion(shape):
+    rng = np.random.default_rng(3)
+    psi = rng.uniform(-3.0, 3.0, size=shape)
+    curv = np.empty(shape)
+    tors = np.empty(shape)
+
+    fused_pgns_operator(psi, len(shape), curv=curv, tors=tors)
+    R, T = curvature_torsion(psi, len(shape))
+
+    np.testing.assert_array_equal(curv, R)
+    np.testing.assert_array_equal(tors, T)
+
+
+@pytest.mark.parametrize("shape", [(32,), (12, 10), (6, 7, 8)])
+def test_fused_metric_partials_match_full_reductions(shape):
+    rng = np.random.default_rng(4)
+    psi = rng.uniform(-3.0, 3.0, size=shape)
+    curv = np.empty(shape)
+    tors = np.empty(shape)
+    partials = metric_partials(psi)
+
+    fused_pgns_operator(psi, len(shape), curv=curv, tors=tors, partials=partials)
+    field_e, curv_e, tors_e, entropy_e = reduce_partials(partials)
+
+    grad_squared = sum(
+        (0.5 * (np.roll(psi, -1, axis=a) - np.roll(psi, 1, axis=a))) ** 2 for a in range(psi.ndim)
+    )
+    np.testing.assert_allclose(field_e, np.sum(np.abs(psi)), rtol=1e-12)
+    np.testing.assert_allclose(curv_e, np.sum(np.abs(curv)), rtol=1e-12)
+    np.testing.assert_allclose(tors_e, np.sum(np.abs(tors)), rtol=1e-12)
+    np.testing.assert_allclose(entropy_e, np.sum(np.sqrt(grad_squared) * np.abs(psi)), rtol=1e-12)
+
+
+def test_fused_metric_partials_independent_of_thread_count():
+    import numba
+
+    rng = np.random.default_rng(5)
+    psi = rng.uniform(-1.0, 1.0, size=(64, 48))
+    totals = []
+    original = numba.get_num_threads()
+    try:
+        for threads in sorted({1, original}):
+            numba.set_num_threads(threads)
+            partials = metric_partials(psi)
+            fused_pgns_operator(psi, 2, partials=partials)
+            totals.append(reduce_partials(partials))
+    finally:
+        numba.set_num_threads(original)
+
+    assert all(t == totals[0] for t in totals)
+
+
+@pytest.mark.parametrize("shape", [(32,), (12, 10), (6, 7, 8)])
+@pytest.mark.parametrize("halo", [1, 2])
+def test_fused_padded_matches_periodic(shape, halo):
+    rng = np.random.default_rng(7)
+    psi = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    padded = np.pad(psi, halo, mode="wrap")
+
+    expected = fused_pgns_operator(psi, len(shape))
+    delta = fused_pgns_operator(padded, len(shape), halo=halo)
+
+    assert delta.shape == shape
+    np.testing.assert_array_equal(delta, expected)
+
+
+@pytest.mark.parametrize("tile", [(4, 4, 4), (3, 5, 7), (1, 2, 16), (64, 64, 64)])
+@pytest.mark.parametrize("halo", [0, 1])
+def test_tiled_3d_matches_row_sweep(tile, halo):
+    rng = np.random.default_rng(9)
+    psi = rng.normal(size=(9, 10, 11)) + 1j * rng.normal(size=(9, 10, 11))
+    expected = fused_pgns_operator(psi, 3)
+
+    source = np.pad(psi, halo, mode="wrap") if halo else psi
+    partials = metric_partials(psi, tile=tile)
+    curv = np.empty(psi.shape)
+    delta = fused_pgns_operator(source, 3, halo=halo, tile=tile, partials=partials, curv=curv)
+
+    np.testing.assert_array_equal(delta, expected)
+    np.testing.assert_array_equal(curv, curvature_torsion(psi, 3)[0].real)
+    assert partials.shape[0] == partial_rows(psi.shape, tile)
+
+    row_partials = metric_partials(psi)
+    fused_pgns_operator(psi, 3, partials=row_partials)
+    np.testing.assert_allclose(reduce_partials(partials), reduce_partials(row_partials), rtol=1e-12)
+
+
+def test_tile_is_ignored_below_3d():
+    psi = np.linspace(-1, 1, 64).reshape(8, 8)
+    np.testing.assert_array_equal(
+        fused_pgns_operator(psi, 2, tile=(2, 2, 2)), fused_pgns_operator(psi, 2)
+    )
+
+
+@pytest.mark.parametrize("shape", [(32,), (12, 10), (6, 7, 8)])
+def test_fused_single_precision_tracks_double(shape):
+    rng = np.random.default_rng(5)
+    psi = 0.02 * (rng.normal(size=shape) + 1j * rng.normal(size=shape))
+    psi32 = psi.astype(np.complex64)
+    partials64 = metric_partials(psi)
+    partials32 = metric_partials(psi32)
+
+    delta64 = fused_pgns_operator(psi, len(shape), partials=partials64)
+    delta32 = fused_pgns_operator(psi32, len(shape), partials=partials32)
+
+    assert delta32.dtype == np.complex64 and partials32.dtype == np.float64
+    np.testing.assert_allclose(delta32, delta64, rtol=1e-4, atol=1e-6)
+    np.testing.assert_allclose(reduce_partials(partials32), reduce_partials(partials64), rtol=1e-5)
+
+
+@pytest.mark.parametrize("shape", [(40,), (12, 10), (6, 5, 7)])
+@pytest.mark.parametrize("backend", ["gather", "reference"])
+def test_unfused_backends_report_the_fused_partials(backend, shape):
+    from zenoengine.core.operators.main import symbolic_pgns_operator
+
+    rng = np.random.default_rng(4)
+    psi = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    partials = metric_partials(psi)
+    fused = symbolic_pgns_operator(psi, len(shape), partials=partials)
+
+    entropy = np.empty_like(psi)
+    unfused = metric_partials(psi)
+    delta = symbolic_pgns_operator(psi, len(shape), backend=backend, entropy=entropy, partials=unfused)
+
+    np.testing.assert_allclose(delta, fused, rtol=1e-12, atol=1e-9)
+    assert np.sum(np.abs(entropy)) == pytest.approx(reduce_partials(partials)[3], rel=1e-12)
+    np.testing.assert_allclose(unfused, partials, rtol=1e-12)
+
+
+@pytest.mark.parametrize("backend", ["gather", "reference"])
+def test_unfused_backends_combine_terms_in_place(backend):
+    import tracemalloc
+    from zenoengine.core.operators.main import symbolic_pgns_operator
+
+    rng = np.random.default_rng(5)
+    psi = rng.normal(size=(64, 64)) + 1j * rng.normal(size=(64, 64))
+    expected = symbolic_pgns_operator(psi, 2)
+    buffers = dict(
+        curv=np.empty(psi.shape), tors=np.empty(psi.shape), entropy=np.empty_like(psi),
+        nonlinear=np.empty_like(psi), out=np.empty_like(psi)
+    )
+    if backend == "gather":
+        buffers["gathered"] = np.empty(psi.shape)
+    symbolic_pgns_operator(psi, 2, backend=backend, **buffers)
+
+    tracemalloc.start()
+    delta = symbolic_pgns_operator(psi, 2, backend=backend, **buffers)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert delta is buffers["out"]
+    np.testing.assert_allclose(delta, expected, rtol=1e-12, atol=1e-9)
+    # No field-sized temporary is allocated
+    assert peak < psi.nbytes // 4
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from zenoengine.core.operators.fused import fused_pgns_operator, metric_partials
+from zenoengine.core.operators.incremental import IncrementalPGNS
+
+
+@pytest.mark.parametrize("shape", [(64,), (24, 20), (8, 9, 10)])
+@pytest.mark.parametrize("dtype", [np.complex128, np.float64])
+def test_incremental_matches_fused_over_steps(shape, dtype):
+    rng = np.random.default_rng(5)
+    psi = 0.05 * rng.normal(size=shape)
+    if dtype == np.complex128:
+        psi = psi + 0.05j * rng.normal(size=shape)
+    reference = psi.copy()
+    incremental = IncrementalPGNS(shape, psi.dtype)
+
+    for _ in range(6):
+        expected_partials = metric_partials(reference)
+        partials = metric_partials(psi)
+        expected = fused_pgns_operator(reference, len(shape), lambda_=0.1, kappa=0.5, partials=expected_partials)
+        delta = incremental(psi, lambda_=0.1, kappa=0.5, partials=partials)
+
+        np.testing.assert_array_equal(delta, expected)
+        # Metric sums may be reassociated differently; Δ must be bit-identical
+        np.testing.assert_allclose(partials, expected_partials, rtol=1e-12)
+        # Nudge a random quarter of the cells, enough to move some quantized indices
+        nudge = np.where(rng.random(shape) < 0.25, 0.02 * rng.normal(size=shape), 0.0)
+        reference += nudge
+        psi += nudge
+
+    assert incremental.stats.steps == 6
+
+
+def test_quiescent_field_recomputes_only_the_changed_neighbourhood():
+    psi = np.full((32, 32), 0.1 + 0.0j)
+    incremental = IncrementalPGNS(psi.shape, psi.dtype)
+
+    incremental(psi)
+    assert incremental.stats.changed == incremental.stats.active == 1.0
+
+    incremental(psi)
+    assert incremental.stats.changed == incremental.stats.active == 0.0
+
+    # One cell crosses a quantization level: it and its four neighbours are recomputed
+    psi[10, 10] = 0.3
+    delta = incremental(psi)
+    assert incremental.stats.changed == 1 / psi.size
+    assert incremental.stats.active == 5 / psi.size
+    assert incremental.stats.mean_active == pytest.approx((1 + 5 / psi.size) / 3)
+    np.testing.assert_array_equal(delta, fused_pgns_operator(psi, 2))
+
+    incremental.reset()
+    incremental(psi)
+    assert incremental.stats.active == 1.0
+
+
+def test_incremental_validates_its_input():
+    incremental = IncrementalPGNS((8, 8), np.complex128)
+    with pytest.raises(ValueError):
+        incremental(np.zeros((8, 8), dtype=np.complex64))
+    with pytest.raises(ValueError):
+        incremental(np.zeros((8, 8), dtype=np.complex128), partials=np.zeros((4, 4)))
+    with pytest.raises(ValueError):
+        IncrementalPGNS((2, 2, 2, 2), np.complex128)
@@ -26,3 +26,16 @@ def test_nonlinear_operator_random():
     expected = np.abs(x)**2 * x
     output = nonlinear_operator(x)
     np.testing.assert_allclose(output, expected, rtol=1e-10)
+
+def test_nonlinear_operator_writes_into_out():
+    x = np.linspace(-1, 1, 9).reshape(3, 3)
+    out = np.empty_like(x)
+    assert nonlinear_operator(x, out=out) is out
+    np.testing.assert_allclose(out, x**3, rtol=1e-12)
+
+def test_nonlinear_operator_fills_strided_out():
+    x = np.arange(12.0).reshape(3, 4) + 1j
+    padded = np.zeros((5, 6), dtype=complex)
+    output = nonlinear_operator(x, out=padded[1:-1, 1:-1])
+    np.testing.assert_allclose(padded[1:-1, 1:-1], np.abs(x)**2 * x, rtol=1e-12)
+    assert output.base is padded and not padded[0].any()
@@ -0,0 +1,22 @@
+import numpy as np
+from zenoengine.core.operators.fused import fused_pgns_operator
+from zenoengine.core.operators.patches import patch_pgns_operator
+
+
+def test_patches_match_the_periodic_field():
+    rng = np.random.default_rng(4)
+    n, P = 16, 8
+    psi = 0.05 * (rng.normal(size=(n, n)) + 1j * rng.normal(size=(n, n)))
+    wrapped = np.pad(psi, 1, mode="wrap")
+    pool = np.stack([wrapped[a * P:(a + 1) * P + 2, b * P:(b + 1) * P + 2] for a in range(2) for b in range(2)])
+    covered = np.zeros((4, P, P), dtype=np.bool_)
+    covered[3] = True
+    partials = np.full((4, 4), np.nan)
+
+    delta = patch_pgns_operator(pool, 4, lambda_=0.2, partials=partials, covered=covered)
+
+    expected = fused_pgns_operator(psi, 2, lambda_=0.2)
+    for s, (a, b) in enumerate([(0, 0), (0, 1), (1, 0), (1, 1)]):
+        np.testing.assert_array_equal(delta[s], expected[a * P:(a + 1) * P, b * P:(b + 1) * P])
+    np.testing.assert_allclose(partials[0, 0], np.abs(psi[:P, :P]).sum(), rtol=1e-12)
+    np.testing.assert_array_equal(partials[3], 0.0)
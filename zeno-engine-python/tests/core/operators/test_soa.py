@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from zenoengine.core.operators.fused import fused_pgns_operator, metric_partials
+from zenoengine.core.operators.soa import soa_pgns_operator
+
+
+def _planes(psi):
+    return np.ascontiguousarray(psi.real), np.ascontiguousarray(psi.imag)
+
+
+@pytest.mark.parametrize("shape", [(32,), (12, 10), (6, 7, 8)])
+def test_soa_matches_interleaved_fused(shape):
+    rng = np.random.default_rng(3)
+    psi = 0.05 * (rng.normal(size=shape) + 1j * rng.normal(size=shape))
+    aos_partials = metric_partials(psi)
+    soa_partials = metric_partials(psi)
+
+    delta = fused_pgns_operator(psi, len(shape), lambda_=0.1, kappa=0.5, beta=0.7, partials=aos_partials)
+    planes = soa_pgns_operator(*_planes(psi), len(shape), lambda_=0.1, kappa=0.5, beta=0.7, partials=soa_partials)
+
+    assert planes.shape == (2,) + shape and planes.dtype == np.float64
+    np.testing.assert_allclose(planes[0] + 1j * planes[1], delta, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(soa_partials, aos_partials, rtol=1e-12)
+
+
+def test_soa_square_root_branches_match_numpy():
+    # Real-only, negative-real and purely imaginary gradients exercise every √ branch
+    psi = np.array([0.0, 0.3, 0.3j, -0.2, 0.1 - 0.4j, 0.0, 0.0, 0.5j], dtype=np.complex128)
+
+    delta = fused_pgns_operator(psi, 1)
+    planes = soa_pgns_operator(*_planes(psi), 1)
+
+    np.testing.assert_allclose(planes[0] + 1j * planes[1], delta, rtol=1e-12, atol=1e-15)
+
+
+def test_soa_single_precision_and_validation():
+    rng = np.random.default_rng(4)
+    psi = (0.05 * (rng.normal(size=(16, 16)) + 1j * rng.normal(size=(16, 16)))).astype(np.complex64)
+
+    planes = soa_pgns_operator(*_planes(psi), 2)
+
+    assert planes.dtype == np.float32
+    np.testing.assert_allclose(planes[0] + 1j * planes[1], fused_pgns_operator(psi, 2), rtol=1e-4, atol=1e-6)
+    with pytest.raises(ValueError):
+        soa_pgns_operator(np.zeros(4), np.zeros(5), 1)
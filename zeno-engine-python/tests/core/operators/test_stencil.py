@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from zenoengine.core.partition_geometry import get_partition_table
+from zenoengine.core.operators.stencil import curvature_torsion, partition_field
+from zenoengine.core.operators.legacy_symbolic_pgns import _kernel_1d, _kernel_2d, _kernel_3d
+
+
+def _reference(psi):
+    result = np.zeros_like(psi)
+    R = np.zeros_like(psi)
+    T = np.zeros_like(psi)
+    kernel = {1: _kernel_1d, 2: _kernel_2d, 3: _kernel_3d}[psi.ndim]
+    kernel(psi, result, R, T, get_partition_table(), *psi.shape)
+    return R, T
+
+
+@pytest.mark.parametrize("shape", [(17,), (9, 11), (5, 6, 7)])
+def test_gather_stencil_matches_reference_kernels(shape):
+    rng = np.random.default_rng(0)
+    # Spread across the whole table, including the clamp at index 499
+    psi = rng.uniform(-12.0, 12.0, size=shape)
+
+    R, T = curvature_torsion(psi, len(shape))
+    R_ref, T_ref = _reference(psi)
+
+    np.testing.assert_array_equal(R, R_ref)
+    np.testing.assert_array_equal(T, T_ref)
+
+
+def test_partition_field_uses_magnitude_of_complex_input():
+    psi = np.array([0.1 + 0.0j, 0.0 - 0.1j, -0.1 + 0.0j])
+    P = partition_field(psi)
+    assert P.dtype == np.float64
+    assert np.all(P == P[0])
+
+
+def test_partition_field_fills_strided_out():
+    rng = np.random.default_rng(2)
+    psi = rng.normal(size=(6, 7)) + 1j * rng.normal(size=(6, 7))
+    padded = np.zeros((8, 9))
+    interior = padded[1:-1, 1:-1]
+
+    P = partition_field(psi, out=interior)
+
+    assert P is interior
+    np.testing.assert_array_equal(interior, partition_field(psi))
+    assert not padded[0].any() and not padded[:, 0].any()
+    with pytest.raises(ValueError):
+        partition_field(psi, out=np.empty((7, 6)))
+
+
+def test_curvature_torsion_dimension_mismatch():
+    with pytest.raises(ValueError):
+        curvature_torsion(np.ones((4, 4)), 3)
+
+
+@pytest.mark.parametrize("shape", [(32,), (12, 10), (6, 7, 8)])
+def test_curvature_torsion_padded_matches_periodic(shape):
+    rng = np.random.default_rng(11)
+    psi = rng.uniform(-2.0, 2.0, size=shape)
+
+    R, T = curvature_torsion(psi, len(shape))
+    R_pad, T_pad = curvature_torsion(np.pad(psi, 2, mode="wrap"), len(shape), halo=2)
+
+    np.testing.assert_array_equal(R_pad, R)
+    np.testing.assert_array_equal(T_pad, T)
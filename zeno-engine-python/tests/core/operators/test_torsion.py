@@ -23,3 +23,11 @@ def test_torsion_invalid_dim():
         assert False, "Expected ValueError for unsupported dim"
     except ValueError:
         pass
+
+
+def test_torsion_writes_into_out():
+    values = np.linspace(0, 1, 27).reshape(3, 3, 3)
+    out = np.empty_like(values)
+    result = torsion_operator(values, dim=3, out=out)
+    assert result is out
+    np.testing.assert_array_equal(out, torsion_operator(values, dim=3))
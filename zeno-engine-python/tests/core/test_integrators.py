@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from zenoengine.core.integrators import Integrator
+from zenoengine.core.operators.fused import fused_pgns_operator
+
+
+# A uniform field has ℛ = 𝒯 = 𝒮* = 0, so ψ' = -iκ|ψ|²ψ: |ψ| is conserved and the phase turns at κ|ψ|²
+PSI0 = 0.6 + 0.3j
+T = 2.0
+
+
+def _run(method, dt, shape=(4, 4), **tolerances):
+    psi = np.full(shape, PSI0)
+    integrator = Integrator(method, psi.shape, psi.dtype, dt=dt, **tolerances)
+
+    def rhs(out, observe):
+        return fused_pgns_operator(psi, len(shape), out=out)
+
+    t = 0.0
+    while t < T * (1 - 1e-12):
+        t += integrator.step(psi, rhs, min(integrator.dt, T - t))
+    exact = PSI0 * np.exp(-1j * 0.9 * abs(PSI0) ** 2 * T)
+    return np.abs(psi - exact).max(), integrator.stats
+
+
+@pytest.mark.parametrize("method, order, stages", [("euler", 1, 1), ("rk2", 2, 2), ("rk4", 4, 4)])
+def test_fixed_step_convergence_order(method, order, stages):
+    coarse, _ = _run(method, 0.1)
+    fine, stats = _run(method, 0.05)
+    assert np.log2(coarse / fine) == pytest.approx(order, abs=0.1)
+    assert stats.accepted == 40 and stats.evaluations == 40 * stages
+
+
+def test_adaptive_pair_meets_tolerance_with_fewer_evaluations():
+    error, stats = _run("rk23", 0.1, rtol=1e-8, atol=1e-8)
+    _, fixed = _run("rk4", 0.01)
+
+    assert error < 1e-6
+    # FSAL: three fresh evaluations per attempted step after the first
+    assert stats.evaluations == 1 + 3 * (stats.accepted + stats.rejected)
+    assert stats.evaluations < fixed.evaluations
+
+
+def test_rejected_steps_restart_from_the_step_start():
+    psi = np.full((4, 4), PSI0)
+    integrator = Integrator("rk23", psi.shape, psi.dtype, dt=5.0, rtol=1e-10, atol=1e-10)
+    taken = integrator.step(psi, lambda out, observe: fused_pgns_operator(psi, 2, out=out))
+
+    assert integrator.stats.rejected > 0 and taken < 5.0
+    exact = PSI0 * np.exp(-1j * 0.9 * abs(PSI0) ** 2 * taken)
+    np.testing.assert_allclose(psi, exact, atol=1e-9)
+
+
+def test_padded_stage_states_and_real_fields():
+    psi = np.zeros((6, 6), dtype=np.complex128)
+    values = psi[1:-1, 1:-1]
+    values[...] = PSI0
+    integrator = Integrator("rk4", values.shape, values.dtype, dt=0.1)
+    integrator.step(values, lambda out, observe: fused_pgns_operator(np.pad(values, 0), 2, out=out))
+
+    np.testing.assert_array_equal(psi[0], 0.0)
+    np.testing.assert_allclose(values, _step_rk4_reference(0.1), rtol=1e-14)
+    with pytest.raises(TypeError):
+        Integrator("rk4", (4, 4), np.float64, dt=0.1)
+
+
+def test_resize_refits_stage_buffers_and_drops_the_fsal_stage():
+    psi = np.full((4, 4), PSI0)
+    integrator = Integrator("rk23", psi.shape, psi.dtype, dt=0.01)
+    integrator.step(psi, lambda out, observe: fused_pgns_operator(psi, 2, out=out))
+
+    # A grown state (a brick pool after activation) starts over with a fresh first stage
+    grown = np.full((6, 4), PSI0)
+    integrator.resize(grown.shape)
+    evaluations = integrator.stats.evaluations
+    integrator.step(grown, lambda out, observe: fused_pgns_operator(grown, 2, out=out))
+
+    assert integrator.k.shape[1:] == grown.shape
+    assert integrator.stats.evaluations - evaluations >= 4
+    np.testing.assert_allclose(np.abs(grown), abs(PSI0), rtol=1e-6)
+
+
+def _step_rk4_reference(dt):
+    f = lambda y: -1j * 0.9 * abs(y) ** 2 * y
+    k1 = f(PSI0)
+    k2 = f(PSI0 + dt / 2 * k1)
+    k3 = f(PSI0 + dt / 2 * k2)
+    k4 = f(PSI0 + dt * k3)
+    return PSI0 + dt * (k1 / 6 + k2 / 3 + k3 / 3 + k4 / 6)
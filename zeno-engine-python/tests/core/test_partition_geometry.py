@@ -0,0 +1,64 @@
+import os
+import numpy as np
+import pytest
+from zenoengine.core.partition_geometry import (
+    clear_partition_cache,
+    compute_partition_gradient,
+    get_partition_table,
+    partition,
+    partition_table,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.delenv("ZENO_CACHE_DIR", raising=False)
+    clear_partition_cache()
+    yield
+    clear_partition_cache()
+
+
+def test_partition_table_matches_recursive_partition():
+    table = get_partition_table(40)
+    expected = [partition(n) for n in range(41)]
+    np.testing.assert_array_equal(table, np.array(expected, dtype=np.float64))
+
+
+def test_partition_table_built_once_per_key():
+    a = get_partition_table()
+    b = get_partition_table()
+    assert a is b
+    assert get_partition_table(dtype=np.float32) is not a
+
+
+def test_partition_table_smaller_requests_share_one_table():
+    full = get_partition_table()
+    head = get_partition_table(40)
+    assert np.shares_memory(head, full) and head.shape == (41,)
+    assert get_partition_table() is full
+
+
+def test_partition_gradient_does_not_grow_cache():
+    from zenoengine.core import partition_geometry
+
+    rng = np.random.default_rng(0)
+    for amplitude in (1.0, 2.0, 3.0, 4.0):
+        compute_partition_gradient(amplitude * rng.random((8, 8)))
+    assert len(partition_geometry._PARTITION_TABLES) == 1
+
+
+def test_partition_table_is_read_only():
+    table = get_partition_table()
+    with pytest.raises(ValueError):
+        table[0] = 2.0
+
+
+def test_partition_table_disk_cache_roundtrip(tmp_path):
+    table = get_partition_table(100, cache_dir=str(tmp_path))
+    files = os.listdir(tmp_path)
+    assert len(files) == 1 and files[0].endswith(".npy")
+
+    clear_partition_cache()
+    reloaded = get_partition_table(100, cache_dir=str(tmp_path))
+    assert reloaded is not table
+    np.testing.assert_array_equal(reloaded, partition_table(100))
@@ -0,0 +1,17 @@
+import numpy as np
+import pytest
+from zenoengine.core.precision import delta_dtype, real_dtype, storage_dtype
+
+
+def test_precision_modes_map_to_dtypes():
+    assert storage_dtype("fp64") == np.float64
+    assert storage_dtype("FP32") == np.float32
+    assert real_dtype(np.complex64) == np.float32
+    assert delta_dtype(np.float32) == np.complex64
+    assert delta_dtype(np.float64) == np.complex128
+    assert storage_dtype("fp32", "complex") == np.complex64
+    assert storage_dtype("fp64", "complex") == np.complex128
+    with pytest.raises(ValueError):
+        storage_dtype("fp16")
+    with pytest.raises(ValueError):
+        storage_dtype("fp64", "quaternion")
@@ -0,0 +1,32 @@
+import numpy as np
+from zenoengine.config.config import ZenoConfig
+from zenoengine.core.operators.curvature import curvature_operator
+from zenoengine.core.operators.entropy import entropy_operator
+from zenoengine.engine.rehte.sim import REHTESimulation
+
+
+def _config(tmp_path):
+    config = ZenoConfig.from_dict({
+        "defaults": {"dimensions": 2, "field": "RTI_2D", "operator": "rehte", "lambda_": 0.2, "beta": 0.5},
+        "engine": {"seed": 0},
+        "output": {"save_dir": str(tmp_path), "formats": ["json"]},
+    })
+    # The field reads the flat scene settings
+    config.grid_size, config.dimension, config.scene = 16, 2, "RTI_2D"
+    return config
+
+
+def test_rehte_steps_with_configured_coefficients(tmp_path):
+    sim = REHTESimulation(_config(tmp_path))
+    psi = sim.field.values.copy()
+
+    sim.step()
+
+    R = curvature_operator(psi, 2)
+    S = entropy_operator(psi, 2)
+    T = np.zeros_like(psi)
+    T[...] = (np.roll(psi, -1, 0) - np.roll(psi, 1, 0)) - (np.roll(psi, -1, 1) - np.roll(psi, 1, 1))
+    expected = psi - 1j * (R + 0.5 * S + 0.2 * T) * sim.config.defaults.time_step
+    np.testing.assert_allclose(sim.field.values, expected, rtol=1e-12, atol=1e-15)
+    assert sim.step_count == 1 and sim.time == sim.config.defaults.time_step
+    assert set(sim.metrics.data[-1]) >= {"field_energy", "curvature_energy", "torsion_energy", "entropy_energy"}
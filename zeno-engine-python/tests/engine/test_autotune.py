@@ -0,0 +1,81 @@
+import json
+
+import numpy as np
+import pytest
+from zenoengine.config.config import ZenoConfig
+from zenoengine.engine import autotune as tuning
+from zenoengine.engine.autotune import TuningDB, apply_tuning, autotune, candidates, tuning_key
+
+
+def test_candidates_per_operator():
+    pgns_3d = candidates("pgns", (16, 16, 32), cores=2)
+    assert {c.kernel for c in pgns_3d} == {"fused", "gather", "reference"}
+    assert any(c.tile for c in pgns_3d) and all(c.tile is None for c in pgns_3d if c.kernel != "fused")
+    assert {c.threads for c in pgns_3d} == {1, 2}
+
+    assert "reference" not in {c.kernel for c in candidates("pgns", (16, 16), halo=1)}
+    assert "soa" in {c.kernel for c in candidates("pgns", (16, 16), soa=True)}
+    assert "soa" not in {c.kernel for c in candidates("pgns", (16, 16), halo=1, soa=True)}
+    assert {c.kernel for c in candidates("classical", (16, 16))} == {"laplacian"}
+    with pytest.raises(ValueError):
+        candidates("unknown", (16,))
+
+
+def test_autotune_picks_fastest_trial():
+    result = autotune("pgns", (16, 16), repeats=1)
+
+    assert result.key == tuning_key("pgns", (16, 16), np.float64) == "pgns/2d/16x16/float64"
+    assert result.cells_per_second == max(result.trials.values())
+    assert result.kernel in ("fused", "gather", "reference")
+
+
+def test_database_round_trip_and_host_check(tmp_path):
+    path = str(tmp_path / "tuning.json")
+    db = TuningDB(path)
+    db.put(autotune("pgns", (16, 16, 8), repeats=1))
+
+    reloaded = TuningDB(path).get("pgns/3d/16x16x8/float64")
+    assert reloaded == db.get("pgns/3d/16x16x8/float64")
+    assert reloaded.tile is None or isinstance(reloaded.tile, tuple)
+
+    with open(path) as f:
+        raw = json.load(f)
+    raw["host"]["cpu"] = "some other machine"
+    with open(path, "w") as f:
+        json.dump(raw, f)
+    assert TuningDB(path).entries == {}
+
+
+def _config(db_path, **engine):
+    return ZenoConfig.from_dict({
+        "defaults": {"dimensions": 2, "grid_size": [16, 16]},
+        "engine": {"kernel": "auto", "tuning_db": db_path, **engine},
+    })
+
+
+def test_apply_tuning_reuses_stored_winner(tmp_path, monkeypatch):
+    path = str(tmp_path / "tuning.json")
+
+    tuned = apply_tuning(_config(path))
+    assert tuned.engine.kernel in ("fused", "gather", "reference")
+    assert tuned.engine.layout in ("aos", "soa")
+    assert isinstance(tuned.engine.num_threads, int)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("stored result should be reused")
+
+    monkeypatch.setattr(tuning, "autotune", fail)
+    again = apply_tuning(_config(path))
+    assert again.engine == tuned.engine
+
+    # Explicit settings win over tuned ones; non-auto configs pass through
+    pinned = apply_tuning(_config(path, num_threads=1, tile_shape=(4, 4, 4)))
+    assert pinned.engine.num_threads == 1 and pinned.engine.tile_shape == (4, 4, 4)
+    assert apply_tuning(_config(path, kernel="gather")).engine.kernel == "gather"
+
+
+def test_precision_is_part_of_the_key(tmp_path):
+    path = str(tmp_path / "tuning.json")
+    apply_tuning(_config(path, precision="fp32"))
+
+    assert list(TuningDB(path).entries) == ["pgns/2d/16x16/complex64"]
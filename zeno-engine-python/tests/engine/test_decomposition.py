@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from zenoengine.core.operators.fused import fused_pgns_operator, metric_partials, reduce_partials
+from zenoengine.engine.decomposition import SlabDecomposition, _parse_cpulist, slab_bounds
+
+
+def test_slab_bounds_cover_rows_evenly():
+    bounds = slab_bounds(10, 3)
+    assert bounds == [(0, 4), (4, 7), (7, 10)]
+    with pytest.raises(ValueError):
+        slab_bounds(2, 3)
+
+
+def test_parse_cpulist():
+    assert _parse_cpulist("0-3,8,10-11\n") == {0, 1, 2, 3, 8, 10, 11}
+
+
+def test_slab_decomposition_matches_single_process():
+    rng = np.random.default_rng(0)
+    psi = 0.02 * (rng.normal(size=(13, 9)) + 1j * rng.normal(size=(13, 9)))
+
+    expected = psi.copy()
+    delta = np.empty_like(expected)
+    partials = metric_partials(expected)
+    for _ in range(4):
+        fused_pgns_operator(expected, 2, out=delta, partials=partials)
+        expected += delta * 1e-4
+
+    with SlabDecomposition(psi, 3, dt=1e-4, metrics=True, numa=True) as dec:
+        dec.advance(1)
+        dec.advance(3)
+        np.testing.assert_array_equal(dec.values, expected)
+        assert reduce_partials(dec.partials) == reduce_partials(partials)
+        assert all(t.compute > 0 for t in dec.timings)
+
+
+def test_worker_failure_is_reported():
+    # A real field cannot take the complex Δ update
+    with SlabDecomposition(np.zeros((4, 4)), 2, dt=1e-4) as dec:
+        with pytest.raises(RuntimeError, match="Worker"):
+            dec.advance(1)
+
+
+def test_killed_worker_is_reported():
+    import os
+    import signal
+
+    with SlabDecomposition(np.zeros((4, 4), dtype=np.complex128), 2, dt=1e-4) as dec:
+        os.kill(dec._procs[1].pid, signal.SIGKILL)
+        dec._procs[1].join()
+        with pytest.raises(RuntimeError, match="Worker 1 exited"):
+            dec.advance(10)
@@ -0,0 +1,61 @@
+import socket
+
+import numpy as np
+import pytest
+from zenoengine.core.operators.fused import fused_pgns_operator, metric_partials, reduce_partials
+from zenoengine.engine.distributed import SlabDomain, TcpComm, launch_local, parse_hosts
+
+
+def _free_hosts(n):
+    socks = [socket.create_server(("127.0.0.1", 0)) for _ in range(n)]
+    hosts = [f"127.0.0.1:{s.getsockname()[1]}" for s in socks]
+    for s in socks:
+        s.close()
+    return hosts
+
+
+def _rank_main(rank, hosts, psi, steps, dt, out_dir):
+    comm = TcpComm(rank, hosts)
+    domain = SlabDomain(comm, psi, dt=dt, metrics=True)
+    domain.advance(steps)
+    partials = domain.gather_partials()
+    field = domain.gather_field()
+    timings = domain.gather_timings()
+    comm.close()
+    if rank == 0:
+        np.save(out_dir / "partials.npy", partials)
+        np.save(out_dir / "field.npy", field)
+        np.save(out_dir / "timings.npy", [(t.compute, t.comm) for t in timings])
+    else:
+        assert partials is None and field is None and timings is None
+
+
+def test_parse_hosts():
+    assert parse_hosts(["127.0.0.1:5750", "node-2:80"]) == [("127.0.0.1", 5750), ("node-2", 80)]
+    with pytest.raises(ValueError):
+        parse_hosts(["node-2"])
+
+
+@pytest.mark.parametrize("ranks, shape", [(1, (8, 5)), (2, (7, 6)), (3, (9, 4, 5))])
+def test_tcp_ranks_match_single_process(ranks, shape, tmp_path):
+    rng = np.random.default_rng(ranks)
+    psi = 0.02 * (rng.normal(size=shape) + 1j * rng.normal(size=shape))
+
+    expected = psi.copy()
+    delta = np.empty_like(expected)
+    partials = metric_partials(expected)
+    for _ in range(3):
+        fused_pgns_operator(expected, len(shape), out=delta, partials=partials)
+        expected += delta * 1e-4
+
+    launch_local(_rank_main, ranks, _free_hosts(ranks), psi, 3, 1e-4, tmp_path)
+
+    np.testing.assert_array_equal(np.load(tmp_path / "field.npy"), expected)
+    assert reduce_partials(np.load(tmp_path / "partials.npy")) == reduce_partials(partials)
+    assert np.load(tmp_path / "timings.npy").shape == (ranks, 2)
+
+
+def test_failed_rank_is_reported(tmp_path):
+    # A real field cannot take the complex Δ update, so every rank fails
+    with pytest.raises(RuntimeError, match="Ranks"):
+        launch_local(_rank_main, 2, _free_hosts(2), np.zeros((4, 4)), 1, 1e-4, tmp_path)
@@ -0,0 +1,10 @@
+from zenoengine.engine.modes import CONFLICTS, MODES
+
+
+def test_conflict_table_names_known_modes_once():
+    pairs = [frozenset((mode, other)) for mode, others in CONFLICTS.items() for other in others]
+
+    assert all(mode in MODES for pair in pairs for mode in pair)
+    assert all(len(pair) == 2 for pair in pairs)
+    # The relation is symmetric, so listing a pair under both modes would be redundant
+    assert len(pairs) == len(set(pairs))
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+from zenoengine.config.config import ZenoConfig
+from zenoengine.engine.pgns_sim import PGNSSimulation
+
+STEPS = 3
+# Small enough that every scene evolves smoothly over the run
+DT = 1e-7
+SCENES = {1: ("Pulse_1D", 32), 2: ("RTI_2D", 16), 3: ("Pulse_3D", 8)}
+METRIC_KEYS = {"step", "time", "field_energy", "curvature_energy", "torsion_energy", "entropy_energy"}
+
+
+def _config(tmp_path, dim, engine, defaults=None):
+    scene, size = SCENES[dim]
+    config = ZenoConfig.from_dict({
+        "defaults": {"dimensions": dim, "field": scene, "simulation_steps": STEPS, "time_step": DT, **(defaults or {})},
+        "engine": {"seed": 0, **engine},
+        "output": {"save_dir": str(tmp_path), "formats": ["json"]},
+    })
+    # The field reads the flat scene settings
+    config.grid_size, config.dimension, config.scene = size, dim, scene
+    return config
+
+
+def _run(config):
+    # run()'s stepping loop, without the final export
+    sim = PGNSSimulation(config)
+    block = max(config.engine.time_block, 1)
+    while not sim.done():
+        sim.advance(max(min(block, STEPS - sim.step_count), 1))
+    return sim
+
+
+# (dimensions, engine overrides, defaults overrides, relative tolerance against the reference path)
+MODES = {
+    "fused": (2, {}, {}, 1e-12),
+    "gather": (2, {"kernel": "gather"}, {}, 1e-12),
+    "halo": (2, {"halo": 1}, {}, 1e-12),
+    "tile": (3, {"tile_shape": [4, 4, 4]}, {}, 1e-12),
+    "time_block": (3, {"time_block": STEPS}, {}, 1e-12),
+    "workers": (2, {"workers": 2}, {}, 1e-12),
+    "ensemble": (2, {"ensemble": 2}, {}, 1e-12),
+    "soa": (2, {"layout": "soa"}, {}, 1e-12),
+    "bricks": (2, {"layout": "bricks", "brick_threshold": 0.0}, {}, 1e-12),
+    "incremental": (2, {"incremental": True}, {}, 1e-12),
+    "symmetry": (1, {"symmetry": True}, {"lambda_": 0.0}, 1e-12),
+    "fp32": (2, {"precision": "fp32"}, {}, 1e-5),
+    "rk2": (2, {"integrator": "rk2"}, {}, 1e-12),
+    "rk4": (2, {"integrator": "rk4"}, {}, 1e-12),
+    "rk23": (2, {"integrator": "rk23"}, {}, 1e-12),
+    "rk4_bricks": (2, {"layout": "bricks", "brick_threshold": 0.0, "integrator": "rk4"}, {}, 1e-12),
+    # No cell is tagged, so the patch hierarchy must step exactly like the uniform grid
+    "amr": (2, {"amr_levels": 2, "amr_patch": 4, "amr_threshold": 10**9}, {}, 1e-12),
+}
+
+
+@pytest.mark.parametrize("mode", list(MODES))
+def test_mode_steps_like_reference_path(tmp_path, mode):
+    dim, engine, defaults, rtol = MODES[mode]
+    sim = _run(_config(tmp_path, dim, engine, defaults))
+    # The reference operator on the plain field, same scene, seed and time stepping
+    shared = {key: engine[key] for key in ("integrator",) if key in engine}
+    reference = _run(_config(tmp_path, dim, {"kernel": "reference", **shared}, defaults))
+
+    values = sim.field.values[0] if sim.field.ensemble else sim.field.snapshot()
+    if sim.decomposition is not None:
+        sim.decomposition.close()
+    assert sim.time == pytest.approx(reference.time, rel=1e-12)
+    np.testing.assert_allclose(values, reference.field.values, rtol=rtol, atol=rtol * np.abs(reference.field.values).max())
+
+    # Every mode reports the same metric keys as the reference path
+    assert sim.metrics.data and all(METRIC_KEYS <= set(row) for row in sim.metrics.data)
+    assert set(reference.metrics.data[-1]) == METRIC_KEYS
+
+
+def test_metric_rows_do_not_depend_on_kernel(tmp_path):
+    kernels = ("fused", "gather", "reference")
+    rows = {kernel: _run(_config(tmp_path, 2, {"kernel": kernel})).metrics.data for kernel in kernels}
+
+    # Every backend reduces the same pre-update state
+    for kernel in ("gather", "reference"):
+        assert len(rows[kernel]) == len(rows["fused"]) == STEPS
+        for row, expected in zip(rows[kernel], rows["fused"]):
+            assert row == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("engine, defaults", [
+    ({"layout": "soa", "kernel": "gather"}, {}),
+    ({"ensemble": 2, "tile_shape": [4, 4, 4]}, {}),
+    ({"time_block": 2}, {}),
+    ({"incremental": True, "halo": 1}, {}),
+    ({"amr_levels": 2, "integrator": "rk2"}, {}),
+    ({"halo": 1, "kernel": "reference"}, {}),
+    ({"symmetry": True}, {"lambda_": 0.4}),
+])
+def test_invalid_mode_combinations_are_rejected(tmp_path, engine, defaults):
+    dim = 1 if engine.get("symmetry") else 2
+    with pytest.raises(ValueError):
+        PGNSSimulation(_config(tmp_path, dim, engine, defaults))
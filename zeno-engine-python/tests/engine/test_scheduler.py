@@ -0,0 +1,73 @@
+import threading
+import time
+
+import numba
+import pytest
+from zenoengine.engine.scheduler import CoreScheduler, thread_budget
+
+
+def _tracker():
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0, "order": []}
+
+    def work(tag, seconds=0.05):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            state["order"].append(tag)
+        time.sleep(seconds)
+        with lock:
+            state["now"] -= 1
+        return numba.get_num_threads()
+
+    return state, work
+
+
+def test_thread_budget_resolution():
+    assert thread_budget("auto", 8) == 8
+    assert thread_budget("none", 8) == 1
+    assert thread_budget(0, 8) == 1
+    assert thread_budget(3, 8) == 3
+    assert thread_budget(64, 8) == 8
+    assert thread_budget("2", 8) == 2
+
+
+def test_jobs_exceeding_budget_are_queued_in_order():
+    state, work = _tracker()
+    scheduler = CoreScheduler(cores=2)
+
+    jobs = [scheduler.submit(work, i, threads=2) for i in range(3)]
+    assert scheduler.wait_all(timeout=10)
+
+    assert state["peak"] == 1
+    assert state["order"] == [0, 1, 2]
+    assert [job.state for job in jobs] == ["done"] * 3
+    assert all(job.result == min(2, numba.config.NUMBA_NUM_THREADS) for job in jobs)
+
+
+def test_narrow_jobs_share_the_machine():
+    state, work = _tracker()
+    scheduler = CoreScheduler(cores=2)
+    if scheduler.exclusive:
+        pytest.skip("workqueue threading layer runs one job at a time")
+
+    for i in range(4):
+        scheduler.submit(work, i, 0.2, threads=1)
+    assert scheduler.wait_all(timeout=10)
+
+    assert state["peak"] == 2
+
+
+def test_failed_job_releases_its_cores():
+    scheduler = CoreScheduler(cores=1)
+
+    def boom():
+        raise RuntimeError("bad job")
+
+    failed = scheduler.submit(boom)
+    after = scheduler.submit(lambda: 42)
+    assert scheduler.wait_all(timeout=10)
+
+    assert failed.state == "failed" and isinstance(failed.error, RuntimeError)
+    assert after.state == "done" and after.result == 42
+    assert [row["state"] for row in scheduler.status()] == ["failed", "done"]
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from zenoengine.engine.sweep import (
+    grid_design,
+    latin_hypercube,
+    load_results,
+    point_config,
+    point_id,
+    random_design,
+    run_point,
+    run_sweep,
+)
+
+
+def test_grid_design_is_full_factorial():
+    points = grid_design({"lambda_": [0.1, 0.2], "kappa": [0.5], "scene": ["RTI_2D", "Pulse_1D"]})
+
+    assert len(points) == 4
+    assert {(p["lambda_"], p["scene"]) for p in points} == {
+        (0.1, "RTI_2D"), (0.1, "Pulse_1D"), (0.2, "RTI_2D"), (0.2, "Pulse_1D")
+    }
+    with pytest.raises(ValueError):
+        grid_design({"lambda_": (0.0, 1.0)})
+
+
+def test_latin_hypercube_uses_each_stratum_once():
+    points = latin_hypercube({"lambda_": (0.0, 1.0), "grid_size": [16, 32]}, 10, seed=3)
+
+    strata = sorted(int(p["lambda_"] * 10) for p in points)
+    assert strata == list(range(10))
+    assert sorted(p["grid_size"] for p in points) == [16] * 5 + [32] * 5
+    assert points == latin_hypercube({"lambda_": (0.0, 1.0), "grid_size": [16, 32]}, 10, seed=3)
+
+
+def test_random_design_stays_in_bounds():
+    points = random_design({"beta": (0.1, 0.2), "scene": ["Pulse_1D"]}, 20, seed=1)
+
+    assert all(0.1 <= p["beta"] <= 0.2 and p["scene"] == "Pulse_1D" for p in points)
+
+
+def test_point_id_ignores_key_order():
+    a = point_id({"lambda_": 0.1, "kappa": 0.2}, 10, 1e-3, 0)
+    b = point_id({"kappa": 0.2, "lambda_": 0.1}, 10, 1e-3, 0)
+
+    assert a == b
+    assert a != point_id({"kappa": 0.2, "lambda_": 0.1}, 11, 1e-3, 0)
+
+
+def test_run_sweep_writes_results_and_resumes(tmp_path):
+    path = str(tmp_path / "sweep.csv")
+    points = grid_design({"scene": ["Pulse_1D"], "grid_size": [16], "lambda_": [0.0, 0.4]})
+
+    assert run_sweep(points, path, steps=3, dt=1e-4, workers=1) == 2
+    results = load_results(path)
+    assert list(results["status"]) == ["ok", "ok"]
+
+    expected = run_point(points[0], 3, 1e-4)
+    row = list(results["lambda_"]).index(0.0)
+    assert results["field_energy"][row] == expected["field_energy"]
+
+    # Completed points are skipped, new ones are appended
+    more = points + grid_design({"scene": ["Pulse_1D"], "grid_size": [16], "lambda_": [0.8]})
+    assert run_sweep(more, path, steps=3, dt=1e-4, workers=1) == 1
+    assert len(load_results(path)["point_id"]) == 3
+    assert np.isfinite(load_results(path)["seconds"]).all()
+
+
+def test_run_point_rejects_other_operators():
+    with pytest.raises(ValueError, match="PGNS operator only"):
+        run_point({"operator": "rehte"}, steps=1, dt=1e-5)
+
+
+def test_run_point_steps_the_simulation_of_its_config():
+    from zenoengine.engine.pgns_sim import PGNSSimulation
+
+    point = {"scene": "RTI_2D", "grid_size": 16, "engine.precision": "fp32"}
+    config = point_config(point, 3, 1e-7)
+    assert config.engine.precision == "fp32" and config.output.formats == []
+
+    sim = PGNSSimulation(config)
+    sim.advance(3)
+    assert sim.field.dtype == np.complex64
+    assert run_point(point, 3, 1e-7)["field_energy"] == sim.metrics.data[-1]["field_energy"]
+
+
+def test_run_point_applies_the_config_file(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text('[engine]\nintegrator = "rk2"\n')
+    point = {"scene": "RTI_2D", "grid_size": 16}
+
+    assert point_config(point, 3, 1e-7, config_path=str(path)).engine.integrator == "rk2"
+    rk2 = run_point(point, 3, 1e-7, config_path=str(path))
+    assert rk2["field_energy"] != run_point(point, 3, 1e-7)["field_energy"]
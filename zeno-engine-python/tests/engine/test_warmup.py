@@ -0,0 +1,34 @@
+import numpy as np
+from zenoengine.core.operators import fused
+from zenoengine.engine import warmup as warmup_module
+from zenoengine.engine.warmup import refresh_cache, source_digest, uncached_copy, warmup
+
+
+def test_warmup_prepares_every_dimension_signature():
+    report = warmup(dims=[1], dtypes=[np.complex128])
+
+    assert report.loaded + report.compiled > 0
+    # Second call finds everything already compiled in-process
+    again = warmup(dims=[1], dtypes=[np.complex128])
+    assert again.loaded == again.compiled == 0
+
+
+def test_uncached_copy_can_be_inspected():
+    fused.fused_pgns_operator(np.zeros(4, dtype=np.complex128), 1)
+    ir = "\n".join(uncached_copy(fused._fused_pgns_1d).inspect_llvm().values())
+
+    assert "define" in ir
+
+
+def test_refresh_cache_clears_once_per_source_change(tmp_path, monkeypatch):
+    cleared = []
+    monkeypatch.setattr(warmup_module, "SOURCE_STAMP", str(tmp_path / "kernel_sources.sha256"))
+    monkeypatch.setattr(warmup_module, "clear_cache", lambda: cleared.append(1) or 0)
+
+    assert refresh_cache() and cleared == [1]
+    assert not refresh_cache() and cleared == [1]
+    assert (tmp_path / "kernel_sources.sha256").read_text() == source_digest()
+
+    # A stamp from other sources (e.g. an edited fused.py) clears again
+    (tmp_path / "kernel_sources.sha256").write_text("stale")
+    assert refresh_cache() and cleared == [1, 1]
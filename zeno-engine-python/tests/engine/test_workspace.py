@@ -0,0 +1,25 @@
+import numpy as np
+from zenoengine.engine.workspace import Workspace
+
+
+def test_buffer_is_allocated_once_and_reused():
+    ws = Workspace((8, 8))
+    a = ws.buffer("delta", np.complex128)
+    b = ws.buffer("delta", np.complex128)
+    assert a is b
+    assert a.shape == (8, 8) and a.dtype == np.complex128
+
+
+def test_buffer_defaults_and_custom_shape():
+    ws = Workspace((4, 5), np.float32)
+    assert ws.buffer("scratch").dtype == np.float32
+    assert ws.buffer("partials", np.float64, (4, 4)).shape == (4, 4)
+    assert "partials" in ws
+    assert ws.nbytes == 4 * 5 * 4 + 4 * 4 * 8
+
+
+def test_buffer_replaced_on_layout_change():
+    ws = Workspace((3,))
+    a = ws.buffer("x")
+    b = ws.buffer("x", np.complex128)
+    assert a is not b and b.dtype == np.complex128
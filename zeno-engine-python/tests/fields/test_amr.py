@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from zenoengine.core.operators.fused import fused_pgns_operator
+from zenoengine.fields.amr import AMRField
+
+
+def _noise(n, seed=1):
+    rng = np.random.default_rng(seed)
+    return 0.03 * (rng.normal(size=(n, n)) + 1j * rng.normal(size=(n, n)))
+
+
+def test_full_refinement_steps_like_the_fine_grid():
+    # threshold 0 tags everything, so level 1 is the whole grid at twice the resolution
+    psi = _noise(16)
+    amr = AMRField(psi, levels=2, patch=8, threshold=0, interval=5)
+    fine = psi.repeat(2, axis=0).repeat(2, axis=1)
+
+    for _ in range(12):
+        amr.step(1e-5, lambda_=0.3)
+        fine += fused_pgns_operator(fine, 2, lambda_=0.3) * 1e-5
+
+    assert [patches.coverage for patches in amr.levels] == [1.0, 1.0]
+    np.testing.assert_array_equal(amr.composite(), fine)
+    np.testing.assert_allclose(amr.composite(0), fine.reshape(16, 2, 16, 2).mean(axis=(1, 3)), rtol=1e-14)
+
+
+def test_refinement_follows_the_front():
+    psi = np.full((64, 64), 0.04 + 0j)
+    psi[:, 16:48] = 0.1
+    amr = AMRField(psi, levels=3, patch=8, threshold=2, interval=0)
+
+    assert amr.depth == 3
+    # Level-1 patches straddle the two interfaces, plus one patch of buffer either side
+    columns = np.unique(amr.levels[1].coords[:amr.levels[1].count, 1])
+    np.testing.assert_array_equal(columns, [2, 3, 4, 5, 10, 11, 12, 13])
+    assert amr.levels[2].coverage < amr.levels[1].coverage < 1.0
+    np.testing.assert_array_equal(amr.composite(), psi.repeat(4, axis=0).repeat(4, axis=1))
+
+    # Leaf metrics are area-weighted, so |ψ| sums to the level-0 total
+    sums = amr.step(0.0)
+    np.testing.assert_allclose(sums[:, 0].sum(), np.abs(psi).sum(), rtol=1e-12)
+
+
+def test_quiet_fields_stay_unrefined():
+    amr = AMRField(np.full((32, 32), 0.1 + 0j), levels=3, patch=8)
+    assert amr.depth == 1
+    with pytest.raises(ValueError):
+        AMRField(np.zeros((24, 24), dtype=np.complex128), patch=16)
+    with pytest.raises(TypeError):
+        AMRField(np.zeros((32, 32)), patch=16)
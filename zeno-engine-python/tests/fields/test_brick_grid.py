@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from zenoengine.fields.bricks import BrickGrid
+from zenoengine.fields.field import SymbolicField
+
+
+def _config(**overrides):
+    values = dict(grid_size=16, dimension=3, scene="Pulse_3D")
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_from_dense_keeps_bricks_above_threshold():
+    psi = np.zeros((16, 16), dtype=np.complex128)
+    psi[1, 1] = 1e-3
+    psi[9, 12] = 0.5
+
+    grid = BrickGrid.from_dense(psi, 4, threshold=1e-2)
+
+    assert grid.count == 1 and grid.active_fraction == 1 / 16
+    assert tuple(grid.coords[0]) == (2, 3) and grid.index[2, 3] == 0
+    expected = psi.copy()
+    expected[1, 1] = 0.0
+    np.testing.assert_array_equal(grid.to_dense(), expected)
+    np.testing.assert_array_equal(BrickGrid.from_dense(psi, 4).to_dense(), psi)
+
+    with pytest.raises(ValueError):
+        BrickGrid((10, 10), 4)
+
+
+def test_update_activates_front_and_releases_cold_bricks():
+    psi = np.zeros((32,), dtype=np.complex128)
+    psi[0:8] = 1e-9  # cold brick, below threshold: never stored
+    psi[8:16] = 0.01  # below one quantization level: no front
+    psi[23] = 0.5  # hot cell on the high face of brick 2
+    grid = BrickGrid.from_dense(psi, 8, threshold=1e-6)
+    assert grid.count == 2
+
+    assert grid.update() == (1, 0)
+    assert sorted(tuple(c) for c in grid.coords[:grid.count]) == [(1,), (2,), (3,)]
+
+    # Once the hot cell cools, it and the neighbour it woke are released again
+    grid.pool[grid.index[2], 7] = 0.0
+    assert grid.update() == (0, 2)
+    assert grid.count == 1 and grid.index[1] == 0 and grid.index[2] == grid.index[3] == -1
+
+
+def test_pool_grows_during_update():
+    psi = np.zeros((64,), dtype=np.complex128)
+    psi[0] = psi[7] = 0.5  # both faces of brick 0 are hot
+    grid = BrickGrid.from_dense(psi, 8)
+    assert grid.count == grid.capacity == 1
+
+    assert grid.update() == (2, 0)
+
+    assert grid.count == 3 and grid.capacity >= 3
+    assert sorted(grid.index[[0, 1, 7]]) == [0, 1, 2]
+    np.testing.assert_array_equal(grid.to_dense(), psi)
+
+
+@pytest.mark.parametrize("scene, dimension", [("Pulse_1D", 1), ("Pulse_3D", 3)])
+def test_brick_layout_samples_analytic_scenes(scene, dimension):
+    config = _config(scene=scene, dimension=dimension, grid_size=64 if dimension == 1 else 16)
+    dense = SymbolicField(config, dtype=np.complex128)
+
+    field = SymbolicField(config, dtype=np.complex128, layout="bricks", brick_size=4, brick_threshold=1e-6)
+
+    assert field.sparse and field.values is None and field.shape == dense.shape
+    assert field.bricks.count < field.bricks.index.size
+    expected = BrickGrid.from_dense(dense.values, 4, 1e-6).to_dense()
+    np.testing.assert_array_equal(field.snapshot(), expected)
+
+
+def test_brick_layout_apply_delta_and_validation():
+    config = _config(scene="RTI_2D", dimension=2, grid_size=8)
+    field = SymbolicField(config, seed=1, dtype=np.complex128, layout="bricks", brick_size=4)
+    dense = SymbolicField(config, seed=1, dtype=np.complex128)
+
+    delta = np.ones_like(field.bricks.pool)
+    field.apply_delta(delta, 0.5)
+    np.testing.assert_array_equal(field.to_aos().values, dense.values + 0.5)
+
+    with pytest.raises(ValueError):
+        SymbolicField(config, halo=1, dtype=np.complex128, layout="bricks")
+    real = SymbolicField(config, seed=1, layout="bricks", brick_size=4)
+    with pytest.raises(TypeError):
+        real.apply_delta(delta, 0.5)
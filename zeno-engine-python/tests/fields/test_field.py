@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from zenoengine.fields.field import SymbolicField
+
+
+def _config(**overrides):
+    values = dict(grid_size=8, dimension=2, scene="none")
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_apply_delta_updates_values_in_place():
+    field = SymbolicField(_config())
+    values = field.values
+    delta = np.full(values.shape, 2.0)
+
+    field.apply_delta(delta, 0.25)
+
+    assert field.values is values
+    np.testing.assert_array_equal(field.values, np.full(values.shape, 0.5))
+
+
+def test_padded_field_exposes_interior_view():
+    field = SymbolicField(_config(grid_size=6), halo=1)
+
+    assert field.data.shape == (8, 8)
+    assert field.values.shape == (6, 6)
+    assert np.shares_memory(field.values, field.data)
+
+
+def test_padded_field_apply_delta_and_refresh():
+    field = SymbolicField(_config(grid_size=6), halo=1)
+    delta = np.arange(36, dtype=np.float64).reshape(6, 6)
+
+    field.apply_delta(delta, 0.5)
+    field.refresh_halo()
+
+    np.testing.assert_array_equal(field.values, 0.5 * delta)
+    np.testing.assert_array_equal(field.data, np.pad(0.5 * delta, 1, mode="wrap"))
+
+
+def test_non_periodic_boundary_requires_halo():
+    with pytest.raises(ValueError):
+        SymbolicField(_config(dimension=1), boundary="reflect")
+
+
+def test_ensemble_members_are_seeded_independently():
+    field = SymbolicField(_config(scene="RTI_2D"), members=3, seed=7)
+    again = SymbolicField(_config(scene="RTI_2D"), members=3, seed=7)
+
+    assert field.values.shape == (3, 8, 8)
+    np.testing.assert_array_equal(field.values, again.values)
+    assert not np.array_equal(field.values[0], field.values[1])
+
+    member = field.member(1)
+    member.apply_delta(np.ones((8, 8)), 1.0)
+    np.testing.assert_array_equal(field.values[1], again.values[1] + 1.0)
+
+
+def test_ensemble_requires_bare_storage():
+    with pytest.raises(ValueError):
+        SymbolicField(_config(), halo=1, members=2)
+
+
+def test_single_precision_storage():
+    field = SymbolicField(_config(grid_size=6), halo=1, dtype=np.float32)
+
+    assert field.data.dtype == np.float32 and field.values.dtype == np.float32
+    field.apply_delta(np.ones((6, 6), dtype=np.float32), 0.5)
+    assert field.values.dtype == np.float32
+    np.testing.assert_array_equal(field.values, np.full((6, 6), 0.5, dtype=np.float32))
+
+
+def test_complex_field_takes_complex_delta():
+    field = SymbolicField(_config(), dtype=np.complex128)
+    delta = np.full(field.shape, 1 - 2j)
+
+    field.apply_delta(delta, 0.5)
+
+    np.testing.assert_array_equal(field.values, np.full(field.shape, 0.5 - 1j))
+    with pytest.raises(TypeError):
+        SymbolicField(_config()).apply_delta(delta, 0.5)
+
+
+def test_soa_layout_splits_planes():
+    aos = SymbolicField(_config(scene="RTI_2D"), seed=3, dtype=np.complex128)
+    soa = SymbolicField(_config(scene="RTI_2D"), seed=3, dtype=np.complex128, layout="soa")
+
+    assert soa.values is None and soa.planes.shape == (2, 8, 8) and soa.planes.dtype == np.float64
+    assert soa.shape == (8, 8) and soa.dtype == np.complex128
+    np.testing.assert_array_equal(soa.as_complex(), aos.values)
+
+    delta = np.full((8, 8), 1 + 1j)
+    aos.apply_delta(delta, 0.25)
+    soa.apply_delta(delta, 0.25)
+    np.testing.assert_array_equal(soa.snapshot(), aos.values)
+    soa.apply_delta(np.stack([delta.real, delta.imag]), 0.25)
+    np.testing.assert_array_equal(soa.to_aos().values, aos.values + 0.25 * delta)
+
+
+def test_soa_layout_requires_complex_bare_storage():
+    with pytest.raises(ValueError):
+        SymbolicField(_config(), layout="soa")
+    with pytest.raises(ValueError):
+        SymbolicField(_config(), halo=1, dtype=np.complex128, layout="soa")
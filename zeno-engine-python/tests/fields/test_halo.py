@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from zenoengine.fields.halo import interior, refresh_halo
+
+
+def _padded(shape, halo, seed=0):
+    data = np.zeros(tuple(n + 2 * halo for n in shape))
+    data[interior(len(shape), halo)] = np.random.default_rng(seed).normal(size=shape)
+    return data
+
+
+@pytest.mark.parametrize("shape", [(9,), (5, 6), (4, 5, 3)])
+@pytest.mark.parametrize("halo", [1, 2])
+def test_periodic_matches_wrap_pad(shape, halo):
+    data = _padded(shape, halo)
+    refresh_halo(data, halo, "periodic")
+
+    expected = np.pad(data[interior(len(shape), halo)], halo, mode="wrap")
+    np.testing.assert_array_equal(data, expected)
+
+
+@pytest.mark.parametrize("halo", [1, 2])
+def test_reflect_mirrors_about_face(halo):
+    data = _padded((5, 6), halo)
+    refresh_halo(data, halo, "reflect")
+
+    expected = np.pad(data[interior(2, halo)], halo, mode="symmetric")
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_fixed_fills_constant():
+    data = _padded((4, 4), 1)
+    refresh_halo(data, 1, "fixed", fill_value=2.5)
+
+    expected = np.pad(data[1:-1, 1:-1], 1, mode="constant", constant_values=2.5)
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_mixed_boundaries_per_axis():
+    data = _padded((4, 5), 1)
+    refresh_halo(data, 1, ["periodic", ("fixed", "reflect")])
+
+    inner = data[1:-1, 1:-1]
+    np.testing.assert_array_equal(data[0, 1:-1], inner[-1])
+    np.testing.assert_array_equal(data[1:-1, 0], 0.0)
+    np.testing.assert_array_equal(data[1:-1, -1], inner[:, -1])
+
+
+def test_unknown_boundary_rejected():
+    with pytest.raises(ValueError):
+        refresh_halo(np.zeros((6, 6)), 1, "open")
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from zenoengine.core.operators.fused import fused_pgns_operator, metric_partials, reduce_partials
+from zenoengine.fields.field import SymbolicField
+from zenoengine.fields.symmetry import Symmetry
+
+
+def _field(scene, grid_size, dimension):
+    config = SimpleNamespace(grid_size=grid_size, dimension=dimension, scene=scene)
+    return SymbolicField(config, dtype=np.complex128, symmetric=True)
+
+
+def _step(field, dim, steps, dt, **coefficients):
+    for _ in range(steps):
+        if field.padded:
+            field.refresh_halo()
+        field.apply_delta(fused_pgns_operator(field.data, dim, halo=field.halo, **coefficients), dt)
+
+
+def test_octant_steps_like_the_full_box():
+    octant = _field("Pulse_3D", 16, 3)
+    assert octant.shape == (8, 8, 8) and octant.multiplicity == 8
+    box = octant.snapshot()
+
+    _step(octant, 3, 5, 1e-8, lambda_=0.0)
+    for _ in range(5):
+        box += fused_pgns_operator(box, 3, lambda_=0.0) * 1e-8
+
+    np.testing.assert_array_equal(octant.snapshot(), box)
+    octant.refresh_halo()
+    partials = metric_partials(octant.values)
+    fused_pgns_operator(octant.data, 3, halo=1, lambda_=0.0, partials=partials)
+    full = metric_partials(box)
+    fused_pgns_operator(box, 3, lambda_=0.0, partials=full)
+    expected = reduce_partials(full)
+    scaled = np.multiply(reduce_partials(partials), 8)
+    np.testing.assert_allclose(scaled[[0, 1, 3]], np.take(expected, [0, 1, 3]), rtol=1e-12)
+    # Mirror images flip 𝒯's per-axis differences, so Σ|𝒯| over the box is summed image by image
+    np.testing.assert_allclose(octant.symmetry.torsion_energy(octant.data, 1), expected[2], rtol=1e-12)
+
+
+def test_period_cell_keeps_torsion():
+    cell = _field("Checkerboard_2D", 8, 2)
+    assert cell.shape == (2, 2) and not cell.padded
+    box = cell.snapshot()
+    np.testing.assert_array_equal(box.real, (-1.0) ** np.add.outer(np.arange(8), np.arange(8)))
+
+    _step(cell, 2, 5, 1e-8, lambda_=0.4)
+    for _ in range(5):
+        box += fused_pgns_operator(box, 2, lambda_=0.4) * 1e-8
+
+    np.testing.assert_array_equal(cell.snapshot(), box)
+
+
+def test_symmetry_preconditions():
+    with pytest.raises(ValueError):
+        Symmetry(mirror=(0,)).check((9,))
+    with pytest.raises(ValueError):
+        Symmetry(period=3).check((8, 8))
+    with pytest.raises(ValueError):
+        Symmetry(period=2).check((8, 8), "reflect")
+    assert Symmetry(mirror=(0,)).boundary(2, "fixed") == [("reflect", "fixed"), "fixed"]
+
+    # Scenes without a declared symmetry keep the full box
+    config = SimpleNamespace(grid_size=8, dimension=2, scene="none")
+    assert SymbolicField(config, symmetric=True).shape == (8, 8)
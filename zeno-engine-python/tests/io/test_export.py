@@ -0,0 +1,23 @@
+import os
+import warnings
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from zenoengine.io.export import export_snapshot
+
+
+def test_export_complex_field_writes_magnitude_image(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    psi = np.zeros((4, 4), dtype=np.complex128)
+    psi[1, 2] = 2j
+    psi[3, 0] = -1.0
+    field = SimpleNamespace(sparse=False, snapshot=lambda: psi.copy())
+    config = SimpleNamespace(output_dir=str(tmp_path), scene="Test_2D", dimension=2)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        export_snapshot(field, config)
+
+    np.testing.assert_array_equal(np.load(tmp_path / "Test_2D_final.npy"), psi)
+    image = np.asarray(Image.open(os.path.join(tmp_path, "Test_2D_final.png")))[..., 0]
+    assert image[1, 2] == 254 and image[3, 0] == 127 and image[0, 0] == 0
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Cold `import zenoengine.main` measures ~50 ms; the budget leaves room for slow CI hosts
+BUDGET_SECONDS = 0.5
+HEAVY = ("numba", "numpy", "PIL", "imageio", "pyvista", "pandas", "matplotlib")
+
+
+def _import_times(module: str) -> dict[str, float]:
+    """
+    Run `python -X importtime -c "import <module>"` in a fresh interpreter
+    and return cumulative import seconds per module.
+    """
+    env = dict(os.environ, PYTHONPATH=SRC)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def test_cli_entry_point_imports_no_heavy_dependencies():
+    times = _import_times("zenoengine.main")
+
+    assert not [name for name in HEAVY if name in times]
+    assert times["zenoengine.main"] < BUDGET_SECONDS
+
+
+@pytest.mark.parametrize("module", ["zenoengine.engine.pgns_sim", "zenoengine.io.export"])
+def test_engine_defers_optional_sinks(module):
+    times = _import_times(module)
+
+    assert not [name for name in ("PIL", "imageio", "pyvista", "pandas") if name in times]
@@ -0,0 +1,21 @@
+import warnings
+import numpy as np
+from zenoengine.vis.renderer import grayscale
+
+
+def test_grayscale_shows_complex_fields_by_magnitude():
+    psi = np.array([[3j, -4.0], [0.0, 1 + 1j]])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # no ComplexWarning from a dropped imaginary part
+        gray = grayscale(psi)
+
+    expected = np.uint8(255 * np.abs(psi) / (4.0 + 1e-8))
+    np.testing.assert_array_equal(gray, expected)
+    assert gray[0, 1] == 254 and gray[1, 0] == 0
+
+
+def test_grayscale_keeps_signed_range_of_real_fields():
+    gray = grayscale(np.array([-1.0, 0.0, 1.0]))
+
+    assert gray[0] == 0 and gray[1] == 127 and gray[2] == 254
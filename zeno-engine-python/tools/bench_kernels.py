@@ -0,0 +1,702 @@
+from __future__ import annotations
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+from numba import njit
+
+from zenoengine.core.integrators import Integrator
+from zenoengine.core.operators.curvature import _P_TABLE, curvature_operator
+from zenoengine.core.operators.torsion import torsion_operator
+from zenoengine.core.operators import curvature, torsion
+from zenoengine.core.operators.fused import fused_pgns_operator, metric_partials, reduce_partials
+from zenoengine.core.operators.batched import batched_pgns_operator, member_partials
+from zenoengine.core.operators.bricks import brick_pgns_operator
+from zenoengine.core.operators.incremental import IncrementalPGNS
+from zenoengine.core.operators.soa import soa_pgns_operator
+from zenoengine.core.operators.temporal import DEFAULT_TEMPORAL_TILE, advance_pgns_blocked
+from zenoengine.engine.decomposition import SlabDecomposition
+from zenoengine.engine.scheduler import CoreScheduler
+from zenoengine.engine.sweep import run_point
+from zenoengine.engine.warmup import uncached_copy, warmup
+from zenoengine.fields.amr import AMRField
+from zenoengine.fields.bricks import BrickGrid
+from zenoengine.fields.field import _axpy_3d, _axpy_flat
+from zenoengine.fields.halo import refresh_halo
+from zenoengine.fields.symmetry import Symmetry
+
+
+# --- Baseline: the per-cell neighbour-list kernels being replaced -------------
+
+@njit
+def _list_curvature_2d(values, result):
+    p_table = _P_TABLE
+    nx, ny = values.shape
+    for i in range(nx):
+        for j in range(ny):
+            c = min(int(abs(values[i, j]) * 50), 499)
+            neighbors = [
+                values[(i - 1) % nx, j],
+                values[(i + 1) % nx, j],
+                values[i, (j - 1) % ny],
+                values[i, (j + 1) % ny],
+            ]
+            total = 0.0
+            for n in neighbors:
+                total += p_table[c] - p_table[min(int(abs(n) * 50), 499)]
+            result[i, j] = total
+
+
+@njit
+def _list_curvature_3d(values, result):
+    p_table = _P_TABLE
+    nx, ny, nz = values.shape
+    for i in range(nx):
+        for j in range(ny):
+            for k in range(nz):
+                c = min(int(abs(values[i, j, k]) * 50), 499)
+                neighbors = [
+                    values[(i - 1) % nx, j, k],
+                    values[(i + 1) % nx, j, k],
+                    values[i, (j - 1) % ny, k],
+                    values[i, (j + 1) % ny, k],
+                    values[i, j, (k - 1) % nz],
+                    values[i, j, (k + 1) % nz],
+                ]
+                total = 0.0
+                for n in neighbors:
+                    total += p_table[c] - p_table[min(int(abs(n) * 50), 499)]
+                result[i, j, k] = total
+
+
+@njit
+def _modulo_curvature_1d(values, result):
+    # 1D never used a list; its baseline is the unpeeled modulo loop
+    p_table = _P_TABLE
+    nx = values.shape[0]
+    for i in range(nx):
+        c = min(int(abs(values[i]) * 50), 499)
+        l = min(int(abs(values[(i - 1) % nx]) * 50), 499)
+        r = min(int(abs(values[(i + 1) % nx]) * 50), 499)
+        result[i] = 2 * p_table[c] - p_table[l] - p_table[r]
+
+
+BASELINES = {1: _modulo_curvature_1d, 2: _list_curvature_2d, 3: _list_curvature_3d}
+_NRT_ALLOC = re.compile(r"call [^\n]*@\"?NRT_MemInfo_(alloc|new)")
+DEFAULT_SHAPES = {1: (1 << 20,), 2: (1024, 1024), 3: (96, 96, 96)}
+
+
+def cells_per_second(fn, values: np.ndarray, out: np.ndarray, repeats: int) -> float:
+    fn(values, out)  # compile / warm caches
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(values, out)
+        best = min(best, time.perf_counter() - start)
+    return values.size / best
+
+
+def kernel_report(kernel) -> dict:
+    """
+    Inspect a compiled kernel's LLVM IR and assembly for the two properties
+    this rewrite targets: no NRT heap allocation and a vectorized loop body.
+    """
+    kernel = uncached_copy(kernel)
+    ir = "\n".join(kernel.inspect_llvm().values())
+    asm = "\n".join(kernel.inspect_asm().values())
+    widths = sorted({int(w) for w in re.findall(r"<(\d+) x double>", ir)})
+    return {
+        "allocates": bool(_NRT_ALLOC.search(ir)),
+        "vector_widths": widths,
+        "ymm": "%ymm" in asm,
+        "gather": "vgather" in asm,
+    }
+
+
+def bench_tiled(sizes: list[int], tiles: list[tuple[int, int, int]], repeats: int) -> None:
+    """
+    Fused 3D PGNS step time: row sweep (prange over i) vs cache-blocked tiles.
+    """
+    rng = np.random.default_rng(0)
+    for n in sizes:
+        psi = rng.uniform(-2.0, 2.0, size=(n, n, n))
+        out = np.empty(psi.shape, dtype=np.complex128)
+
+        def run(tile):
+            return lambda v, o: fused_pgns_operator(v, 3, out=o, tile=tile)
+
+        base = cells_per_second(run(None), psi, out, repeats)
+        line = f"[Bench] {n}^3 rows {psi.size / base * 1e3:8.1f} ms"
+        for tile in tiles:
+            rate = cells_per_second(run(tile), psi, out, repeats)
+            line += f" | {tile}: {psi.size / rate * 1e3:8.1f} ms (x{rate / base:.2f})"
+        print(line, flush=True)
+
+
+def bench_temporal(n: int, blocks: list[int], tile: tuple[int, int, int], repeats: int) -> None:
+    """
+    Complex 3D PGNS: ms/step stepping one at a time vs k steps per sweep.
+    Also prints the modelled DRAM bytes per cell-step for each path.
+    """
+    rng = np.random.default_rng(0)
+    psi = 0.02 * (rng.normal(size=(n, n, n)) + 1j * rng.normal(size=(n, n, n)))
+    delta = np.empty_like(psi)
+    nxt = np.empty_like(psi)
+    dt = 1e-5
+
+    def stepwise(v, o):
+        fused_pgns_operator(v, 3, out=delta)
+        o[...] = v + delta * dt
+
+    step_rate = cells_per_second(stepwise, psi, nxt, repeats)
+    # read ψ, write Δ, read Δ, read + write ψ: 5 complex passes per step
+    print(f"[Bench] {n}^3 stepwise {psi.size / step_rate * 1e3:8.1f} ms/step | ~{5 * 16} B/cell-step")
+    for k in blocks:
+        rate = cells_per_second(
+            lambda v, o: advance_pgns_blocked(v, k, dt, tile=tile, out=o), psi, nxt, repeats
+        ) * k
+        halo = np.prod([(t + 2 * k) / t for t in tile])
+        print(
+            f"[Bench]   k={k}: {psi.size / rate * 1e3:8.1f} ms/step (x{rate / step_rate:.2f}) | "
+            f"~{16 * (halo + 1) / k:.0f} B/cell-step, {halo:.2f}x stencil work"
+        )
+
+
+def bench_weak_scaling(rows_per_worker: int, cross: tuple[int, ...], workers: list[int], steps: int, numa: bool) -> None:
+    """
+    Weak scaling of SlabDecomposition: each worker owns `rows_per_worker`
+    rows, so ideal scaling keeps ms/step flat as workers are added.
+    """
+    rng = np.random.default_rng(0)
+    base = None
+    for p in workers:
+        shape = (rows_per_worker * p,) + cross
+        psi = 0.02 * (rng.normal(size=shape) + 1j * rng.normal(size=shape))
+        with SlabDecomposition(psi, p, dt=1e-5, numa=numa) as dec:
+            dec.advance(1)  # first-touch and warm caches
+            start = time.perf_counter()
+            dec.advance(steps)
+            elapsed = (time.perf_counter() - start) / steps
+            wait = max(t.wait for t in dec.timings) / (steps + 1)
+        base = base or elapsed
+        print(
+            f"[Bench] workers={p:3d} grid={shape}: {elapsed * 1e3:8.1f} ms/step | "
+            f"efficiency {base / elapsed:5.2f} | max halo wait {wait * 1e3:.1f} ms/step",
+            flush=True,
+        )
+
+
+def bench_ensemble(members: int, sizes: list[int], repeats: int) -> None:
+    """
+    One batched launch per step vs. one fused launch per member (the cost of
+    running each realization as its own simulation), both with metrics.
+    """
+    rng = np.random.default_rng(0)
+    for n in sizes:
+        psi = 0.02 * (rng.normal(size=(members, n, n)) + 1j * rng.normal(size=(members, n, n)))
+        out = np.empty_like(psi)
+        partials = member_partials(psi)
+        single = [metric_partials(psi[b]) for b in range(members)]
+
+        def separate(v, o):
+            for b in range(members):
+                fused_pgns_operator(v[b], 2, out=o[b], partials=single[b])
+
+        def batched(v, o):
+            batched_pgns_operator(v, 2, out=o, partials=partials)
+
+        before = cells_per_second(separate, psi, out, repeats)
+        after = cells_per_second(batched, psi, out, repeats)
+        print(
+            f"[Bench] ensemble {members} x {n}^2: per-member {before / 1e6:8.1f} Mcells/s -> "
+            f"batched {after / 1e6:8.1f} Mcells/s ({after / before:4.2f}x)"
+        )
+
+
+def bench_precision(shapes: list[tuple[int, ...]], steps: int) -> None:
+    """
+    fp32 vs. fp64 complex fields stepped with the fused kernel: bytes per
+    field, step throughput, and fp32's deviation from the fp64 run (field
+    values and float64-reduced energies after `steps` steps).
+    """
+    rng = np.random.default_rng(0)
+    for shape in shapes:
+        dim = len(shape)
+        start = 0.02 * (rng.normal(size=shape) + 1j * rng.normal(size=shape))
+        runs = {}
+        for dtype in (np.complex128, np.complex64):
+            psi = start.astype(dtype)
+            delta = np.empty_like(psi)
+            partials = metric_partials(psi)
+            fused_pgns_operator(psi.copy(), dim, out=delta, partials=partials)
+            t0 = time.perf_counter()
+            for _ in range(steps):
+                fused_pgns_operator(psi, dim, out=delta, partials=partials)
+                _axpy_flat(psi.reshape(-1), delta.reshape(-1), 1e-5)
+            rate = psi.size * steps / (time.perf_counter() - t0)
+            runs[dtype] = (psi, rate, np.array(reduce_partials(partials)))
+
+        psi64, rate64, energy64 = runs[np.complex128]
+        psi32, rate32, energy32 = runs[np.complex64]
+        field_err = np.abs(psi32 - psi64).max() / np.abs(psi64).max()
+        energy_err = np.abs(energy32 - energy64).max() / np.abs(energy64).max()
+        label = "x".join(map(str, shape))
+        print(
+            f"[Bench] precision {label}: fp64 {psi64.nbytes / 2**20:6.1f} MiB {rate64 / 1e6:7.1f} Mcells/s -> "
+            f"fp32 {psi32.nbytes / 2**20:6.1f} MiB {rate32 / 1e6:7.1f} Mcells/s ({rate32 / rate64:4.2f}x); "
+            f"vs fp64 after {steps} steps: field {field_err:.1e}, energies {energy_err:.1e}"
+        )
+
+
+def bench_layout(shapes: list[tuple[int, ...]], repeats: int) -> None:
+    """
+    One PGNS step (operator + ψ update, with metrics) on an interleaved
+    complex field vs. the same field as separate real/imaginary planes.
+    """
+    rng = np.random.default_rng(0)
+    for shape in shapes:
+        dim = len(shape)
+        psi = 0.02 * (rng.normal(size=shape) + 1j * rng.normal(size=shape))
+        re, im = np.ascontiguousarray(psi.real), np.ascontiguousarray(psi.imag)
+        delta = np.empty_like(psi)
+        planes = np.empty((2,) + shape)
+        partials = metric_partials(psi)
+
+        def aos(v, o):
+            fused_pgns_operator(v, dim, out=o, partials=partials)
+            _axpy_flat(v.reshape(-1), o.reshape(-1), 0.0)
+
+        def soa(v, o):
+            soa_pgns_operator(re, im, dim, out=o, partials=partials)
+            _axpy_flat(re.reshape(-1), o[0].reshape(-1), 0.0)
+            _axpy_flat(im.reshape(-1), o[1].reshape(-1), 0.0)
+
+        before = cells_per_second(aos, psi, delta, repeats)
+        after = cells_per_second(soa, psi, planes, repeats)
+        label = "x".join(map(str, shape))
+        print(
+            f"[Bench] layout {label}: AoS complex {before / 1e6:8.1f} Mcells/s -> "
+            f"SoA planes {after / 1e6:8.1f} Mcells/s ({after / before:4.2f}x)"
+        )
+
+
+def bench_incremental(shapes: list[tuple[int, ...]], steps: int) -> None:
+    """
+    Fused vs. incremental PGNS steps on a quiescent field with one active
+    blob (1/8 of each axis): throughput, the mean fraction of cells whose
+    ℛ/𝒯 was recomputed, and the largest Δ difference between the two runs.
+    """
+    rng = np.random.default_rng(0)
+    for shape in shapes:
+        dim = len(shape)
+        start = np.full(shape, 0.1 + 0.0j)
+        blob = tuple(slice(n // 2 - n // 16, n // 2 + n // 16) for n in shape)
+        start[blob] += 0.02 * (rng.normal(size=start[blob].shape) + 1j * rng.normal(size=start[blob].shape))
+        incremental = IncrementalPGNS(shape, start.dtype)
+        partials = metric_partials(start)
+
+        def fused(v, o):
+            return fused_pgns_operator(v, dim, out=o, partials=partials)
+
+        def incr(v, o):
+            return incremental(v, out=o, partials=partials)
+
+        rates, deltas = {}, {}
+        for name, op in (("fused", fused), ("incremental", incr)):
+            psi = start.copy()
+            delta = np.empty_like(psi)
+            op(psi.copy(), delta)  # compile, and seed the incremental cache with step 0's indices
+            incremental.stats = type(incremental.stats)()
+            t0 = time.perf_counter()
+            for _ in range(steps):
+                op(psi, delta)
+                _axpy_flat(psi.reshape(-1), delta.reshape(-1), 1e-5)
+            rates[name] = psi.size * steps / (time.perf_counter() - t0)
+            deltas[name] = delta
+
+        label = "x".join(map(str, shape))
+        error = np.abs(deltas["incremental"] - deltas["fused"]).max()
+        print(
+            f"[Bench] incremental {label}: fused {rates['fused'] / 1e6:7.1f} Mcells/s -> "
+            f"incremental {rates['incremental'] / 1e6:7.1f} Mcells/s ({rates['incremental'] / rates['fused']:4.2f}x); "
+            f"ℛ/𝒯 recomputed on {incremental.stats.mean_active:.1%} of cells, max |ΔΔ| {error:.1e}"
+        )
+
+
+def bench_bricks(sizes: list[int], brick: int, threshold: float, steps: int) -> None:
+    """
+    Pulse_3D stepped densely (fused kernel) vs. block-sparse (active-set
+    update + brick kernel): memory for field and Δ, throughput in grid
+    cells per second, and the largest deviation between the two runs.
+    Sizes whose dense field and Δ would not fit in half of RAM run sparse only.
+    """
+    from zenoengine.scenes.registry import pulse_3d_sample
+
+    ram = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    dt = 1e-8  # the pulse peaks at |ψ| = 1, where the partition table is steep
+    for n in sizes:
+        axes = np.linspace(-1, 1, n)
+
+        def slab(i0, i1):
+            return pulse_3d_sample(*np.meshgrid(axes[i0:i1], axes, axes, indexing="ij", sparse=True))
+
+        t0 = time.perf_counter()
+        grid = BrickGrid.from_slabs((n, n, n), brick, np.complex128, slab, threshold)
+        build = time.perf_counter() - t0
+        delta = np.empty_like(grid.pool)
+        partials = np.zeros((grid.capacity, 4))
+
+        def sparse_step():
+            nonlocal delta, partials
+            grid.update()
+            if delta.shape != grid.pool.shape:
+                delta = np.empty_like(grid.pool)
+                partials = np.zeros((grid.capacity, 4))
+            brick_pgns_operator(grid.pool, grid.index, grid.coords, grid.count, out=delta, partials=partials)
+            _axpy_flat(grid.active.reshape(-1), delta[:grid.count].reshape(-1), dt)
+
+        sparse_step()
+        t0 = time.perf_counter()
+        for _ in range(steps):
+            sparse_step()
+        sparse_rate = n**3 * steps / (time.perf_counter() - t0)
+        sparse_mib = (grid.nbytes + delta.nbytes) / 2**20
+        dense_mib = 2 * 16 * n**3 / 2**20
+        line = (
+            f"[Bench] bricks {n}^3 (brick {brick}, threshold {threshold:g}): "
+            f"{grid.count}/{grid.index.size} bricks active ({grid.active_fraction:.1%}, built in {build:.1f}s), "
+            f"field+Δ {sparse_mib:.0f} MiB vs {dense_mib:.0f} MiB dense; sparse {sparse_rate / 1e6:.1f} Mcells/s"
+        )
+        if dense_mib * 2**20 > ram / 2:
+            print(line + "; dense run skipped (does not fit)")
+            continue
+
+        # Same start as the sparse run: the pulse with its sub-threshold bricks dropped
+        psi = BrickGrid.from_slabs((n, n, n), brick, np.complex128, slab, threshold).to_dense()
+        out = np.empty_like(psi)
+        dense_partials = metric_partials(psi)
+
+        def dense_step():
+            fused_pgns_operator(psi, 3, out=out, partials=dense_partials)
+            _axpy_flat(psi.reshape(-1), out.reshape(-1), dt)
+
+        dense_step()
+        t0 = time.perf_counter()
+        for _ in range(steps):
+            dense_step()
+        dense_rate = n**3 * steps / (time.perf_counter() - t0)
+        error = np.abs(grid.to_dense() - psi).max()
+        print(
+            line + f" vs dense {dense_rate / 1e6:.1f} Mcells/s ({sparse_rate / dense_rate:4.2f}x); "
+            f"max |ψ_sparse - ψ_dense| {error:.1e}"
+        )
+
+
+def bench_amr(n: int, levels: int, patch: int, steps: int) -> None:
+    """
+    A two-phase 2D field (|ψ| 0.1 over 0.04, wavy interface) stepped on an
+    AMR hierarchy vs. the uniform grid at its finest resolution: cells
+    updated per step, wall time, and the largest deviation of the composite
+    from the uniform run.
+    """
+    x = np.arange(n)
+    interface = n // 2 + (n // 16) * np.sin(2 * np.pi * x / n)
+    start = np.where(x[None, :] < interface[:, None], 0.1, 0.04) + 0j
+    dt = 1e-5
+
+    amr = AMRField(start, levels=levels, patch=patch, threshold=2, interval=10)
+    amr.step(dt)  # compile
+    amr = AMRField(start, levels=levels, patch=patch, threshold=2, interval=10)
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        amr.step(dt)
+    amr_time = time.perf_counter() - t0
+
+    r = 2 ** (amr.depth - 1)
+    psi = start.repeat(r, axis=0).repeat(r, axis=1)
+    delta = np.empty_like(psi)
+    partials = metric_partials(psi)
+    fused_pgns_operator(psi.copy(), 2, out=delta, partials=partials)
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        fused_pgns_operator(psi, 2, out=delta, partials=partials)
+        _axpy_flat(psi.reshape(-1), delta.reshape(-1), dt)
+    uniform_time = time.perf_counter() - t0
+
+    patches = ", ".join(f"L{level} {p.count} ({p.coverage:.0%})" for level, p in enumerate(amr.levels))
+    error = np.abs(amr.composite() - psi).max()
+    print(
+        f"[Bench] amr {n}^2 x{r} (patch {patch}; {patches}): {amr.cells()} cells/step vs {psi.size} uniform; "
+        f"{amr_time / steps * 1e3:.1f} ms vs {uniform_time / steps * 1e3:.1f} ms per step "
+        f"({uniform_time / amr_time:4.2f}x); max |ψ_amr - ψ_uniform| {error:.1e}"
+    )
+
+
+def bench_symmetry(sizes: list[int], steps: int) -> None:
+    """
+    Pulse_3D (λ = 0) on the full periodic box vs. its mirror-reduced octant
+    (reflecting halo, plus the image-by-image torsion sum): memory for field
+    and Δ, time per step, and the largest deviation of the rebuilt box.
+    """
+    from zenoengine.scenes.registry import pulse_3d_sample
+
+    symmetry = Symmetry(mirror=(0, 1, 2))
+    dt = 1e-8
+    for n in sizes:
+        axes = np.linspace(-1, 1, n)
+        octant = np.zeros((n // 2 + 2,) * 3, dtype=np.complex128)
+        values = octant[1:-1, 1:-1, 1:-1]
+        values[...] = pulse_3d_sample(*np.meshgrid(*[axes[n // 2:]] * 3, indexing="ij", sparse=True))
+        box = symmetry.expand(values, (n,) * 3)
+        boundary = symmetry.boundary(3)
+
+        delta = np.empty(values.shape, dtype=np.complex128)
+        partials = metric_partials(values)
+
+        def reduced_step():
+            refresh_halo(octant, 1, boundary)
+            fused_pgns_operator(octant, 3, halo=1, lambda_=0.0, out=delta, partials=partials)
+            symmetry.torsion_energy(octant, 1)
+            _axpy_3d(values, delta, dt)
+
+        out = np.empty_like(box)
+        box_partials = metric_partials(box)
+
+        def full_step():
+            fused_pgns_operator(box, 3, lambda_=0.0, out=out, partials=box_partials)
+            _axpy_flat(box.reshape(-1), out.reshape(-1), dt)
+
+        rates = {}
+        for name, step in (("full", full_step), ("octant", reduced_step)):
+            step()
+            t0 = time.perf_counter()
+            for _ in range(steps):
+                step()
+            rates[name] = (time.perf_counter() - t0) / steps
+
+        error = np.abs(symmetry.expand(values, box.shape) - box).max()
+        print(
+            f"[Bench] symmetry {n}^3: field+Δ {octant.nbytes * 2 / 2**20:.1f} MiB vs {box.nbytes * 2 / 2**20:.1f} MiB; "
+            f"octant {rates['octant'] * 1e3:.1f} ms vs full {rates['full'] * 1e3:.1f} ms per step "
+            f"({rates['full'] / rates['octant']:4.2f}x); max |ψ_octant - ψ_full| {error:.1e}"
+        )
+
+
+def bench_integrators(n: int, end_time: float) -> None:
+    """
+    Time integrators taking a noisy 2D field (|ψ| ≈ 0.1) to `end_time`:
+    Δ𝒜 evaluations, wall time, and the largest deviation from an rk4
+    reference at Δt = 5e-7.
+    """
+    rng = np.random.default_rng(0)
+    start = 0.1 + 0.02 * (rng.normal(size=(n, n)) + 1j * rng.normal(size=(n, n)))
+
+    def run(method, dt, **tolerances):
+        psi = start.copy()
+        integrator = Integrator(method, psi.shape, psi.dtype, dt=dt, **tolerances)
+
+        def rhs(out, observe):
+            return fused_pgns_operator(psi, 2, out=out)
+
+        t = 0.0
+        t0 = time.perf_counter()
+        while t < end_time * (1 - 1e-12):
+            t += integrator.step(psi, rhs, min(integrator.dt, end_time - t))
+        return psi, integrator.stats, time.perf_counter() - t0
+
+    run("rk23", 1e-5)  # compile
+    reference, _, _ = run("rk4", 5e-7)
+    cases = [
+        ("euler", 1e-5, {}), ("euler", 1e-6, {}), ("rk2", 2e-5, {}), ("rk4", 2e-5, {}),
+        ("rk23", 1e-5, dict(rtol=1e-3, atol=1e-5)), ("rk23", 1e-5, dict(rtol=1e-4, atol=1e-6)),
+    ]
+    for method, dt, tolerances in cases:
+        psi, stats, seconds = run(method, dt, **tolerances)
+        setting = f"rtol {tolerances['rtol']:g}" if tolerances else f"dt {dt:g}"
+        print(
+            f"[Bench] integrator {method:5s} {setting:10s} to t = {end_time:g} on {n}^2: "
+            f"{stats.evaluations:5d} evaluations ({stats.accepted} accepted, {stats.rejected} rejected), "
+            f"{seconds:6.2f}s, max |ψ - ψ_ref| {np.abs(psi - reference).max():.1e}"
+        )
+
+
+def bench_concurrent(jobs: int, n: int, steps: int) -> None:
+    """
+    `jobs` simultaneous 2D runs: one bare thread each, every one launching
+    prange over all cores (the old /simulate behaviour), vs. the core-budget
+    scheduler granting each job the whole machine in turn.
+    """
+    point = {"scene": "RTI_2D", "grid_size": n}
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=run_point, args=(point, steps, 1e-4)) for _ in range(jobs)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    before = jobs / (time.perf_counter() - start)
+
+    scheduler = CoreScheduler()
+    start = time.perf_counter()
+    for _ in range(jobs):
+        scheduler.submit(run_point, point, steps, 1e-4)
+    scheduler.wait_all()
+    after = jobs / (time.perf_counter() - start)
+    print(
+        f"[Bench] {jobs} concurrent {n}^2 x {steps} steps on {scheduler.cores} cores: "
+        f"free-for-all {before:6.2f} jobs/s -> scheduled {after:6.2f} jobs/s ({after / before:4.2f}x)"
+    )
+
+
+_STARTUP_PROBE = (
+    "import sys, time; t = time.perf_counter(); "
+    "from zenoengine.engine.warmup import warmup; i = time.perf_counter() - t; "
+    "r = warmup([int(d) for d in sys.argv[1:]]); print(i, r.seconds, r.loaded, r.compiled)"
+)
+
+
+def bench_startup(dims: list[int]) -> None:
+    """
+    Process start-to-ready time in fresh interpreters: once against an empty
+    kernel cache (first run after install) and once against the cache that
+    run populated (every later CLI call or API worker).
+    """
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = {**os.environ, "NUMBA_CACHE_DIR": cache_dir}
+        for label in ("cold cache", "warm cache"):
+            start = time.perf_counter()
+            out = subprocess.run(
+                [sys.executable, "-c", _STARTUP_PROBE, *map(str, dims)],
+                env=env, check=True, capture_output=True, text=True
+            ).stdout.split()
+            total = time.perf_counter() - start
+            imports, compile_s, loaded, compiled = float(out[0]), float(out[1]), int(out[2]), int(out[3])
+            print(
+                f"[Bench] startup ({label}): {total:6.2f}s total | imports {imports:5.2f}s | "
+                f"kernels {compile_s:6.2f}s ({loaded} loaded, {compiled} compiled)"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Curvature kernel microbenchmark (cells/s)")
+    parser.add_argument("--dims", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--inspect", action="store_true", help="Report allocation/vectorization from LLVM IR and asm")
+    parser.add_argument("--tiled", type=int, nargs="*", metavar="N",
+                        help="Benchmark the fused 3D kernel at N^3 against tile shapes instead")
+    parser.add_argument("--tile", type=int, nargs=3, action="append", metavar=("TI", "TJ", "TK"),
+                        help="Tile shape for --tiled (repeatable; default 8x8xN and 16x16x128)")
+    parser.add_argument("--temporal", type=int, metavar="N",
+                        help="Benchmark temporal blocking (k = 2, 4, 8) on a complex N^3 field instead")
+    parser.add_argument("--weak-scaling", type=int, nargs="+", metavar="P",
+                        help="Weak-scaling run of the shared-memory slab backend for these worker counts")
+    parser.add_argument("--numa", action="store_true", help="Pin --weak-scaling workers to NUMA nodes")
+    parser.add_argument("--startup", action="store_true",
+                        help="Time fresh-process startup with a cold and a warm kernel cache")
+    parser.add_argument("--layout", action="store_true",
+                        help="Interleaved complex (AoS) vs. real/imaginary planes (SoA) PGNS steps")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Fused vs. change-mask incremental PGNS steps on a field with one active blob")
+    parser.add_argument("--bricks", type=int, nargs="+", metavar="N",
+                        help="Dense vs. block-sparse Pulse_3D steps at N^3 (dense skipped when it does not fit)")
+    parser.add_argument("--brick", type=int, default=8, help="Brick edge for --bricks")
+    parser.add_argument("--threshold", type=float, default=1e-6, help="Brick allocation threshold for --bricks")
+    parser.add_argument("--integrators", type=int, metavar="N",
+                        help="Euler / RK2 / RK4 / adaptive RK23 on an N^2 field to a fixed end time")
+    parser.add_argument("--symmetry", type=int, nargs="+", metavar="N",
+                        help="Pulse_3D on the full N^3 box vs. its mirror-reduced octant (lambda_ = 0)")
+    parser.add_argument("--amr", type=int, metavar="N",
+                        help="2D AMR hierarchy on an N^2 base grid vs. the uniform finest grid")
+    parser.add_argument("--levels", type=int, default=3, help="Refinement levels for --amr")
+    parser.add_argument("--patch", type=int, default=16, help="Patch edge for --amr")
+    parser.add_argument("--precision", action="store_true",
+                        help="fp32 vs. fp64 fields: memory, throughput and accuracy against fp64")
+    parser.add_argument("--concurrent", type=int, metavar="J",
+                        help="Throughput of J simultaneous runs, unscheduled vs. core-budget scheduler")
+    parser.add_argument("--ensemble", type=int, metavar="B",
+                        help="Batched vs. per-member stepping of B complex 2D fields (64^2 and 128^2)")
+    args = parser.parse_args()
+
+    if args.startup:
+        bench_startup(args.dims)
+        return
+
+    # Compile (or load) every kernel up front so no timing below includes JIT
+    print(f"[Bench] Kernel warmup: {warmup(args.dims)}")
+
+    if args.precision or args.layout or args.incremental:
+        shapes = {1: (1 << 18,), 2: (512, 512), 3: (96, 96, 96)}
+        if args.precision:
+            bench_precision([shapes[d] for d in args.dims], 20)
+        if args.layout:
+            bench_layout([shapes[d] for d in args.dims], args.repeats)
+        if args.incremental:
+            bench_incremental([shapes[d] for d in args.dims], 20)
+        return
+
+    if args.bricks:
+        bench_bricks(args.bricks, args.brick, args.threshold, args.repeats)
+        return
+
+    if args.integrators:
+        bench_integrators(args.integrators, 1e-3)
+        return
+
+    if args.symmetry:
+        bench_symmetry(args.symmetry, args.repeats)
+        return
+
+    if args.amr:
+        bench_amr(args.amr, args.levels, args.patch, max(args.repeats, 20))
+        return
+
+    if args.concurrent:
+        bench_concurrent(args.concurrent, 256, 50)
+        return
+
+    if args.ensemble:
+        bench_ensemble(args.ensemble, [64, 128], args.repeats)
+        return
+
+    if args.weak_scaling:
+        bench_weak_scaling(64, (128, 128), args.weak_scaling, args.repeats, args.numa)
+        return
+
+    if args.temporal:
+        tile = tuple(args.tile[0]) if args.tile else DEFAULT_TEMPORAL_TILE
+        bench_temporal(args.temporal, [2, 4, 8], tile, args.repeats)
+        return
+
+    if args.tiled is not None:
+        sizes = args.tiled or [64, 128, 256, 512]
+        tiles = [tuple(t) for t in args.tile] if args.tile else [(8, 8, max(sizes)), (16, 16, 128)]
+        bench_tiled(sizes, tiles, args.repeats)
+        return
+
+    rng = np.random.default_rng(0)
+    for dim in args.dims:
+        values = rng.uniform(-10.0, 10.0, size=DEFAULT_SHAPES[dim])
+        out = np.empty_like(values)
+
+        before = cells_per_second(BASELINES[dim], values, out, args.repeats)
+        after = cells_per_second(lambda v, o: curvature_operator(v, dim, out=o), values, out, args.repeats)
+        print(
+            f"[Bench] {dim}D {values.shape}: before {before / 1e6:8.1f} Mcells/s | "
+            f"after {after / 1e6:8.1f} Mcells/s | x{after / before:.2f}"
+        )
+
+        if args.inspect:
+            torsion_operator(values, dim, out=out)
+            kernels = (BASELINES[dim], getattr(curvature, f"_curvature_{dim}d"), getattr(torsion, f"_torsion_{dim}d"))
+            for kernel in kernels:
+                print(f"[Bench]   {kernel.__name__}: {kernel_report(kernel)}")
+
+
+if __name__ == "__main__":
+    main()
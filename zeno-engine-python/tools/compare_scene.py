@@ -2,9 +2,7 @@ from __future__ import annotations
 import argparse
 import os
 import subprocess
-import pandas as pd
 import numpy as np
-from PIL import Image, ImageDraw
 
 
 def run_sim(mode: str, scene: str, steps: int, grid: int, silent: bool = False) -> str:
@@ -31,6 +29,9 @@ def run_sim(mode: str, scene: str, steps: int, grid: int, silent: bool = False)
 
 
 def plot_metrics_comparison(path1: str, path2: str, tag1: str, tag2: str, out_path: str) -> None:
+    import pandas as pd
+    from PIL import Image, ImageDraw
+
     df1 = pd.read_csv(path1)
     df2 = pd.read_csv(path2)
 
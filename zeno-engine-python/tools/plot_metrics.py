@@ -1,7 +1,8 @@
-import pandas as pd
 import argparse
 
 def print_metrics(csv_path: str) -> None:
+    import pandas as pd
+
     df = pd.read_csv(csv_path)
     print(f"\n📊 Metrics Summary from: {csv_path}")
     print(df.describe(include='all'))
@@ -0,0 +1,56 @@
+from __future__ import annotations
+import argparse
+
+from zenoengine.engine.sweep import DESIGNS, DEFAULT_POINT, run_sweep
+
+
+def build_space(args: argparse.Namespace) -> dict:
+    # With random/LHS designs, two values for a coefficient mean a (low, high) range
+    space = {}
+    for name in ("lambda_", "kappa", "beta"):
+        values = getattr(args, name) or [DEFAULT_POINT[name]]
+        if args.design != "grid" and len(values) == 2:
+            space[name] = (values[0], values[1])
+        else:
+            space[name] = values
+    space["scene"] = args.scene
+    space["grid_size"] = args.grid
+    return space
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep PGNS coefficients, scenes and grid sizes")
+    parser.add_argument("--design", choices=sorted(DESIGNS), default="grid")
+    parser.add_argument("--lambda", dest="lambda_", type=float, nargs="+", help="λ values (or low high)")
+    parser.add_argument("--kappa", type=float, nargs="+", help="κ values (or low high)")
+    parser.add_argument("--beta", type=float, nargs="+", help="β values (or low high)")
+    parser.add_argument("--scene", nargs="+", default=[DEFAULT_POINT["scene"]])
+    parser.add_argument("--grid", type=int, nargs="+", default=[DEFAULT_POINT["grid_size"]])
+    parser.add_argument("--samples", type=int, default=32, help="Points for random/lhs designs")
+    parser.add_argument("--seed", type=int, default=0, help="Design and scene noise seed")
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--dt", type=float, default=1e-3)
+    parser.add_argument("--workers", type=int, help="Concurrent worker processes (default: CPU count)")
+    parser.add_argument("--threads", type=int, default=1, help="Numba threads per worker")
+    parser.add_argument("--out", default="outputs/sweep_results.csv")
+    parser.add_argument("--no-resume", action="store_true", help="Re-run points already in --out")
+    parser.add_argument("--config", type=str, help="TOML config the points override (default: the normal run's)")
+    args = parser.parse_args()
+
+    space = build_space(args)
+    if args.design == "grid":
+        points = DESIGNS["grid"](space)
+    else:
+        points = DESIGNS[args.design](space, args.samples, args.seed)
+
+    run_sweep(
+        points,
+        args.out,
+        steps=args.steps,
+        dt=args.dt,
+        seed=args.seed,
+        workers=args.workers,
+        threads_per_worker=args.threads,
+        resume=not args.no_resume,
+        config_path=args.config,
+    )